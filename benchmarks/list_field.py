@@ -0,0 +1,85 @@
+"""
+ListField parsing throughput and memory footprint on large lists.
+
+Usage: python benchmarks/list_field.py [--size 10000] [--repeat 20]
+"""
+import argparse
+import functools
+import os
+import sys
+import timeit
+import typing
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from configorm import ListField  # noqa: E402
+
+
+def legacy_cast(var_type: type, value: str) -> typing.List[typing.Any]:
+    """ListField.cast_value implementation before single-pass tokenizer, kept for comparison"""
+    result: typing.List[typing.Any] = []
+    for element in value.replace('[', '').replace(']', '').split(','):
+        if var_type == int:
+            result.append(int(element.strip()))
+        elif var_type == str:
+            result.append(element.strip().replace("'", ''))
+        elif var_type == float:
+            result.append(float(element.strip()))
+        elif var_type == bool:
+            if element.strip().lower() in ['true', '1']:
+                result.append(True)
+            elif element.strip().lower() in ['false', '0']:
+                result.append(False)
+            else:
+                result.append(bool(element.strip()))
+    return result
+
+
+def samples(size: int) -> typing.Dict[type, str]:
+    """Builds string representations of lists of every supported type"""
+    return {
+        int: str(list(range(size))),
+        float: str([index / 7 for index in range(size)]),
+        bool: str([index % 3 == 0 for index in range(size)]),
+        str: str([f'host-{index}.example.com' for index in range(size)]),
+    }
+
+
+def size_of(value: typing.Any) -> int:
+    """Returns memory taken by container and its elements"""
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(sys.getsizeof(element) for element in value)
+    if isinstance(value, memoryview):
+        return sys.getsizeof(value) + value.nbytes
+    return sys.getsizeof(value)
+
+
+def main() -> None:
+    """Runs benchmark and prints elements per second for every list type"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=10000, help='number of list elements')
+    parser.add_argument('--repeat', type=int, default=20, help='number of parses to measure')
+    args = parser.parse_args()
+
+    print(f'{"type":<6} {"tokenizer, elem/s":>20} {"legacy, elem/s":>20} {"speedup":>8}')
+    for var_type, value in samples(args.size).items():
+        field = ListField(var_type=var_type)
+        current = min(timeit.repeat(functools.partial(field.cast_value, value), number=args.repeat, repeat=3))
+        legacy = min(timeit.repeat(functools.partial(legacy_cast, var_type, value), number=args.repeat, repeat=3))
+        current_rate = args.size * args.repeat / current
+        legacy_rate = args.size * args.repeat / legacy
+        print(f'{var_type.__name__:<6} {current_rate:>20,.0f} {legacy_rate:>20,.0f} {legacy / current:>7.2f}x')
+
+    print()
+    print(f'{"type":<6} {"container":<10} {"elem/s":>14} {"bytes":>10}')
+    for var_type in (int, float):
+        value = samples(args.size)[var_type]
+        for container in ListField.containers:
+            field = ListField(var_type=var_type, container=container)
+            elapsed = min(timeit.repeat(functools.partial(field.cast_value, value), number=args.repeat, repeat=3))
+            print(f'{var_type.__name__:<6} {container:<10} {args.size * args.repeat / elapsed:>14,.0f} '
+                  f'{size_of(field.cast_value(value)):>10,}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+"""
+Benchmark suite for attribute access, casting, writes and integrity checks.
+
+Results are printed as table and may be saved as JSON to compare them across commits:
+
+    python benchmarks/suite.py --output before.json
+    python benchmarks/suite.py --compare before.json --threshold 0.1
+
+Comparison exits with status 1 if any benchmark got slower than threshold fraction.
+
+Usage: python benchmarks/suite.py [-k SUBSTRING] [--output FILE] [--compare FILE] [--threshold 0.1] [--quick]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import typing
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, root_dir)
+sys.path.insert(0, os.path.join(root_dir, 'tests'))
+
+from configorm import (  # noqa: E402
+    DictConnector, IniConnector, IntegerField, ListField, Section, StringField, VaultConnector
+)
+from fake_vault import FakeVault  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+
+class Case(typing.NamedTuple):
+    """Prepared benchmark: run is measured, operations is number of operations made by single run"""
+
+    run: typing.Callable[[], typing.Any]
+    operations: int = 1
+    cleanup: typing.Optional[typing.Callable[[], None]] = None
+
+
+BENCHMARKS: typing.Dict[str, typing.Callable[[str], Case]] = {}
+
+
+def benchmark(name: str) -> typing.Callable:
+    """Registers function that prepares benchmark case in temporary directory"""
+    def register(function: typing.Callable[[str], Case]) -> typing.Callable[[str], Case]:
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def write_ini(path: str, sections: int, keys: int) -> None:
+    """Writes config with given number of sections and keys in every section"""
+    with open(path, 'w') as file:
+        for section in range(sections):
+            file.write(f'[Section{section}]\n')
+            for key in range(keys):
+                file.write(f'key_{key} = value {section} {key}\n')
+            file.write('\n')
+
+
+def make_section(connector: typing.Any, name: str, **fields: typing.Any) -> typing.Any:
+    """Creates section class bound to connector"""
+    base = type(f'{name}Base', (Section,), {'Meta': type('Meta', (), {'connector': connector})})
+    return type(name, (base,), fields)
+
+
+def read_field(section: typing.Any, name: str, operations: int) -> Case:
+    """Case reading field of section operations times per run"""
+    def run() -> None:
+        for _ in range(operations):
+            getattr(section, name)
+    return Case(run=run, operations=operations)
+
+
+@benchmark('ini_get_small')
+def ini_get_small(temp_dir: str) -> Case:
+    """Field access on small ini file"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=5, keys=5)
+    section = make_section(IniConnector(connection_string=path), 'Section2', key_3=StringField())
+    return read_field(section, 'key_3', operations=1000)
+
+
+@benchmark('ini_get_10k')
+def ini_get_10k(temp_dir: str) -> Case:
+    """Field access on ini file with 10k keys"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=100, keys=100)
+    section = make_section(IniConnector(connection_string=path), 'Section50', key_50=StringField())
+    return read_field(section, 'key_50', operations=1000)
+
+
+@benchmark('ini_get_10k_watched')
+def ini_get_10k_watched(temp_dir: str) -> Case:
+    """Field access on watched ini file with 10k keys"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=100, keys=100)
+    connector = IniConnector(connection_string=path, watch=True)
+    section = make_section(connector, 'Section50', key_50=StringField())
+    case = read_field(section, 'key_50', operations=1000)
+    return case._replace(cleanup=connector.close)
+
+
+@benchmark('dict_get')
+def dict_get(temp_dir: str) -> Case:
+    """Field access on in-memory config, baseline without I/O"""
+    connector = DictConnector({'Section2': {'key_3': 'value 2 3'}})
+    section = make_section(connector, 'Section2', key_3=StringField())
+    return read_field(section, 'key_3', operations=1000)
+
+
+@benchmark('ini_parse_10k')
+def ini_parse_10k(temp_dir: str) -> Case:
+    """Parsing of ini file with 10k keys on connector start"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=100, keys=100)
+    return Case(run=lambda: IniConnector(connection_string=path).get_value('Section0', 'key_0'))
+
+
+@benchmark('ini_parse_10k_cached')
+def ini_parse_10k_cached(temp_dir: str) -> Case:
+    """Loading of ini file with 10k keys from parse cache on connector start"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=100, keys=100)
+    return Case(run=lambda: IniConnector(connection_string=path, parse_cache=True).get_value('Section0', 'key_0'))
+
+
+def vault_case(latency: float, operations: int, **kwargs: typing.Any) -> Case:
+    """Case reading field from fake Vault server with injected latency"""
+    vault = FakeVault(latency=latency).start()
+    vault.put('kv', 'DATABASE', {'SERVER': '10.10.10.10', 'PORT': '5432'})
+    connector = VaultConnector(mount_point='kv', url=vault.url, token=vault.token, **kwargs)
+    section = make_section(connector, 'Database', server=StringField())
+    return read_field(section, 'server', operations=operations)._replace(cleanup=vault.stop)
+
+
+@benchmark('vault_get_1ms')
+def vault_get_1ms(temp_dir: str) -> Case:
+    """Field access on Vault with 1 ms latency, every access makes request"""
+    return vault_case(latency=0.001, operations=10)
+
+
+@benchmark('vault_get_1ms_cached')
+def vault_get_1ms_cached(temp_dir: str) -> Case:
+    """Field access on Vault with 1 ms latency and secret cache"""
+    return vault_case(latency=0.001, operations=1000, cache_ttl=3600)
+
+
+@benchmark('list_cast_int_10k')
+def list_cast_int_10k(temp_dir: str) -> Case:
+    """Casting of 10k integers by ListField"""
+    field, value = ListField(var_type=int), str(list(range(10000)))
+    return Case(run=lambda: field.cast_value(value), operations=10000)
+
+
+@benchmark('list_cast_str_10k')
+def list_cast_str_10k(temp_dir: str) -> Case:
+    """Casting of 10k strings by ListField"""
+    field, value = ListField(var_type=str), str([f'host-{index}.example.com' for index in range(10000)])
+    return Case(run=lambda: field.cast_value(value), operations=10000)
+
+
+@benchmark('ini_set')
+def ini_set(temp_dir: str) -> Case:
+    """Field write into small ini file, every write replaces file"""
+    path = os.path.join(temp_dir, 'config.ini')
+    write_ini(path, sections=5, keys=5)
+    section = make_section(IniConnector(connection_string=path), 'Section2', key_3=IntegerField())
+
+    def run() -> None:
+        for value in range(10):
+            section.key_3 = value
+    return Case(run=run, operations=10)
+
+
+@benchmark('check_integrity_1000')
+def check_integrity_1000(temp_dir: str) -> Case:
+    """Creation of config for 1000 sections with 5 fields each"""
+    path = os.path.join(temp_dir, 'config.ini')
+    connector = IniConnector(connection_string=path)
+    base: typing.Any = type('IntegrityBase', (Section,), {'Meta': type('Meta', (), {'connector': connector})})
+    sections = [
+        type(f'Section{index}', (base,), {f'key_{key}': IntegerField(default=key) for key in range(5)})
+        for index in range(1000)
+    ]
+
+    def run() -> None:
+        if os.path.exists(path):
+            os.remove(path)
+        base.check_config_integrity()
+    return Case(run=run, operations=len(sections))
+
+
+def measure(case: Case, min_time: float, repeat: int) -> typing.Dict[str, typing.Any]:
+    """Measures case, calibrating number of runs so that every repeat takes at least min_time"""
+    case.run()
+    number = 1
+    while True:
+        elapsed = timeit.timeit(case.run, number=number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)) + 1)
+
+    timings = [elapsed / number for elapsed in timeit.repeat(case.run, number=number, repeat=repeat)]
+    best, median = min(timings), statistics.median(timings)
+    return {
+        'operations': case.operations,
+        'runs': number * repeat,
+        'min': best / case.operations,
+        'median': median / case.operations,
+        'stdev': statistics.pstdev(timings) / case.operations,
+        'ops_per_second': case.operations / median,
+    }
+
+
+def commit() -> typing.Optional[str]:
+    """Returns current git commit of repository or None if it is unknown"""
+    try:
+        output = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root_dir, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, universal_newlines=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.strip()
+
+
+def run_suite(names: typing.List[str], min_time: float, repeat: int) -> typing.Dict[str, typing.Any]:
+    """Runs benchmarks and returns report"""
+    results = {}
+    for name in names:
+        temp_dir = tempfile.mkdtemp()
+        case = BENCHMARKS[name](temp_dir)
+        try:
+            results[name] = measure(case, min_time=min_time, repeat=repeat)
+        finally:
+            if case.cleanup is not None:
+                case.cleanup()
+            shutil.rmtree(temp_dir)
+        print(f'{name:<24} {results[name]["median"] * 1e6:>12.3f} us/op {results[name]["ops_per_second"]:>14,.0f} op/s')
+
+    return {
+        'schema': SCHEMA_VERSION,
+        'commit': commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+
+
+def compare(report: typing.Dict[str, typing.Any], baseline: typing.Dict[str, typing.Any], threshold: float) -> bool:
+    """Prints change of median time against baseline, returns False if any benchmark regressed"""
+    print()
+    print(f'Compared with {baseline.get("commit") or "baseline"}:')
+    ok = True
+    for name, result in report['results'].items():
+        if name not in baseline['results']:
+            continue
+        ratio = result['median'] / baseline['results'][name]['median']
+        regressed = ratio > 1 + threshold
+        ok = ok and not regressed
+        print(f'{name:<24} {ratio:>8.2f}x time{"  REGRESSION" if regressed else ""}')
+    return ok
+
+
+def main() -> None:
+    """Runs benchmark suite"""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-k', dest='pattern', default='', help='run only benchmarks which names contain substring')
+    parser.add_argument('--output', help='file to save JSON report to')
+    parser.add_argument('--compare', help='JSON report to compare results with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown fraction for comparison')
+    parser.add_argument('--quick', action='store_true', help='shorter measurements for smoke runs')
+    args = parser.parse_args()
+
+    names = [name for name in BENCHMARKS if args.pattern in name]
+    report = run_suite(names, min_time=0.01 if args.quick else 0.2, repeat=3 if args.quick else 5)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        if not compare(report, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,11 @@ __all__ = [
     'FloatField',
     'ListField',
     'IniConnector',
-    'VaultConnector'
+    'DictConnector',
+    'VaultConnector',
+    'AsyncVaultConnector',
+    'ReloadManager',
+    'AccessProfiler'
 ]
 
 from .config_orm import Section
@@ -16,4 +20,12 @@ from .fields import BooleanField
 from .fields import FloatField
 from .fields import ListField
 from .connectors import IniConnector
+from .connectors import DictConnector
 from .connectors import VaultConnector
+from .connectors import AsyncVaultConnector
+from .reload import ReloadManager
+from .profiler import AccessProfiler
+from .profiler import profile_from_environment
+
+# Profiling is opted in with CONFIGORM_PROFILE environment variable, without application code changes
+profile_from_environment()
@@ -0,0 +1,243 @@
+import logging
+import queue
+import random
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(object):
+    """Cached value with its storing time and optional version of source data"""
+
+    __slots__ = ('value', 'stored_at', 'expires_at', 'version')
+
+    def __init__(self,
+                 value: typing.Any,
+                 stored_at: float,
+                 expires_at: float,
+                 version: typing.Optional[typing.Any] = None
+                 ) -> None:
+        self.value = value
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.version = version
+
+    def is_expired(self, now: float) -> bool:
+        """Checks if entry time to live is over"""
+        return self.expires_at <= now
+
+
+class TTLCache(object):
+    """
+    Thread safe cache with per-entry time to live and least recently used eviction. Time to live of every entry is
+    randomly shortened by up to jitter fraction, so entries stored together do not expire at the same moment.
+    """
+
+    def __init__(self,
+                 ttl: float,
+                 max_entries: int = 128,
+                 jitter: float = 0.0,
+                 timer: typing.Callable[[], float] = time.monotonic
+                 ) -> None:
+        if ttl <= 0:
+            raise ValueError('Cache TTL must be positive')
+        if max_entries <= 0:
+            raise ValueError('Cache size must be positive')
+        if not 0 <= jitter < 1:
+            raise ValueError('Cache TTL jitter must be in [0, 1) range')
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.jitter = jitter
+        self.timer = timer
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, max_stale: float = 0.0) -> typing.Optional[CacheEntry]:
+        """
+        Looks up entry
+        :param key: cache key
+        :param max_stale: how many seconds after expiration entry may still be returned
+        :return: entry or None if it is missing or expired more than max_stale seconds ago
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at + max_stale <= self.timer():
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def peek(self, key: str) -> typing.Optional[CacheEntry]:
+        """
+        Looks up entry regardless of its expiration without affecting eviction order and statistics
+        :param key: cache key
+        :return: entry or None if it is missing
+        """
+        with self._lock:
+            return self._entries.get(key)
+
+    def _expiration(self, now: float) -> float:
+        """Returns expiration time for entry stored at given moment"""
+        return now + (self.ttl * (1 - random.uniform(0, self.jitter)) if self.jitter else self.ttl)
+
+    def set(self, key: str, value: typing.Any, version: typing.Optional[typing.Any] = None) -> CacheEntry:
+        """
+        Stores value, evicting least recently used entries if cache is full
+        :param key: cache key
+        :param value: value to store
+        :param version: version of source data
+        :return: stored entry
+        """
+        now = self.timer()
+        entry = CacheEntry(value=value, stored_at=now, expires_at=self._expiration(now), version=version)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def renew(self, key: str) -> None:
+        """
+        Starts time to live of existing entry over, as if its value was stored again
+        :param key: cache key
+        :return: Nothing
+        """
+        now = self.timer()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.stored_at = now
+                entry.expires_at = self._expiration(now)
+
+    def keys(self) -> typing.List[str]:
+        """Returns keys of all entries, expired ones included"""
+        with self._lock:
+            return list(self._entries)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Drops entry from cache
+        :param key: cache key
+        :return: Nothing
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all entries from cache"""
+        with self._lock:
+            self._entries.clear()
+
+
+class _Call(object):
+    """In-flight call shared between concurrent callers"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: typing.Any = None
+        self.error: typing.Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """
+    Suppresses duplicate concurrent calls: while call for a key is in flight, other callers with the same key wait
+    for it and get its result or exception instead of calling function on their own
+    """
+
+    def __init__(self) -> None:
+        self._calls: typing.Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, function: typing.Callable[[], typing.Any]) -> typing.Any:
+        """
+        Calls function unless call with the same key is already in flight
+        :param key: call key
+        :param function: function to call
+        :return: function result
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class BackgroundRefresher(object):
+    """Daemon thread that refreshes cached data by keys scheduled from other threads"""
+
+    def __init__(self,
+                 refresh: typing.Callable[[str], typing.Any],
+                 on_error: typing.Optional[typing.Callable[[str, BaseException], None]] = None
+                 ) -> None:
+        self.refresh = refresh
+        self.on_error = on_error
+
+        self._queue: 'queue.Queue[str]' = queue.Queue()
+        self._pending: typing.Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def schedule(self, key: str) -> None:
+        """
+        Schedules refresh of key unless it is already pending
+        :param key: key to refresh
+        :return: Nothing
+        """
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='configorm-refresher', daemon=True)
+                self._thread.start()
+        self._queue.put(key)
+
+    def join(self) -> None:
+        """Blocks until all scheduled refreshes are done"""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            key = self._queue.get()
+            try:
+                self.refresh(key)
+            except Exception as error:
+                if self.on_error is not None:
+                    self.on_error(key, error)
+                else:
+                    logger.warning('Background refresh of %s failed: %r', key, error)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                self._queue.task_done()
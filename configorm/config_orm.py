@@ -1,3 +1,9 @@
+import contextlib
+import functools
+import inspect
+import operator
+import os
+import time
 import typing
 
 from .fields import Field
@@ -10,15 +16,82 @@ def with_metaclass(meta, base=object):  # type: ignore
     return meta(SECTION_BASE, (base,), {})
 
 
+def _transaction(connector: typing.Any) -> typing.ContextManager:
+    """Returns transaction of connector, connectors without transaction support write every change immediately"""
+    transaction = getattr(connector, 'transaction', None)
+    context = transaction() if callable(transaction) else None
+    if not hasattr(context, '__enter__') or not hasattr(context, '__exit__'):
+        return contextlib.nullcontext()
+    return context
+
+
+class Snapshot(tuple):
+    """
+    Base class of section snapshots: immutable tuple of field values with attribute access by field names.
+    Unlike named tuples, field names may start with underscore.
+    """
+
+    __slots__ = ()
+    _fields: typing.Tuple[str, ...] = ()
+
+    def __new__(cls, **values: typing.Any) -> 'Snapshot':
+        """Creates snapshot of field values passed by field names"""
+        return tuple.__new__(cls, [values[name] for name in cls._fields])
+
+    def __getnewargs_ex__(self) -> typing.Tuple[tuple, typing.Dict[str, typing.Any]]:
+        """Passes field values by names on copying, as constructor accepts keyword arguments only"""
+        return (), self._asdict()
+
+    def __repr__(self) -> str:
+        values = ', '.join(f'{name}={value!r}' for name, value in zip(self._fields, self))
+        return f'{type(self).__name__}({values})'
+
+    def _asdict(self) -> typing.Dict[str, typing.Any]:
+        """Returns field values by their names"""
+        return dict(zip(self._fields, self))
+
+
 class Metadata(object):
     """Field binder metaclass"""
 
-    def __init__(self, section: typing.Any, connector: typing.Optional[typing.Any] = None) -> None:
+    __slots__ = ('section', '_connector', 'fields', 'name', 'env_prefix', 'env', '_snapshot_type')
+
+    def __init__(self,
+                 section: typing.Any,
+                 connector: typing.Optional[typing.Any] = None,
+                 env_prefix: str = ''
+                 ) -> None:
         self.section = section
-        self.connector = connector
+        self._connector = connector
 
         self.fields: typing.Dict[str, Field] = {}
         self.name = section.__name__.lower()
+        self.env_prefix = env_prefix
+        self.env: typing.Dict[str, typing.Optional[str]] = {}
+        self._snapshot_type: typing.Optional[typing.Type[Snapshot]] = None
+
+    @property
+    def snapshot_type(self) -> typing.Type[Snapshot]:
+        """Snapshot type with section field names, used for section snapshots"""
+        if self._snapshot_type is None:
+            namespace: typing.Dict[str, typing.Any] = {
+                name: property(operator.itemgetter(index)) for index, name in enumerate(self.fields)
+            }
+            namespace.update(__slots__=(), _fields=tuple(self.fields))
+            self._snapshot_type = type(f'{self.section.__name__}Snapshot', (Snapshot,), namespace)
+        return self._snapshot_type
+
+    @property
+    def connector(self) -> typing.Optional[typing.Any]:
+        """Connector of section"""
+        return self._connector
+
+    @connector.setter
+    def connector(self, connector: typing.Optional[typing.Any]) -> None:
+        """Replaces connector of section and all its bound fields"""
+        self._connector = connector
+        for field in self.fields.values():
+            field.connector = connector
 
     def add_field(self, field_name: str, field: Field) -> None:
         """Adds field into section and binds it"""
@@ -26,12 +99,48 @@ class Metadata(object):
             if isinstance(field, Field):
                 field.bind(self.section, field_name, self)
                 self.fields[field.name] = field
+                self._snapshot_type = None
+                if field.env_override:
+                    self.env[field.name] = os.environ.get(field.env_key)
+
+    def refresh_env(self) -> None:
+        """Takes new snapshot of environment variables that override section fields"""
+        self.env = {name: os.environ.get(field.env_key) for name, field in self.fields.items() if field.env_override}
+
+
+class SectionLoadResult(typing.NamedTuple):
+    """Result of single section preload"""
+
+    section: typing.Any
+    elapsed: float
+    error: typing.Optional[BaseException] = None
+
+
+class PreloadReport(object):
+    """Timings and failures of sections preload"""
+
+    def __init__(self, results: typing.List[SectionLoadResult], elapsed: float) -> None:
+        self.results = results
+        self.elapsed = elapsed
+
+    @property
+    def failures(self) -> typing.List[SectionLoadResult]:
+        """Results of sections that failed to load"""
+        return [result for result in self.results if result.error is not None]
+
+    @property
+    def ok(self) -> bool:
+        """True if all sections were loaded successfully"""
+        return not self.failures
+
+    def __repr__(self) -> str:
+        return f'<PreloadReport sections={len(self.results)} failures={len(self.failures)} elapsed={self.elapsed:.3f}s>'
 
 
 class SectionBase(type):
     """Configuration Section setter"""
 
-    inheritable = {'connector'}
+    inheritable = {'connector', 'env_prefix'}
 
     def __new__(mcs, name: str, bases: tuple, attrs: dict):  # type: ignore  # noqa: D102,N804
         if name == SECTION_BASE or bases[0].__name__ == SECTION_BASE:
@@ -51,9 +160,9 @@ class SectionBase(type):
 
             base_meta = base.meta
 
-            for key in base_meta.__dict__:
-                if key in mcs.inheritable and key not in meta_options:
-                    meta_options[key] = base_meta.__dict__[key]
+            for key in mcs.inheritable:
+                if key not in meta_options and hasattr(base_meta, key):
+                    meta_options[key] = getattr(base_meta, key)
 
         new_meta = meta_options.get('model_metadata_class', Metadata)
 
@@ -92,6 +201,102 @@ class Section(with_metaclass(SectionBase)):  # type: ignore
     def __init__(self, **kwargs) -> None:  # type: ignore
         pass
 
+    @classmethod
+    async def aget(cls, field_name: str) -> typing.Any:
+        """
+        Reads field value without blocking event loop
+        :param field_name: Name of section field
+        :return: field value
+        """
+        return await cls.meta.fields[field_name].aget()
+
+    @classmethod
+    def load(cls) -> typing.Dict[str, typing.Any]:
+        """
+        Reads values of all section fields with a single connector call
+        :return: field values by their names
+        """
+        values = cls.meta.connector.get_section(section_name=cls.meta.name, attr_names=list(cls.meta.fields))
+        return {name: field.extract(values) for name, field in cls.meta.fields.items()}
+
+    @classmethod
+    def snapshot(cls) -> typing.Any:
+        """
+        Resolves all section fields with a single connector call into immutable tuple. Reading its
+        attributes does not involve connector or casting, so it suits hot loops. Snapshot is not updated
+        when configuration changes.
+        :return: snapshot with field values
+        """
+        return cls.meta.snapshot_type(**cls.load())
+
+    @classmethod
+    async def aload(cls) -> typing.Dict[str, typing.Any]:
+        """
+        Reads values of all section fields with a single connector call without blocking event loop.
+        Connectors without asynchronous interface are called in default executor.
+        :return: field values by their names
+        """
+        connector = cls.meta.connector
+        if not inspect.iscoroutinefunction(getattr(connector, 'aget_section', None)):
+            import asyncio
+
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(cls.load))
+
+        values = await connector.aget_section(section_name=cls.meta.name, attr_names=list(cls.meta.fields))
+        return {name: field.extract(values) for name, field in cls.meta.fields.items()}
+
+    @classmethod
+    def refresh_env(cls) -> None:
+        """
+        Reads environment variables that override fields of section and all its subclasses again. Environment
+        is read once when section is created, later changes are not visible until this method is called.
+        :return: Nothing
+        """
+        for section in cls.iter_sections():
+            section.meta.refresh_env()
+
+    @classmethod
+    def iter_sections(cls) -> typing.Iterator[typing.Any]:
+        """
+        Walks through section and all its subclasses that have fields
+        :return: iterator over section classes
+        """
+        queue, seen = [cls], set()
+        while queue:
+            section = queue.pop(0)
+            if section in seen:
+                continue
+            seen.add(section)
+            queue.extend(section.__subclasses__())
+            if getattr(section, 'meta', None) is not None and section.meta.fields:
+                yield section
+
+    @classmethod
+    def _load_section(cls, section: typing.Any) -> SectionLoadResult:
+        """Reads all fields of section, measuring time it takes"""
+        started = time.perf_counter()
+        try:
+            section.load()
+        except Exception as error:
+            return SectionLoadResult(section=section, elapsed=time.perf_counter() - started, error=error)
+        return SectionLoadResult(section=section, elapsed=time.perf_counter() - started)
+
+    @classmethod
+    def preload(cls, max_workers: int = 8) -> PreloadReport:
+        """
+        Reads sections and all its subclasses in parallel, so that connector caches are filled before the first
+        real access
+        :param max_workers: Maximum number of sections loaded at the same time
+        :return: report with per-section timings and failures
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = time.perf_counter()
+        sections = list(cls.iter_sections())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(cls._load_section, sections))
+        return PreloadReport(results=results, elapsed=time.perf_counter() - started)
+
     @classmethod
     def check_config_integrity(cls) -> None:
         """
@@ -99,16 +304,17 @@ class Section(with_metaclass(SectionBase)):  # type: ignore
         default values.
         :return: Nothing
         """
-        cls.meta.connector.create_config()
+        with _transaction(cls.meta.connector):
+            cls.meta.connector.create_config()
 
-        for section in cls.__subclasses__():
-            if cls.meta.connector.is_section_exist(section_name=section.__name__) is False:
-                cls.meta.connector.add_section(section_name=section.__name__)
+            for section in cls.__subclasses__():
+                if cls.meta.connector.is_section_exist(section_name=section.__name__) is False:
+                    cls.meta.connector.add_section(section_name=section.__name__)
 
-            for field_name, field_entry in section.meta.fields.items():
-                if cls.meta.connector.is_attr_exist(section_name=section.__name__, attr_name=field_name) is False:
-                    cls.meta.connector.add_attr(
-                        section_name=section.__name__,
-                        attr_name=field_name,
-                        value=field_entry.default
-                    )
+                for field_name, field_entry in section.meta.fields.items():
+                    if cls.meta.connector.is_attr_exist(section_name=section.__name__, attr_name=field_name) is False:
+                        cls.meta.connector.add_attr(
+                            section_name=section.__name__,
+                            attr_name=field_name,
+                            value=field_entry.default
+                        )
@@ -1,16 +1,64 @@
+import contextlib
+import functools
+import json
 import os
+import threading
 import typing
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
 
-import hvac
-from hvac.api.vault_api_base import VaultApiBase
-from hvac.exceptions import InvalidPath
+from . import parse_cache
+from .cache import BackgroundRefresher, SingleFlight, TTLCache
+from .instrumentation import INSTRUMENTED_METHODS, Instrumentation, InstrumentationHook
+from .watch import FileWatcher, watch_file
+
+if typing.TYPE_CHECKING:
+    import asyncio
+    from hvac.api.vault_api_base import VaultApiBase
+
+# hvac pulls in requests and takes noticeable time to import, so it is imported on the first VaultConnector creation
+hvac: typing.Any = None
+
+
+def _import_hvac() -> typing.Any:
+    """Imports hvac module on the first call"""
+    global hvac
+    if hvac is None:
+        import hvac as module
+        hvac = module
+    return hvac
+
+
+def _new_file_mode() -> int:
+    """Returns permissions that open() gives to new files under umask of the process"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('Umask:'):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    # umask can not be read without setting it, /proc is not available on every platform
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _canonicalize(name: str) -> str:
+    """Returns section or attribute name in the form used for case and space insensitive matching"""
+    return name.lower().replace(' ', '_')
+
+
+# Cached variant for names looked up repeatedly. Bulk conversions, like indexing of a whole file, use uncached
+# variant, so that they do not evict names of fields from the cache.
+_canonical = functools.lru_cache(maxsize=1024)(_canonicalize)
 
 
 class Connector(ABC):
     """Connector abstract class"""
 
+    _instrumentation: typing.Optional[Instrumentation] = None
+
     @abstractmethod
     def is_config_exist(self) -> bool:
         """Checks if related config exists"""
@@ -32,6 +80,22 @@ class Connector(ABC):
         """
         pass
 
+    def get_section(self,
+                    section_name: str,
+                    attr_names: typing.Optional[typing.Iterable[str]] = None
+                    ) -> typing.Mapping[str, typing.Optional[str]]:
+        """
+        Reads several values of section at once. Default implementation reads every attribute with get_value,
+        connectors override it to read section with a single request.
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, connectors that are able to list section read all
+        attributes if it is not set
+        :return: values in string format by canonical attribute names, missing attributes may be omitted
+        """
+        return {
+            _canonical(name): self.get_value(section_name=section_name, attr_name=name) for name in attr_names or ()
+        }
+
     @abstractmethod
     def set_value(self, section_name: str, attr_name: str, value: str) -> None:
         """
@@ -82,12 +146,351 @@ class Connector(ABC):
         """
         pass
 
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator[None]:
+        """
+        Groups configuration changes made inside context. Connectors that are able to batch writes stage changes
+        in memory and apply them on exit, default implementation writes every change immediately.
+        """
+        yield
+
+    def clear(self) -> None:
+        """
+        Drops cached configuration data, so that the next read gets it from source. Default implementation does
+        nothing for connectors without cache.
+        :return: Nothing
+        """
+        return None
+
+    def refresh(self) -> None:
+        """
+        Makes the next reads return current data of source, cached data that is still up to date is kept.
+        Default implementation does nothing for connectors that check their source on every read.
+        :return: Nothing
+        """
+        return None
+
+    def enable_instrumentation(self, hooks: typing.Iterable[InstrumentationHook] = ()) -> Instrumentation:
+        """
+        Starts recording calls of connector methods, cache lookups and reads. Methods are wrapped on connector
+        instance only while instrumentation is enabled, so disabled connector runs its methods as is.
+        :param hooks: hooks to call on recorded events, they are added to already enabled instrumentation
+        :return: instrumentation of connector
+        """
+        if self._instrumentation is None:
+            instrumentation = Instrumentation(normalize=_canonical)
+            for name in INSTRUMENTED_METHODS:
+                method = getattr(self, name, None)
+                if method is not None:
+                    setattr(self, name, instrumentation.wrap(self, name, method))
+            self._instrumentation = instrumentation
+        for hook in hooks:
+            self._instrumentation.add_hook(hook)
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """
+        Stops recording and drops recorded stats
+        :return: Nothing
+        """
+        if self._instrumentation is None:
+            return
+        self._instrumentation = None
+        for name in INSTRUMENTED_METHODS:
+            self.__dict__.pop(name, None)
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns stats recorded by instrumentation, see Instrumentation.stats for their structure
+        :return: stats dictionary, with enabled flag and connector class name added
+        """
+        instrumentation = self._instrumentation if self._instrumentation is not None else Instrumentation()
+        return {'connector': type(self).__name__, 'enabled': self._instrumentation is not None,
+                **instrumentation.stats()}
+
+
+class IniDocument(object):
+    """Parsed *.ini configuration with index of canonical section and attribute names"""
+
+    def __init__(self, config: ConfigParser) -> None:
+        self.config = config
+        self.index: typing.Dict[str, typing.Tuple[str, typing.Dict[str, str]]] = {}
+
+        for section in config.sections():
+            self._index_section(section)
+
+    def _index_section(self, section: str) -> None:
+        """Adds raw section and all its attributes into index"""
+        attrs = {_canonicalize(attr): attr for attr in self.config[section]}
+        self.index[_canonicalize(section)] = (section, attrs)
+
+    def _entry(self, section_name: str) -> typing.Optional[typing.Tuple[str, typing.Dict[str, str]]]:
+        """Looks up index entry of section, names that are already canonical are found without conversion"""
+        entry = self.index.get(section_name)
+        if entry is None:
+            entry = self.index.get(_canonical(section_name))
+        return entry
+
+    def find_section(self, section_name: str) -> typing.Optional[str]:
+        """
+        Looks up section by its canonical name
+        :param section_name: Name of config section
+        :return: raw section name as it is written in file or None if section is missing
+        """
+        entry = self._entry(section_name)
+        return entry[0] if entry is not None else None
+
+    def find_attr(self, section_name: str, attr_name: str) -> typing.Optional[typing.Tuple[str, str]]:
+        """
+        Looks up attribute by canonical names of section and attribute
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :return: pair of raw section and attribute names or None if attribute is missing
+        """
+        entry = self._entry(section_name)
+        if entry is None:
+            return None
+        attr = entry[1].get(attr_name)
+        if attr is None:
+            attr = entry[1].get(_canonical(attr_name))
+        return (entry[0], attr) if attr is not None else None
+
+    def get(self, section_name: str, attr_name: str) -> typing.Optional[str]:
+        """
+        Reads attribute value
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :return: value in string format
+        """
+        found = self.find_attr(section_name=section_name, attr_name=attr_name)
+        return self.config[found[0]][found[1]] if found is not None else None
+
+    def get_section(self,
+                    section_name: str,
+                    attr_names: typing.Optional[typing.Iterable[str]] = None
+                    ) -> typing.Dict[str, typing.Optional[str]]:
+        """
+        Reads several values of section at once
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, all section attributes are read if it is not set
+        :return: values in string format by canonical attribute names
+        """
+        entry = self._entry(section_name)
+        if entry is None:
+            return {}
+
+        section, attrs = entry
+        names = attrs if attr_names is None else [_canonical(name) for name in attr_names]
+        return {name: self.config[section][attrs[name]] for name in names if name in attrs}
+
+    def add_section(self, section: str) -> None:
+        """
+        Adds new section
+        :param section: raw section name
+        :return: Nothing
+        """
+        self.config.add_section(section=section)
+        self._index_section(section)
+
+    def set(self, section: str, attr: str, value: typing.Optional[str]) -> None:
+        """
+        Sets attribute value in existing section
+        :param section: raw section name
+        :param attr: raw attribute name
+        :param value: value to write
+        :return: Nothing
+        """
+        self.config.set(section=section, option=attr, value=value)
+        self.index[_canonicalize(section)][1][_canonicalize(attr)] = self.config.optionxform(attr)
+
 
 class IniConnector(Connector):
-    """Connector class for *.ini configuration files"""
+    """
+    Connector class for *.ini configuration files. Parsed file is checked for changes with os.stat on every read.
+    With watch enabled file is watched with inotify, or polled every poll_interval seconds where inotify is not
+    available, and parsed file is checked only after change is reported. With parse_cache enabled parsed file
+    is stored in binary sidecar file and loaded from it while config is not changed.
+    """
 
-    def __init__(self, connection_string: str):
+    def __init__(self,
+                 connection_string: str,
+                 watch: bool = False,
+                 poll_interval: float = 1.0,
+                 parse_cache: bool = False,
+                 cache_dir: typing.Optional[str] = None
+                 ):
         self.connection_string = connection_string
+        self.parse_cache = parse_cache
+        self.cache_dir = cache_dir
+
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._document: typing.Optional[IniDocument] = None
+        self._signature: typing.Optional[typing.Tuple[int, int, int]] = None
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+        self._dirty = False
+        self._changed = True
+        self._watcher: typing.Optional[FileWatcher] = None
+        if watch:
+            self._watcher = watch_file(connection_string, self._on_file_change, poll_interval=poll_interval)
+
+    def _on_file_change(self) -> None:
+        """Marks parsed file for check on the next read"""
+        self._changed = True
+
+    def close(self) -> None:
+        """
+        Stops watching config file
+        :return: Nothing
+        """
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+
+    def _file_signature(self) -> typing.Optional[typing.Tuple[int, int, int]]:
+        """Returns (mtime_ns, size, inode) of config file or None if it is missing"""
+        try:
+            stat = os.stat(self.connection_string)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+    def _read_document(self) -> IniDocument:
+        """
+        Returns parsed configuration. File is parsed again only if its mtime, size or inode were changed since
+        the last read, otherwise cached document is returned. If file is watched, it is checked only after watcher
+        reported a change. Inside transaction staged document is returned as is.
+        :return: parsed configuration
+        """
+        with self._lock:
+            if self._document is not None and self._transaction_depth > 0:
+                return self._cache_hit(self._document)
+
+            if self._document is not None and self._watcher is not None and self._changed is False:
+                return self._cache_hit(self._document)
+
+            self._changed = False
+            signature = self._file_signature()
+            if self._document is not None and signature == self._signature:
+                return self._cache_hit(self._document)
+
+            self.cache_misses += 1
+            if self._instrumentation is not None:
+                self._instrumentation.record_cache(self, None, hit=False)
+                self._instrumentation.record_read(self, None, size=signature[1] if signature is not None else 0)
+            if self.parse_cache:
+                config = parse_cache.read_config(self.connection_string, cache_dir=self.cache_dir)
+            else:
+                config = ConfigParser(allow_no_value=True)
+                config.read(self.connection_string)
+            self._document = IniDocument(config)
+            self._signature = signature
+            return self._document
+
+    def _cache_hit(self, document: IniDocument) -> IniDocument:
+        """Counts use of parsed file and returns it"""
+        self.cache_hits += 1
+        if self._instrumentation is not None:
+            self._instrumentation.record_cache(self, None, hit=True)
+        return document
+
+    def refresh(self) -> None:
+        """
+        Makes the next read check file for changes even if watcher has not reported them yet
+        :return: Nothing
+        """
+        self._changed = True
+
+    def clear(self) -> None:
+        """Drops parsed file, so that the next read parses it again. Document staged by transaction is kept"""
+        with self._lock:
+            if self._transaction_depth == 0:
+                self._document = None
+                self._signature = None
+
+    def _write_document(self, document: IniDocument) -> None:
+        """
+        Remembers document as the current one and writes it into file. Inside transaction write is postponed
+        until the outermost transaction is finished.
+        :param document: configuration to write
+        :return: Nothing
+        """
+        with self._lock:
+            self._document = document
+            if self._transaction_depth > 0:
+                self._dirty = True
+            else:
+                self._flush()
+
+    def _flush(self) -> None:
+        """
+        Atomically replaces config file with the current document: data is written into temporary file in the same
+        directory, synced to disk and renamed over the original file. Replaced file keeps its permissions, owner
+        and group, the latter two only if process is allowed to change them. New file gets permissions allowed
+        by umask.
+        :return: Nothing
+        """
+        import tempfile
+
+        path = os.path.realpath(self.connection_string)
+        try:
+            original: typing.Optional[os.stat_result] = os.stat(path)
+        except OSError:
+            original = None
+
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f'.{os.path.basename(path)}.')
+            try:
+                with os.fdopen(fd, mode='w') as file:
+                    self._document.config.write(fp=file)
+                    file.flush()
+                    os.fsync(file.fileno())
+                    created = os.fstat(file.fileno())
+                if original is None:
+                    os.chmod(temp_path, _new_file_mode())
+                else:
+                    os.chmod(temp_path, original.st_mode & 0o777)
+                    owner = (original.st_uid, original.st_gid)
+                    if hasattr(os, 'chown') and owner != (created.st_uid, created.st_gid):
+                        try:
+                            os.chown(temp_path, *owner)
+                        except PermissionError:
+                            # unprivileged process may still keep group it is member of
+                            with contextlib.suppress(PermissionError):
+                                os.chown(temp_path, -1, original.st_gid)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except BaseException:
+            self._document = None
+            raise
+        finally:
+            self._dirty = False
+        self._signature = self._file_signature()
+
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator[None]:
+        """
+        Stages all changes made inside context in memory and writes them into file with a single atomic write
+        on exit. Changes are discarded if exception is raised inside context. Nested transactions are merged
+        into the outermost one.
+        """
+        with self._lock:
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                if self._transaction_depth == 1:
+                    self._document = None
+                    self._dirty = False
+                raise
+            else:
+                if self._transaction_depth == 1 and self._dirty is True:
+                    self._flush()
+            finally:
+                self._transaction_depth -= 1
 
     def get_value(self, section_name: str, attr_name: str, env_override: bool = False) -> typing.Optional[str]:
         """
@@ -97,22 +500,28 @@ class IniConnector(Connector):
         :param env_override: Flag for environment variables override of config values
         :return: value in string format
         """
-        config = ConfigParser(allow_no_value=True)
-        config.read(self.connection_string)
         result = None
 
         if env_override is True:
             result = os.getenv(f'{section_name}_{attr_name}'.upper())
 
         if result is None:
-            for section in config.sections():
-                if section.lower().replace(' ', '_') == section_name.lower().replace(' ', '_'):
-                    for attr in config[section]:
-                        if attr.lower().replace(' ', '_') == attr_name.lower().replace(' ', '_'):
-                            result = config[section][attr]
+            result = self._read_document().get(section_name=section_name, attr_name=attr_name)
 
         return result
 
+    def get_section(self,
+                    section_name: str,
+                    attr_names: typing.Optional[typing.Iterable[str]] = None
+                    ) -> typing.Mapping[str, typing.Optional[str]]:
+        """
+        Reads several values of section at once
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, all section attributes are read if it is not set
+        :return: values in string format by canonical attribute names
+        """
+        return self._read_document().get_section(section_name=section_name, attr_names=attr_names)
+
     def set_value(self, section_name: str, attr_name: str, value: str) -> None:
         """
         Setter function that writes data into configuration
@@ -121,20 +530,15 @@ class IniConnector(Connector):
         :param value: value to write
         :return: Nothing
         """
-        config = ConfigParser(allow_no_value=True)
         if value is not None:
             value = str(value)
-        if self.is_section_exist(section_name=section_name) is True:
-            if self.is_attr_exist(section_name=section_name, attr_name=attr_name) is True:
-                config.read(self.connection_string)
-                for section in config.sections():
-                    if section.lower().replace(' ', '_') == section_name.lower().replace(' ', '_'):
-                        for attr in config[section]:
-                            if attr.lower().replace(' ', '_') == attr_name.lower().replace(' ', '_'):
-                                config.set(section=section, option=attr, value=value)
-                                with open(file=self.connection_string, mode='w') as file:
-                                    config.write(fp=file)
-            else:
+        with self._lock:
+            document = self._read_document()
+            found = document.find_attr(section_name=section_name, attr_name=attr_name)
+            if found is not None:
+                document.set(section=found[0], attr=found[1], value=value)
+                self._write_document(document)
+            elif document.find_section(section_name=section_name) is not None:
                 self.add_attr(section_name=section_name, attr_name=attr_name, value=value)
 
     def is_section_exist(self, section_name: str) -> bool:
@@ -143,15 +547,7 @@ class IniConnector(Connector):
         :param section_name: Name of config section
         :return: Check result
         """
-        config = ConfigParser(allow_no_value=True)
-        config.read(self.connection_string)
-
-        result = False
-        for section in config.sections():
-            if section.lower().replace(' ', '_') == section_name.lower().replace(' ', '_'):
-                result = True
-
-        return result
+        return self._read_document().find_section(section_name=section_name) is not None
 
     def is_attr_exist(self, section_name: str, attr_name: str) -> bool:
         """
@@ -160,17 +556,7 @@ class IniConnector(Connector):
         :param attr_name: Name of attribute in section
         :return: Check result
         """
-        config = ConfigParser(allow_no_value=True)
-        config.read(self.connection_string)
-
-        result = False
-        for section in config.sections():
-            if section.lower().replace(' ', '_') == section_name.lower().replace(' ', '_'):
-                for attr in config[section]:
-                    if attr.lower().replace(' ', '_') == attr_name.lower().replace(' ', '_'):
-                        result = True
-
-        return result
+        return self._read_document().find_attr(section_name=section_name, attr_name=attr_name) is not None
 
     def add_section(self, section_name: str) -> None:
         """
@@ -178,12 +564,11 @@ class IniConnector(Connector):
         :param section_name: Name of config section
         :return: Nothing
         """
-        if self.is_section_exist(section_name=section_name) is False:
-            config = ConfigParser(allow_no_value=True)
-            config.read(self.connection_string)
-            config.add_section(section=(section_name.replace('_', ' ')))
-            with open(file=self.connection_string, mode='w') as file:
-                config.write(fp=file)
+        with self._lock:
+            document = self._read_document()
+            if document.find_section(section_name=section_name) is None:
+                document.add_section(section=section_name.replace('_', ' '))
+                self._write_document(document)
 
     def add_attr(self, section_name: str, attr_name: str, value: str) -> None:
         """
@@ -193,14 +578,14 @@ class IniConnector(Connector):
         :param value: value to write
         :return: Nothing
         """
-        if self.is_attr_exist(section_name=section_name, attr_name=attr_name) is False:
-            if value is not None:
-                value = str(value)
-            config = ConfigParser(allow_no_value=True)
-            config.read(self.connection_string)
-            config.set(section=section_name, option=attr_name, value=value)
-            with open(file=self.connection_string, mode='w') as file:
-                config.write(fp=file)
+        with self._lock:
+            document = self._read_document()
+            if document.find_attr(section_name=section_name, attr_name=attr_name) is None:
+                if value is not None:
+                    value = str(value)
+                section = document.find_section(section_name=section_name) or section_name
+                document.set(section=section, attr=attr_name, value=value)
+                self._write_document(document)
 
     def is_config_exist(self) -> bool:
         """Checks if related config exists"""
@@ -209,24 +594,387 @@ class IniConnector(Connector):
     def create_config(self) -> None:
         """Creates config based on connection parameters"""
         if self.is_config_exist() is False:
+            with self._lock:
+                if self._transaction_depth > 0:
+                    self._write_document(self._read_document())
+                    return
             file = open(file=self.connection_string, mode="w+")
             file.close()
 
 
+class DictConnector(Connector):
+    """
+    Connector that serves configuration from memory, kept as nested dictionaries of sections and attributes.
+    Names are matched the same way as in IniConnector: case does not matter and spaces are treated as underlines.
+    Nothing is read from or written to outside of process, which makes it a zero I/O source for tests,
+    benchmarks and latency critical code. Configuration of other connectors may be loaded into it and dumped back.
+    """
+
+    def __init__(self, data: typing.Optional[typing.Mapping[str, typing.Mapping[str, typing.Any]]] = None) -> None:
+        """
+        :param data: initial configuration, values by attribute names by section names
+        """
+        # Raw section name and attributes by canonical section name, attribute is a pair of raw name and value
+        self._sections: typing.Dict[str, typing.Tuple[str, typing.Dict[str, typing.Tuple[str, typing.Any]]]] = {}
+        self._lock = threading.RLock()
+        self._transaction_depth = 0
+
+        for section_name, attrs in (data or {}).items():
+            self.add_section(section_name=section_name)
+            for attr_name, value in attrs.items():
+                self.add_attr(section_name=section_name, attr_name=attr_name, value=value)
+
+    @classmethod
+    def from_connector(cls, connector: Connector, section_names: typing.Iterable[str]) -> 'DictConnector':
+        """
+        Creates connector with copy of sections read from other connector, missing sections are skipped
+        :param connector: connector to read sections from
+        :param section_names: names of sections to read
+        :return: new connector
+        """
+        return cls({
+            section_name: connector.get_section(section_name=section_name)
+            for section_name in section_names if connector.is_section_exist(section_name=section_name)
+        })
+
+    @classmethod
+    def freeze(cls, section: typing.Any) -> 'DictConnector':
+        """
+        Reads all fields of section and its subclasses from their connectors into new connector and binds
+        sections to it, so that further reads are served from memory
+        :param section: root section
+        :return: new connector
+        """
+        sections = list(section.iter_sections())
+        connector = cls({
+            item.__name__: item.meta.connector.get_section(
+                section_name=item.meta.name,
+                attr_names=list(item.meta.fields)
+            )
+            for item in sections
+        })
+        for item in [section] + sections:
+            item.meta.connector = connector
+        return connector
+
+    def dump(self, connector: Connector, section_names: typing.Optional[typing.Iterable[str]] = None) -> None:
+        """
+        Writes sections into other connector within its transaction, missing sections and attributes are added
+        :param connector: connector to write sections into
+        :param section_names: names of sections to write, all sections are written if it is not set
+        :return: Nothing
+        """
+        data = self.to_dict()
+        if section_names is not None:
+            names = {_canonical(name) for name in section_names}
+            data = {section: attrs for section, attrs in data.items() if _canonical(section) in names}
+
+        with connector.transaction():
+            connector.create_config()
+            for section_name, attrs in data.items():
+                if connector.is_section_exist(section_name=section_name) is False:
+                    connector.add_section(section_name=section_name)
+                for attr_name, value in attrs.items():
+                    if connector.is_attr_exist(section_name=section_name, attr_name=attr_name):
+                        connector.set_value(section_name=section_name, attr_name=attr_name, value=value)
+                    else:
+                        connector.add_attr(section_name=section_name, attr_name=attr_name, value=value)
+
+    def to_dict(self) -> typing.Dict[str, typing.Dict[str, typing.Optional[str]]]:
+        """
+        Returns copy of configuration with names as they were added
+        :return: values by attribute names by section names
+        """
+        with self._lock:
+            return {
+                section: {attr: value for attr, value in attrs.values()}
+                for section, attrs in self._sections.values()
+            }
+
+    @contextlib.contextmanager
+    def transaction(self) -> typing.Iterator[None]:
+        """
+        Groups changes made inside context, they are discarded if exception is raised inside context. Changes
+        are applied immediately, so readers that do not take part in transaction see them before it is finished.
+        Nested transactions are merged into the outermost one.
+        """
+        with self._lock:
+            saved = None
+            if self._transaction_depth == 0:
+                saved = {key: (section, dict(attrs)) for key, (section, attrs) in self._sections.items()}
+            self._transaction_depth += 1
+            try:
+                yield
+            except BaseException:
+                if saved is not None:
+                    self._sections = saved
+                raise
+            finally:
+                self._transaction_depth -= 1
+
+    def is_config_exist(self) -> bool:
+        """Checks if related config exists"""
+        return True
+
+    def create_config(self) -> None:
+        """Creates config based on connection parameters"""
+        pass
+
+    def get_value(self, section_name: str, attr_name: str, env_override: bool = False) -> typing.Optional[str]:
+        """
+        Reads value from configuration
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :param env_override: Flag for environment variables override of config values
+        :return: value in string format
+        """
+        if env_override is True:
+            result = os.getenv(f'{section_name}_{attr_name}'.upper())
+            if result is not None:
+                return result
+
+        entry = self._sections.get(section_name) or self._sections.get(_canonical(section_name))
+        if entry is None:
+            return None
+        attr = entry[1].get(attr_name) or entry[1].get(_canonical(attr_name))
+        return attr[1] if attr is not None else None
+
+    def get_section(self,
+                    section_name: str,
+                    attr_names: typing.Optional[typing.Iterable[str]] = None
+                    ) -> typing.Mapping[str, typing.Optional[str]]:
+        """
+        Reads several values of section at once
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, all section attributes are read if it is not set
+        :return: values in string format by canonical attribute names
+        """
+        entry = self._sections.get(_canonical(section_name))
+        if entry is None:
+            return {}
+
+        attrs = entry[1]
+        names = attrs if attr_names is None else [_canonical(name) for name in attr_names]
+        return {name: attrs[name][1] for name in names if name in attrs}
+
+    def set_value(self, section_name: str, attr_name: str, value: str) -> None:
+        """
+        Setter function that writes data into configuration
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :param value: value to write
+        :return: Nothing
+        """
+        with self._lock:
+            entry = self._sections.get(_canonical(section_name))
+            if entry is None:
+                return
+            attr = entry[1].get(_canonical(attr_name))
+            if attr is not None:
+                entry[1][_canonical(attr_name)] = (attr[0], str(value) if value is not None else None)
+            else:
+                self.add_attr(section_name=section_name, attr_name=attr_name, value=value)
+
+    def is_section_exist(self, section_name: str) -> bool:
+        """
+        Check if section exist in configuration
+        :param section_name: Name of config section
+        :return: Check result
+        """
+        return _canonical(section_name) in self._sections
+
+    def is_attr_exist(self, section_name: str, attr_name: str) -> bool:
+        """
+        Check if attribute exist in given section
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :return: Check result
+        """
+        entry = self._sections.get(_canonical(section_name))
+        return entry is not None and _canonical(attr_name) in entry[1]
+
+    def add_section(self, section_name: str) -> None:
+        """
+        Add new section in configuration
+        :param section_name: Name of config section
+        :return: Nothing
+        """
+        with self._lock:
+            self._sections.setdefault(_canonical(section_name), (section_name, {}))
+
+    def add_attr(self, section_name: str, attr_name: str, value: str) -> None:
+        """
+        Add new attribute in given section, section is added if it is missing
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :param value: value to write
+        :return: Nothing
+        """
+        with self._lock:
+            attrs = self._sections.setdefault(_canonical(section_name), (section_name, {}))[1]
+            if _canonical(attr_name) not in attrs:
+                attrs[_canonical(attr_name)] = (attr_name, str(value) if value is not None else None)
+
+
 class VaultConnector(Connector):
     """Connector class for Hashicorp Vault KV storage"""
 
-    def __init__(self, mount_point: str, url: str, token: str):
+    def __init__(self,
+                 mount_point: str,
+                 url: str,
+                 token: str,
+                 cache_ttl: float = 0,
+                 cache_max_entries: int = 128,
+                 refresh_in_background: bool = False,
+                 refresh_jitter: float = 0.1,
+                 max_staleness: typing.Optional[float] = None,
+                 on_refresh_error: typing.Optional[typing.Callable[[str, BaseException], None]] = None,
+                 check_version: bool = False
+                 ):
         self.mount_point = mount_point
         self.url = url
         self.token = token
 
-        self._client = hvac.Client(url=self.url, token=self.token)
+        if refresh_in_background is True and cache_ttl <= 0:
+            raise ValueError('Background refresh requires positive cache_ttl')
+
+        self._client = _import_hvac().Client(url=self.url, token=self.token)
+        self._cache: typing.Optional[TTLCache] = None
+        self._flight = SingleFlight()
+        self._refresher: typing.Optional[BackgroundRefresher] = None
+        self._max_staleness = 0.0
+        self._check_version = check_version
+        self._paths: typing.Dict[str, str] = {}
+
+        if cache_ttl > 0:
+            self._cache = TTLCache(
+                ttl=cache_ttl,
+                max_entries=cache_max_entries,
+                jitter=refresh_jitter if refresh_in_background else 0.0
+            )
+        if refresh_in_background is True:
+            self._refresher = BackgroundRefresher(refresh=self._refresh_secret, on_error=on_refresh_error)
+            self._max_staleness = max_staleness if max_staleness is not None else float('inf')
 
     @property
-    def _vault_api(self) -> VaultApiBase:
+    def _vault_api(self) -> 'VaultApiBase':
         return self._client.secrets.kv.v2
 
+    def _cached_secret(self, path: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        """
+        Looks up cached secret data. With background refresh expired data is returned as well, while it is not
+        older than max staleness, and fresh data is requested by refresher thread.
+        :param path: secret path
+        :return: secret data or None if there is no usable cached data
+        """
+        if self._cache is None:
+            return None
+
+        entry = self._cache.get(path, max_stale=self._max_staleness)
+        if self._instrumentation is not None:
+            self._instrumentation.record_cache(self, path, hit=entry is not None)
+        if entry is None:
+            return None
+        if self._refresher is not None and entry.is_expired(self._cache.timer()):
+            self._refresher.schedule(path)
+        return entry.value
+
+    def _path(self, section_name: str) -> str:
+        """Returns secret path of section, paths are remembered so that repeated reads do not build strings"""
+        path = self._paths.get(section_name)
+        if path is None:
+            path = self._paths[section_name] = section_name.upper()
+        return path
+
+    def _read_section(self, section_name: str) -> typing.Dict[str, typing.Any]:
+        """
+        Reads secret data of section, using cached payload if it is available. Concurrent reads of the same
+        section are merged into a single request.
+        :param section_name: Name of config section
+        :return: secret data
+        """
+        path = self._path(section_name)
+        data = self._cached_secret(path)
+        if data is not None:
+            return data
+
+        return self._refresh_secret(path)
+
+    def _refresh_secret(self, path: str) -> typing.Dict[str, typing.Any]:
+        """
+        Requests secret data from Vault unless the same request is already in flight
+        :param path: secret path
+        :return: secret data
+        """
+        return self._flight.do(path, lambda: self._fetch_secret(path))
+
+    def _fetch_secret(self, path: str) -> typing.Dict[str, typing.Any]:
+        """
+        Requests secret data from Vault and caches it. With version check enabled cached data is requested again
+        only if current secret version differs from the cached one.
+        :param path: secret path
+        :return: secret data
+        """
+        if self._cache is not None and self._check_version is True:
+            entry = self._cache.peek(path)
+            if entry is not None and entry.version is not None:
+                metadata = self._vault_api.read_secret_metadata(path=path, mount_point=self.mount_point)
+                if metadata["data"]["current_version"] == entry.version:
+                    self._cache.renew(path)
+                    return entry.value
+
+        response = self._vault_api.read_secret(path=path, mount_point=self.mount_point)
+        if self._instrumentation is not None:
+            # hvac returns decoded response, its size is estimated by serializing it back
+            self._instrumentation.record_read(self, path, size=len(json.dumps(response).encode()))
+        data = self._normalize_secret(response["data"]["data"])
+        if self._cache is not None:
+            version = (response["data"].get("metadata") or {}).get("version")
+            self._cache.set(path, data, version=version)
+        return data
+
+    @staticmethod
+    def _normalize_secret(data: typing.Mapping[str, typing.Any]) -> typing.Dict[str, typing.Any]:
+        """
+        Converts secret keys into canonical attribute names, so that every read matches attributes the same way
+        as IniConnector does: case does not matter and spaces are treated as underlines
+        :param data: secret data as it is stored in Vault
+        :return: secret data by canonical attribute names
+        """
+        return {_canonicalize(key): value for key, value in data.items()}
+
+    def invalidate(self, section_name: str) -> None:
+        """
+        Drops cached secret data of section
+        :param section_name: Name of config section
+        :return: Nothing
+        """
+        if self._cache is not None:
+            self._cache.invalidate(self._path(section_name))
+
+    def clear(self) -> None:
+        """Drops all cached secret data"""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def refresh(self) -> None:
+        """
+        Requests all cached sections from Vault again. With version check enabled unchanged secrets are only
+        renewed in cache. Cached data is served to readers while refresh is in progress, sections that were
+        deleted from Vault are dropped from cache.
+        :return: Nothing
+        """
+        if self._cache is None:
+            return
+
+        from hvac.exceptions import InvalidPath
+
+        for path in self._cache.keys():
+            try:
+                self._refresh_secret(path)
+            except InvalidPath:
+                self._cache.invalidate(path)
+
     def is_config_exist(self) -> bool:
         """Checks if related config exists"""
         return True
@@ -243,15 +991,36 @@ class VaultConnector(Connector):
         :param env_override: Flag for environment variables override of config values
         :return: value in string format
         """
-        key = f'{section_name}_{attr_name}'.upper()
         result: typing.Optional[str] = None
         if env_override:
-            result = os.getenv(key)
+            result = os.getenv(f'{section_name}_{attr_name}'.upper())
         if result is None:
-            response = self._vault_api.read_secret(path=section_name.upper(), mount_point=self.mount_point)
-            result = response["data"]["data"].get(attr_name.upper())
+            data = self._read_section(section_name)
+            result = data[attr_name] if attr_name in data else data.get(_canonical(attr_name))
         return result
 
+    def get_section(self,
+                    section_name: str,
+                    attr_names: typing.Optional[typing.Iterable[str]] = None
+                    ) -> typing.Mapping[str, typing.Optional[str]]:
+        """
+        Reads several values of section with a single request
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, all section attributes are read if it is not set
+        :return: values in string format by canonical attribute names
+        """
+        return self._filter_section(self._read_section(section_name), attr_names)
+
+    @staticmethod
+    def _filter_section(data: typing.Mapping[str, typing.Any],
+                        attr_names: typing.Optional[typing.Iterable[str]]
+                        ) -> typing.Dict[str, typing.Optional[str]]:
+        """Takes values of requested attributes from normalized secret data"""
+        if attr_names is None:
+            return dict(data)
+        names = [_canonical(name) for name in attr_names]
+        return {name: data[name] for name in names if name in data}
+
     def set_value(self, section_name: str, attr_name: str, value: str) -> None:
         """
         Setter function that writes data into configuration
@@ -268,9 +1037,11 @@ class VaultConnector(Connector):
         :param section_name: Name of config section
         :return: Check result
         """
+        from hvac.exceptions import InvalidPath
+
         success = False
         try:
-            self._vault_api.read_secret(path=section_name.upper(), mount_point=self.mount_point)
+            self._read_section(section_name)
             success = True
         except InvalidPath:
             pass
@@ -283,11 +1054,11 @@ class VaultConnector(Connector):
         :param attr_name: Name of attribute in section
         :return: Check result
         """
+        from hvac.exceptions import InvalidPath
+
         success = False
         try:
-            response = self._vault_api.read_secret(path=section_name.upper(), mount_point=self.mount_point)
-            keys = list(response["data"]["data"].keys())
-            success = attr_name.upper() in keys
+            success = _canonical(attr_name) in self._read_section(section_name)
         except InvalidPath:
             pass
         return success
@@ -324,3 +1095,189 @@ class VaultConnector(Connector):
                     attr_name.upper(): value
                 }
             )
+        self.invalidate(section_name)
+
+
+class AsyncVaultConnector(VaultConnector):
+    """
+    Connector class for Hashicorp Vault KV storage with non-blocking reads for asyncio applications.
+    Reads are made with pooled aiohttp session, which is bound to the event loop of the first read.
+    Writes and synchronous reads are made with regular hvac client.
+    """
+
+    def __init__(self,
+                 mount_point: str,
+                 url: str,
+                 token: str,
+                 pool_size: int = 10,
+                 timeout: float = 30,
+                 **kwargs: typing.Any
+                 ):
+        try:
+            import aiohttp
+        except ImportError as error:
+            raise ImportError('AsyncVaultConnector requires aiohttp, install it with "ConfigORM[async]"') from error
+
+        super().__init__(mount_point=mount_point, url=url, token=token, **kwargs)
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self._aiohttp = aiohttp
+        self._session: typing.Optional[typing.Any] = None
+        self._pending: typing.Dict[str, 'asyncio.Future[typing.Dict[str, typing.Any]]'] = {}
+
+    async def __aenter__(self) -> 'AsyncVaultConnector':
+        return self
+
+    async def __aexit__(self, *args: typing.Any) -> None:
+        await self.aclose()
+
+    def _get_session(self) -> typing.Any:
+        """Returns HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = self._aiohttp.ClientSession(
+                connector=self._aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=self._aiohttp.ClientTimeout(total=self.timeout),
+                headers={'X-Vault-Token': self.token}
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Closes HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _aread_section(self, section_name: str) -> typing.Dict[str, typing.Any]:
+        """
+        Reads secret data of section without blocking event loop, using cached payload if it is available.
+        Concurrent reads of the same section are merged into a single request.
+        :param section_name: Name of config section
+        :return: secret data
+        """
+        import asyncio
+
+        path = self._path(section_name)
+        data = self._cached_secret(path)
+        if data is not None:
+            return data
+
+        future = self._pending.get(path)
+        if future is None:
+            future = asyncio.ensure_future(self._afetch_secret(path))
+            self._pending[path] = future
+            future.add_done_callback(functools.partial(self._forget_pending, path))
+        return await asyncio.shield(future)
+
+    def _forget_pending(self, path: str, future: 'asyncio.Future[typing.Dict[str, typing.Any]]') -> None:
+        """Removes finished request from pending ones, unless it was already replaced by a newer request"""
+        if self._pending.get(path) is future:
+            del self._pending[path]
+
+    async def _arequest(self, endpoint: str, path: str) -> typing.Tuple[typing.Dict[str, typing.Any], str]:
+        """
+        Makes GET request to KV secrets engine, errors are raised as hvac exceptions
+        :param endpoint: "data" or "metadata"
+        :param path: secret path
+        :return: decoded response body and its text
+        """
+        url = f'{self.url.rstrip("/")}/v1/{self.mount_point.strip("/")}/{endpoint}/{path}'
+        async with self._get_session().get(url) as response:
+            text = await response.text()
+            if response.status >= 400:
+                try:
+                    errors = json.loads(text).get('errors')
+                except ValueError:
+                    errors = None
+                from hvac import utils as hvac_utils
+                hvac_utils.raise_for_error('GET', url, response.status, message=text, errors=errors)
+        return json.loads(text), text
+
+    async def _afetch_secret(self, path: str) -> typing.Dict[str, typing.Any]:
+        """
+        Requests secret data from Vault and caches it. With version check enabled cached data is requested again
+        only if current secret version differs from the cached one.
+        :param path: secret path
+        :return: secret data
+        """
+        if self._cache is not None and self._check_version is True:
+            entry = self._cache.peek(path)
+            if entry is not None and entry.version is not None:
+                metadata, _ = await self._arequest('metadata', path)
+                if metadata["data"]["current_version"] == entry.version:
+                    self._cache.renew(path)
+                    return entry.value
+
+        body, text = await self._arequest('data', path)
+        if self._instrumentation is not None:
+            self._instrumentation.record_read(self, path, size=len(text.encode()))
+
+        data = self._normalize_secret(body["data"]["data"])
+        if self._cache is not None:
+            version = (body["data"].get("metadata") or {}).get("version")
+            self._cache.set(path, data, version=version)
+        return data
+
+    async def aget_value(self,
+                         section_name: str,
+                         attr_name: str,
+                         env_override: bool = False
+                         ) -> typing.Optional[str]:
+        """
+        Reads value from configuration without blocking event loop
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :param env_override: Flag for environment variables override of config values
+        :return: value in string format
+        """
+        result: typing.Optional[str] = None
+        if env_override:
+            result = os.getenv(f'{section_name}_{attr_name}'.upper())
+        if result is None:
+            data = await self._aread_section(section_name)
+            result = data[attr_name] if attr_name in data else data.get(_canonical(attr_name))
+        return result
+
+    async def aget_section(self,
+                           section_name: str,
+                           attr_names: typing.Optional[typing.Iterable[str]] = None
+                           ) -> typing.Mapping[str, typing.Optional[str]]:
+        """
+        Reads several values of section with a single request without blocking event loop
+        :param section_name: Name of config section
+        :param attr_names: Names of attributes to read, all section attributes are read if it is not set
+        :return: values in string format by canonical attribute names
+        """
+        return self._filter_section(await self._aread_section(section_name), attr_names)
+
+    async def ais_section_exist(self, section_name: str) -> bool:
+        """
+        Check if section exist in configuration without blocking event loop
+        :param section_name: Name of config section
+        :return: Check result
+        """
+        from hvac.exceptions import InvalidPath
+
+        success = False
+        try:
+            await self._aread_section(section_name)
+            success = True
+        except InvalidPath:
+            pass
+        return success
+
+    async def ais_attr_exist(self, section_name: str, attr_name: str) -> bool:
+        """
+        Check if attribute exist in given section without blocking event loop
+        :param section_name: Name of config section
+        :param attr_name: Name of attribute in section
+        :return: Check result
+        """
+        from hvac.exceptions import InvalidPath
+
+        success = False
+        try:
+            success = _canonical(attr_name) in await self._aread_section(section_name)
+        except InvalidPath:
+            pass
+        return success
@@ -1,9 +1,22 @@
+import functools
+import inspect
 import typing
 
+from array import array
+
+from .connectors import _canonical
+from .lists import CONVERTERS, TYPECODES, LazyList, parse_array, readonly_view, to_bool, tokenize
+
+# Started AccessProfiler, it is set and reset by profiler itself
+_profiler: typing.Optional[typing.Any] = None
+
 
 class Field:
     """Field prototype class"""
 
+    __slots__ = ('default', 'null', 'env_override', 'section', 'name', 'value', 'meta', 'connector',
+                 'section_key', 'attr_key', 'env_key', '_cast_cache')
+
     def __init__(self,
                  default: typing.Optional[typing.Any] = None,
                  null: bool = False,
@@ -17,27 +30,94 @@ class Field:
         self.value: typing.Optional[typing.Any] = None
 
         self.meta: typing.Optional[typing.Any] = None
+        self.connector: typing.Optional[typing.Any] = None
+        self.section_key: typing.Optional[str] = None
+        self.attr_key: typing.Optional[str] = None
+        self.env_key: typing.Optional[str] = None
+        self._cast_cache: typing.Optional[typing.Tuple[str, typing.Any]] = None
 
     def __get__(self, instance: typing.Any, owner: typing.Any) -> typing.Any:
-        value = self.meta.connector.get_value(
-            section_name=self.section.meta.name,
-            attr_name=self.name,
-            env_override=self.env_override
-        )
+        if _profiler is not None:
+            _profiler.record(self)
+        value = None
+        if self.env_override:
+            value = self.meta.env.get(self.name)
+        if value is None:
+            value = self.connector.get_value(section_name=self.section_key, attr_name=self.attr_key)
+        return self.resolve(value)
+
+    async def aget(self) -> typing.Any:
+        """
+        Reads field value without blocking event loop. Connectors without asynchronous interface are called
+        in default executor.
+        :return: field value
+        """
+        if _profiler is not None:
+            _profiler.record(self, depth=3)
+        value = self.meta.env.get(self.name) if self.env_override else None
+        if value is not None:
+            return self.resolve(value)
+
+        connector = self.connector
+        kwargs = dict(section_name=self.section_key, attr_name=self.attr_key)
+        if inspect.iscoroutinefunction(getattr(connector, 'aget_value', None)):
+            value = await connector.aget_value(**kwargs)
+        else:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            value = await loop.run_in_executor(None, functools.partial(connector.get_value, **kwargs))
+        return self.resolve(value)
+
+    def extract(self, values: typing.Mapping[str, typing.Optional[str]]) -> typing.Any:
+        """
+        Takes field value from values of the whole section, read with connector get_section
+        :param values: section values by canonical attribute names
+        :return: field value
+        """
+        value = None
+        if self.env_override:
+            value = self.meta.env.get(self.name)
+        if value is None:
+            value = values.get(self.attr_key)
+        return self.resolve(value)
+
+    def resolve(self, value: typing.Optional[typing.Any]) -> typing.Any:
+        """
+        Turns value read from connector into field value, applying default and casting it to field type
+        :param value: value read from connector
+        :return: field value
+        """
         if value is None and self.default is not None:
             return self.default
         if value is None and self.null is True:
             return None
-        return self.cast_value(value) if self.check_value(value) is False else value
+        if self.check_value(value) is True:
+            return value
+        if not isinstance(value, str):
+            return self.cast_value(value)
+
+        cached = self._cast_cache
+        if cached is None or cached[0] != value:
+            cached = self._cast_cache = (value, self.cast_value(value))
+        return self.copy_value(cached[1])
+
+    def copy_value(self, value: typing.Any) -> typing.Any:
+        """
+        Returns value that is safe to give away from cast cache. Immutable values are returned as is.
+        :param value: cached cast result
+        :return: processed value
+        """
+        return value
 
     def __set__(self, instance: typing.Any, value: str) -> None:
         if value is None:
             if self.null is False:
                 raise ValueError('None value passed into non null Field')
             else:
-                self.meta.connector.set_value(section_name=self.section.meta.name, attr_name=self.name, value=value)
+                self.connector.set_value(section_name=self.section.meta.name, attr_name=self.name, value=value)
         elif self.check_value(value) is True:
-            self.meta.connector.set_value(section_name=self.section.meta.name, attr_name=self.name, value=value)
+            self.connector.set_value(section_name=self.section.meta.name, attr_name=self.name, value=value)
         else:
             raise TypeError('Incorrect type passed into Field')
 
@@ -58,15 +138,25 @@ class Field:
         pass
 
     def bind(self, section: typing.Any, name: typing.Any, meta: typing.Any) -> None:
-        """Binds field instance to Section"""
+        """
+        Binds field instance to Section and precomputes everything attribute access needs: connector, canonical
+        section and attribute names and environment variable key, prefixed with env_prefix of section if it is set
+        """
         self.section = section
         self.name = name
         self.meta = meta
+        self.connector = meta.connector
+        self.section_key = _canonical(meta.name)
+        self.attr_key = _canonical(name)
+        prefix = meta.env_prefix.rstrip('_')
+        self.env_key = (f'{prefix}_{meta.name}_{name}' if prefix else f'{meta.name}_{name}').upper()
 
 
 class IntegerField(Field):
     """Field class for integer values"""
 
+    __slots__ = ()
+
     def __init__(self, default: int = None, null: bool = False, env_override: bool = False) -> None:
         super().__init__(default=default, null=null, env_override=env_override)
 
@@ -90,6 +180,8 @@ class IntegerField(Field):
 class StringField(Field):
     """Field class for string values"""
 
+    __slots__ = ()
+
     def __init__(self, default: str = None, null: bool = False, env_override: bool = False) -> None:
         super().__init__(default=default, null=null, env_override=env_override)
 
@@ -113,6 +205,8 @@ class StringField(Field):
 class FloatField(Field):
     """Field class for float values"""
 
+    __slots__ = ()
+
     def __init__(self, default: float = None, null: bool = False, env_override: bool = False) -> None:
         super().__init__(default=default, null=null, env_override=env_override)
 
@@ -136,6 +230,8 @@ class FloatField(Field):
 class BooleanField(Field):
     """Field class for boolean values"""
 
+    __slots__ = ()
+
     def __init__(self, default: bool = None, null: bool = False, env_override: bool = False) -> None:
         super().__init__(default=default, null=null, env_override=env_override)
 
@@ -145,12 +241,7 @@ class BooleanField(Field):
         :param value: value to cast
         :return: processed value
         """
-        if value.lower() in ['true', '1']:
-            return True
-        elif value.lower() in ['false', '0']:
-            return False
-        else:
-            return bool(value)
+        return to_bool(value)
 
     def check_value(self, value: typing.Any) -> bool:
         """
@@ -162,14 +253,50 @@ class BooleanField(Field):
 
 
 class ListField(Field):
-    """Field class for list of values"""
+    """
+    Field class for list of values. Numeric lists may be returned in compact form: container 'array' gives
+    array.array and container 'memoryview' gives read-only memoryview of it. Container 'lazy' gives read-only
+    LazyList that converts elements on access, with member_set it checks membership with set of elements.
+    """
+
+    __slots__ = ('type', 'copy', 'container', 'member_set', '_convert')
 
-    def __init__(self, var_type: type, default: list = None, null: bool = False, env_override: bool = False) -> None:
+    containers = ('list', 'array', 'memoryview', 'lazy')
+
+    def __init__(self,
+                 var_type: type,
+                 default: list = None,
+                 null: bool = False,
+                 env_override: bool = False,
+                 copy: bool = True,
+                 container: str = 'list',
+                 member_set: bool = False
+                 ) -> None:
         self.type = var_type
+        self.copy = copy
+        self.container = container
+        self.member_set = member_set
         super().__init__(default=default, null=null, env_override=env_override)
 
-        if self.type not in [int, str, float, bool]:
+        if self.type not in CONVERTERS:
             raise Exception('Unknown base type %s passed into ListField' % str(self.type))
+        if self.container not in self.containers:
+            raise Exception('Unknown container %s passed into ListField' % self.container)
+        if self.container in ('array', 'memoryview') and self.type not in TYPECODES:
+            raise Exception('Container %s supports only int and float values' % self.container)
+        if self.member_set and self.container != 'lazy':
+            raise Exception('Member set is supported only by lazy container')
+        self._convert = CONVERTERS[self.type]
+
+    def _parse_array(self, value: str) -> array:
+        """Parses value into array, elements that do not fit into array items are reported as invalid value"""
+        try:
+            return parse_array(value, self.type)
+        except OverflowError as error:
+            raise ValueError(
+                f'{self.section.__name__}.{self.name} element does not fit into array of type '
+                f'{TYPECODES[self.type]!r}: {error}'
+            ) from error
 
     def cast_value(self, value: str) -> typing.Any:
         """
@@ -177,22 +304,15 @@ class ListField(Field):
         :param value: value to cast
         :return: processed value
         """
-        result: typing.List[typing.Any] = []
-        for element in value.replace('[', '').replace(']', '').split(','):
-            if self.type == int:
-                result.append(int(element.strip()))
-            elif self.type == str:
-                result.append(element.strip().replace("'", ''))
-            elif self.type == float:
-                result.append(float(element.strip()))
-            elif self.type == bool:
-                if element.strip().lower() in ['true', '1']:
-                    result.append(True)
-                elif element.strip().lower() in ['false', '0']:
-                    result.append(False)
-                else:
-                    result.append(bool(element.strip()))
-        return result
+        if self.container == 'array':
+            return self._parse_array(value)
+        if self.container == 'memoryview':
+            return readonly_view(self._parse_array(value))
+        if self.container == 'lazy':
+            return LazyList(value, self._convert, member_set=self.member_set)
+
+        tokens = tokenize(value)
+        return tokens if self.type is str else list(map(self._convert, tokens))
 
     def check_value(self, value: typing.Any) -> bool:
         """
@@ -201,3 +321,14 @@ class ListField(Field):
         :return: check result
         """
         return isinstance(value, list) and all(isinstance(n, self.type) for n in value)
+
+    def copy_value(self, value: typing.Any) -> typing.Any:
+        """
+        Returns value that is safe to give away from cast cache. Cached list or array is copied unless copy
+        is disabled, read-only memoryview and LazyList are always shared.
+        :param value: cached cast result
+        :return: processed value
+        """
+        if self.copy is False or isinstance(value, (memoryview, LazyList)):
+            return value
+        return value[:] if isinstance(value, array) else list(value)
@@ -0,0 +1,346 @@
+import bisect
+import functools
+import inspect
+import logging
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+# Connector methods which calls are recorded, asynchronous ones are wrapped only if connector has them
+INSTRUMENTED_METHODS = (
+    'is_config_exist',
+    'create_config',
+    'get_value',
+    'get_section',
+    'set_value',
+    'is_section_exist',
+    'is_attr_exist',
+    'add_section',
+    'add_attr',
+    'aget_value',
+    'aget_section',
+    'ais_section_exist',
+    'ais_attr_exist',
+)
+
+# Upper bounds of latency histogram buckets, in seconds
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, float('inf'))
+
+
+class InstrumentationHook(object):
+    """
+    Base class of hooks that bridge connector events to external metrics systems. Subclasses override methods
+    of events they are interested in. Hooks are called synchronously in thread that made the call, their errors
+    are logged and do not affect connector.
+    """
+
+    def pre_call(self, connector: typing.Any, method: str, section_name: typing.Optional[str]) -> None:
+        """
+        Called before connector method
+        :param connector: instrumented connector
+        :param method: name of called method
+        :param section_name: canonical name of section or None if method is not related to section
+        :return: Nothing
+        """
+        pass
+
+    def post_call(self,
+                  connector: typing.Any,
+                  method: str,
+                  section_name: typing.Optional[str],
+                  elapsed: float,
+                  error: typing.Optional[BaseException]
+                  ) -> None:
+        """
+        Called after connector method returned or raised exception
+        :param connector: instrumented connector
+        :param method: name of called method
+        :param section_name: canonical name of section or None if method is not related to section
+        :param elapsed: call duration in seconds
+        :param error: exception raised by method or None
+        :return: Nothing
+        """
+        pass
+
+    def on_cache(self, connector: typing.Any, section_name: typing.Optional[str], hit: bool) -> None:
+        """
+        Called on lookup in connector cache
+        :param connector: instrumented connector
+        :param section_name: canonical name of section or None if cache holds whole config
+        :param hit: True if cached data was used
+        :return: Nothing
+        """
+        pass
+
+    def on_read(self, connector: typing.Any, section_name: typing.Optional[str], size: int) -> None:
+        """
+        Called after connector read data from its source
+        :param connector: instrumented connector
+        :param section_name: canonical name of section or None if whole config was read
+        :param size: number of bytes read
+        :return: Nothing
+        """
+        pass
+
+
+class CallStats(object):
+    """Number of calls, errors and latency histogram of connector method"""
+
+    __slots__ = ('calls', 'errors', 'total_time', 'max_time', 'buckets')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+    def add(self, elapsed: float, error: bool) -> None:
+        """
+        Records a call
+        :param elapsed: call duration in seconds
+        :param error: True if call raised exception
+        :return: Nothing
+        """
+        self.calls += 1
+        self.errors += error
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    def merge(self, other: 'CallStats') -> None:
+        """
+        Adds calls recorded by other stats
+        :param other: stats to add
+        :return: Nothing
+        """
+        self.calls += other.calls
+        self.errors += other.errors
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.buckets = [own + added for own, added in zip(self.buckets, other.buckets)]
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        """Returns stats as plain dictionary, histogram maps bucket upper bound to number of calls"""
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_time': self.total_time,
+            'mean_time': self.total_time / self.calls if self.calls else 0.0,
+            'max_time': self.max_time,
+            'histogram': dict(zip(LATENCY_BUCKETS, self.buckets)),
+        }
+
+
+class Instrumentation(object):
+    """
+    Thread safe recorder of connector calls, cache lookups and reads, broken down by method and section.
+    Recorded events are passed to hooks as well.
+    """
+
+    def __init__(self,
+                 hooks: typing.Iterable[InstrumentationHook] = (),
+                 normalize: typing.Callable[[str], str] = str,
+                 timer: typing.Callable[[], float] = time.perf_counter
+                 ) -> None:
+        """
+        :param hooks: hooks to call on events
+        :param normalize: function that converts section names into the form they are grouped by
+        :param timer: clock for call durations
+        """
+        self.hooks: typing.List[InstrumentationHook] = list(hooks)
+        self.normalize = normalize
+        self.timer = timer
+
+        self._lock = threading.Lock()
+        self._calls: typing.Dict[typing.Tuple[str, typing.Optional[str]], CallStats] = {}
+        self._cache: typing.Dict[typing.Optional[str], typing.List[int]] = {}
+        self._bytes_read: typing.Dict[typing.Optional[str], int] = {}
+
+    def add_hook(self, hook: InstrumentationHook) -> None:
+        """
+        Adds hook
+        :param hook: hook to call on events
+        :return: Nothing
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: InstrumentationHook) -> None:
+        """
+        Removes hook
+        :param hook: previously added hook
+        :return: Nothing
+        """
+        self.hooks.remove(hook)
+
+    def _call_hooks(self, event: str, *args: typing.Any) -> None:
+        """Calls event method of every hook, errors are logged"""
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(*args)
+            except Exception as error:
+                logger.warning('Instrumentation hook %r failed on %s: %r', hook, event, error)
+
+    def _section(self,
+                 args: typing.Tuple[typing.Any, ...],
+                 kwargs: typing.Dict[str, typing.Any]
+                 ) -> typing.Optional[str]:
+        """Returns normalized section name of connector method call"""
+        section_name = kwargs.get('section_name', args[0] if args else None)
+        return self.normalize(section_name) if isinstance(section_name, str) else None
+
+    def wrap(self, connector: typing.Any, name: str, method: typing.Callable) -> typing.Callable:
+        """
+        Wraps connector method, so that its calls are recorded
+        :param connector: connector the method is bound to
+        :param name: method name
+        :param method: bound method
+        :return: wrapped method, coroutine function if method is a coroutine function
+        """
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+                section_name = self._section(args, kwargs)
+                self.pre_call(connector, name, section_name)
+                start, error = self.timer(), None
+                try:
+                    return await method(*args, **kwargs)
+                except BaseException as exception:
+                    error = exception
+                    raise
+                finally:
+                    self.record_call(connector, name, section_name, self.timer() - start, error)
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            section_name = self._section(args, kwargs)
+            self.pre_call(connector, name, section_name)
+            start, error = self.timer(), None
+            try:
+                return method(*args, **kwargs)
+            except BaseException as exception:
+                error = exception
+                raise
+            finally:
+                self.record_call(connector, name, section_name, self.timer() - start, error)
+        return wrapper
+
+    def pre_call(self, connector: typing.Any, method: str, section_name: typing.Optional[str]) -> None:
+        """
+        Passes start of connector method call to hooks
+        :param connector: instrumented connector
+        :param method: name of called method
+        :param section_name: normalized name of section or None
+        :return: Nothing
+        """
+        if self.hooks:
+            self._call_hooks('pre_call', connector, method, section_name)
+
+    def record_call(self,
+                    connector: typing.Any,
+                    method: str,
+                    section_name: typing.Optional[str],
+                    elapsed: float,
+                    error: typing.Optional[BaseException] = None
+                    ) -> None:
+        """
+        Records finished connector method call
+        :param connector: instrumented connector
+        :param method: name of called method
+        :param section_name: normalized name of section or None
+        :param elapsed: call duration in seconds
+        :param error: exception raised by method or None
+        :return: Nothing
+        """
+        with self._lock:
+            stats = self._calls.get((method, section_name))
+            if stats is None:
+                stats = self._calls[(method, section_name)] = CallStats()
+            stats.add(elapsed, error is not None)
+        if self.hooks:
+            self._call_hooks('post_call', connector, method, section_name, elapsed, error)
+
+    def record_cache(self, connector: typing.Any, section_name: typing.Optional[str], hit: bool) -> None:
+        """
+        Records lookup in connector cache
+        :param connector: instrumented connector
+        :param section_name: name of section or None if cache holds whole config
+        :param hit: True if cached data was used
+        :return: Nothing
+        """
+        if section_name is not None:
+            section_name = self.normalize(section_name)
+        with self._lock:
+            counters = self._cache.get(section_name)
+            if counters is None:
+                counters = self._cache[section_name] = [0, 0]
+            counters[0 if hit else 1] += 1
+        if self.hooks:
+            self._call_hooks('on_cache', connector, section_name, hit)
+
+    def record_read(self, connector: typing.Any, section_name: typing.Optional[str], size: int) -> None:
+        """
+        Records data read from connector source
+        :param connector: instrumented connector
+        :param section_name: name of section or None if whole config was read
+        :param size: number of bytes read
+        :return: Nothing
+        """
+        if section_name is not None:
+            section_name = self.normalize(section_name)
+        with self._lock:
+            self._bytes_read[section_name] = self._bytes_read.get(section_name, 0) + size
+        if self.hooks:
+            self._call_hooks('on_read', connector, section_name, size)
+
+    def reset(self) -> None:
+        """
+        Drops recorded stats
+        :return: Nothing
+        """
+        with self._lock:
+            self._calls.clear()
+            self._cache.clear()
+            self._bytes_read.clear()
+
+    def stats(self) -> typing.Dict[str, typing.Any]:
+        """
+        Returns recorded stats. Totals include events not related to any section, which are not listed in
+        per section breakdown.
+        :return: dictionary with keys:
+            methods - call stats of every method over all sections,
+            sections - call stats of methods by section,
+            cache - total hits and misses and their numbers by section,
+            bytes_read - total number of bytes read and numbers by section
+        """
+        with self._lock:
+            calls = list(self._calls.items())
+            cache = {section: list(counters) for section, counters in self._cache.items()}
+            bytes_read = dict(self._bytes_read)
+
+        methods: typing.Dict[str, CallStats] = {}
+        sections: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for (method, section_name), stats in calls:
+            methods.setdefault(method, CallStats()).merge(stats)
+            if section_name is not None:
+                sections.setdefault(section_name, {})[method] = stats.as_dict()
+
+        return {
+            'methods': {method: stats.as_dict() for method, stats in methods.items()},
+            'sections': sections,
+            'cache': {
+                'hits': sum(hits for hits, _ in cache.values()),
+                'misses': sum(misses for _, misses in cache.values()),
+                'sections': {
+                    section: {'hits': hits, 'misses': misses}
+                    for section, (hits, misses) in cache.items() if section is not None
+                },
+            },
+            'bytes_read': {
+                'total': sum(bytes_read.values()),
+                'sections': {section: size for section, size in bytes_read.items() if section is not None},
+            },
+        }
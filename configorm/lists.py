@@ -0,0 +1,245 @@
+import itertools
+import json
+import re
+import sys
+import typing
+from array import array
+from collections.abc import Sequence
+
+_TOKEN = re.compile(r'''
+    \s*
+    (?:
+        '((?:[^'\\]|\\.)*)'     # single quoted element
+      | "((?:[^"\\]|\\.)*)"     # double quoted element
+      | ([^,]*?)                # bare element
+    )
+    \s*
+    (,|\Z)                      # separator or end of list
+''', re.VERBOSE | re.DOTALL)
+
+_ESCAPE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', '0': '\0'}
+
+
+def to_bool(value: str) -> bool:
+    """
+    Converts string into boolean, treating 'true' and '1' as True, 'false' and '0' as False
+    :param value: value to convert
+    :return: converted value
+    """
+    lowered = value.lower()
+    if lowered in ('true', '1'):
+        return True
+    if lowered in ('false', '0'):
+        return False
+    return bool(value)
+
+
+CONVERTERS: typing.Dict[type, typing.Callable[[str], typing.Any]] = {
+    int: int,
+    float: float,
+    str: str,
+    bool: to_bool,
+}
+
+
+def _unescape(token: str) -> str:
+    """Replaces backslash escape sequences of quoted element"""
+    if '\\' not in token:
+        return token
+    return _ESCAPE.sub(lambda match: _ESCAPES.get(match.group(1), match.group(1)), token)
+
+
+def _split_quoted(text: str) -> typing.Optional[typing.List[str]]:
+    """
+    Fast path for lists where every element is quoted and there are no escapes, such as str() of list of strings.
+    Quote can not appear inside element quoted with the same character without escape, so if all parts between
+    commas are quoted, no element contains comma.
+    :param text: list elements in string format
+    :return: list of elements or None if text has other format
+    """
+    parts = [part.strip() for part in text.split(',')]
+    for part in parts:
+        if len(part) < 2 or part[0] != part[-1] or part[0] not in '"\'':
+            return None
+    return [part[1:-1] for part in parts]
+
+
+def strip_brackets(value: str) -> str:
+    """
+    Removes whitespace and enclosing square brackets around list
+    :param value: list in string format
+    :return: list elements in string format
+    """
+    text = value.strip()
+    if text[:1] == '[' and text[-1:] == ']':
+        text = text[1:-1]
+    return text
+
+
+def tokenize(value: str) -> typing.List[str]:
+    """
+    Splits list in string format, e.g. "['a', 'b']", "[1, 2]" or "a, b", into elements in a single pass.
+    Elements may be quoted with single or double quotes, quoted elements keep commas and whitespace and
+    support backslash escapes. Whitespace around elements is stripped.
+    :param value: list in string format
+    :return: list of elements in string format
+    """
+    text = strip_brackets(value)
+    if not text or text.isspace():
+        return []
+    if '"' not in text and "'" not in text:
+        return [token.strip() for token in text.split(',')]
+    if '\\' not in text:
+        tokens = _split_quoted(text)
+        if tokens is not None:
+            return tokens
+
+    tokens = []
+    position = 0
+    while True:
+        match = _TOKEN.match(text, position)
+        single, double, bare, separator = match.groups()
+        if single is not None:
+            tokens.append(_unescape(single))
+        elif double is not None:
+            tokens.append(_unescape(double))
+        else:
+            tokens.append(bare)
+        if not separator:
+            return tokens
+        position = match.end()
+
+
+TYPECODES: typing.Dict[type, str] = {
+    int: 'q',
+    float: 'd',
+}
+
+
+def parse_array(value: str, var_type: type) -> array:
+    """
+    Parses list of numbers into compact array. Plain lists are parsed with a single call of C JSON decoder,
+    other formats fall back to tokenizer.
+    :param value: list in string format
+    :param var_type: type of elements, int or float
+    :return: array of elements
+    """
+    typecode = TYPECODES[var_type]
+    text = strip_brackets(value)
+    # JSON true and false would be stored as 1 and 0, such lists are left to tokenizer which rejects them
+    if '"' not in text and "'" not in text and 'true' not in text and 'false' not in text:
+        try:
+            return array(typecode, json.loads(f'[{text}]'))
+        except (ValueError, TypeError, OverflowError):
+            pass
+    return array(typecode, map(var_type, tokenize(value)))
+
+
+def readonly_view(values: array) -> memoryview:
+    """
+    Makes read-only memoryview over copy of array data
+    :param values: array to view
+    :return: memoryview with the same format as array
+    """
+    view: typing.Any = memoryview(values.tobytes())
+    return view.cast(values.typecode)
+
+
+def _token_spans(text: str) -> typing.Tuple[array, array, typing.Optional[array]]:
+    """
+    Finds element boundaries of list in string format without extracting elements
+    :param text: list elements in string format
+    :return: start and end offsets of elements and flags of quoted elements, flags are None if list has no quotes
+    """
+    starts, ends = array('q'), array('q')
+    if not text or text.isspace():
+        return starts, ends, None
+
+    if '"' not in text and "'" not in text:
+        # offset after separator that follows each element, the last one is past the end of text
+        bounds = array('q', itertools.accumulate(len(part) + 1 for part in text.split(',')))
+        starts.append(0)
+        starts.extend(bounds[:-1])
+        ends.extend(bound - 1 for bound in bounds)
+        return starts, ends, None
+
+    quoted = array('b')
+    position = 0
+    while True:
+        match = _TOKEN.match(text, position)
+        group = 1 if match.start(1) >= 0 else 2 if match.start(2) >= 0 else 3
+        starts.append(match.start(group))
+        ends.append(match.end(group))
+        quoted.append(group != 3)
+        if not match.group(4):
+            return starts, ends, quoted
+        position = match.end()
+
+
+class LazyList(Sequence):
+    """
+    Read-only sequence over list in string format. Element boundaries are indexed once, elements are converted
+    on every access. With member_set membership checks use set of all elements, built on the first check.
+    """
+
+    __slots__ = ('_text', '_convert', '_starts', '_ends', '_quoted', '_member_set', '_members')
+
+    def __init__(self,
+                 value: str,
+                 convert: typing.Callable[[str], typing.Any] = str,
+                 member_set: bool = False
+                 ) -> None:
+        self._text = strip_brackets(value)
+        self._convert = convert
+        self._starts, self._ends, self._quoted = _token_spans(self._text)
+        self._member_set = member_set
+        self._members: typing.Optional[typing.FrozenSet[typing.Any]] = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def _element(self, index: int) -> typing.Any:
+        """Extracts and converts element by non-negative index"""
+        token = self._text[self._starts[index]:self._ends[index]]
+        if self._quoted is not None and self._quoted[index]:
+            token = _unescape(token)
+        else:
+            token = token.strip()
+        return self._convert(token)
+
+    def __getitem__(self, index: typing.Union[int, slice]) -> typing.Any:
+        if isinstance(index, slice):
+            return [self._element(position) for position in range(len(self))[index]]
+        try:
+            return self._element(range(len(self))[index])
+        except IndexError:
+            raise IndexError('LazyList index out of range') from None
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        for index in range(len(self)):
+            yield self._element(index)
+
+    def __contains__(self, value: typing.Any) -> bool:
+        if not self._member_set:
+            return any(element == value for element in self)
+        if self._members is None:
+            self._members = frozenset(self)
+        try:
+            return value in self._members
+        except TypeError:
+            return False
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __sizeof__(self) -> int:
+        indexes = (self._text, self._starts, self._ends, self._quoted)
+        return object.__sizeof__(self) + sum(sys.getsizeof(index) for index in indexes if index is not None)
+
+    def __repr__(self) -> str:
+        return f'<LazyList of {len(self)} elements>'
@@ -0,0 +1,131 @@
+import io
+import locale
+import logging
+import marshal
+import os
+import typing
+from configparser import ConfigParser, SectionProxy
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = '__configcache__'
+FORMAT_VERSION = 1
+
+
+def sidecar_path(path: str, cache_dir: typing.Optional[str] = None) -> str:
+    """
+    Returns path of parse cache file for config
+    :param path: path to config file
+    :param cache_dir: directory for cache files, __configcache__ directory next to config is used if it is not set
+    :return: path to cache file
+    """
+    import hashlib
+
+    path = os.path.realpath(path)
+    directory = cache_dir if cache_dir is not None else os.path.join(os.path.dirname(path), CACHE_DIR)
+    tag = hashlib.blake2b(path.encode(), digest_size=4).hexdigest()
+    return os.path.join(directory, f'{os.path.basename(path)}.{tag}.marshal')
+
+
+def _digest(content: bytes) -> bytes:
+    """Returns hash of config content"""
+    import hashlib
+
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def _parse(content: bytes, source: str) -> ConfigParser:
+    """Parses config content the same way as ConfigParser.read does"""
+    config = ConfigParser(allow_no_value=True)
+    with io.TextIOWrapper(io.BytesIO(content), encoding=locale.getpreferredencoding(False)) as file:
+        config.read_file(file, source=source)
+    return config
+
+
+def _has_storage(config: ConfigParser) -> bool:
+    """Checks that parser keeps its data in private attributes cache relies on, they are not public API"""
+    return all(isinstance(getattr(config, name, None), dict) for name in ('_defaults', '_sections', '_proxies'))
+
+
+def _restore(entry: typing.Dict[str, typing.Any]) -> ConfigParser:
+    """Creates parser with data stored in cache entry"""
+    config: typing.Any = ConfigParser(allow_no_value=True)
+    if not _has_storage(config):
+        config.read_dict({config.default_section: entry['defaults'], **entry['sections']})
+        return config
+
+    # Stored data is already parsed and normalized, so it is put into parser storage directly: read_dict would
+    # validate and transform every value again, which takes most of parsing time.
+    config._defaults.update(entry['defaults'])
+    for section, options in entry['sections'].items():
+        config._sections[section] = options
+        config._proxies[section] = SectionProxy(config, section)
+    return config
+
+
+def _load_entry(path: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """Reads cache file, returns None if it is missing or damaged"""
+    try:
+        with open(path, 'rb') as file:
+            entry = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(entry, dict) or entry.get('version') != FORMAT_VERSION:
+        return None
+    return entry
+
+
+def _store_entry(path: str, entry: typing.Dict[str, typing.Any]) -> None:
+    """Atomically writes cache file, errors are ignored as cache is optional"""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=f'.{os.path.basename(path)}.')
+        try:
+            with os.fdopen(fd, mode='wb') as file:
+                marshal.dump(entry, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    except OSError as error:
+        logger.debug('Can not write parse cache %s: %r', path, error)
+
+
+def read_config(path: str, cache_dir: typing.Optional[str] = None) -> ConfigParser:
+    """
+    Reads config using parse cache. Cache entry is used only if path, size, modification time and content hash
+    of config match ones it was created for, otherwise config is parsed and cache entry is written again.
+    :param path: path to config file
+    :param cache_dir: directory for cache files, __configcache__ directory next to config is used if it is not set
+    :return: parsed config, empty if file is missing
+    """
+    source = os.path.realpath(path)
+    try:
+        with open(source, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            content = file.read()
+    except OSError:
+        return ConfigParser(allow_no_value=True)
+
+    key = {
+        'version': FORMAT_VERSION,
+        'path': source,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'digest': _digest(content),
+    }
+    cache_path = sidecar_path(source, cache_dir)
+    entry = _load_entry(cache_path)
+    if entry is not None and all(entry.get(name) == value for name, value in key.items()):
+        return _restore(entry)
+
+    config: typing.Any = _parse(content, source)
+    if not _has_storage(config):
+        # own options of sections can not be told apart from defaults through public API
+        return config
+    key['defaults'] = dict(config._defaults)
+    key['sections'] = {name: dict(options) for name, options in config._sections.items()}
+    _store_entry(cache_path, key)
+    return config
@@ -0,0 +1,275 @@
+import atexit
+import collections
+import json
+import os
+import sys
+import threading
+import time
+import typing
+
+from . import fields
+
+# Environment variable that starts profiling on import: "1" prints report into stderr on exit, any other value
+# is a path of file to write JSON report to
+PROFILE_ENV = 'CONFIGORM_PROFILE'
+
+
+class FieldProfile(object):
+    """Reads of a single field: number, call sites and timestamps of the latest reads"""
+
+    __slots__ = ('section_name', 'field_name', 'reads', 'call_sites', 'timestamps')
+
+    def __init__(self, section_name: str, field_name: str, max_samples: int) -> None:
+        self.section_name = section_name
+        self.field_name = field_name
+        self.reads = 0
+        self.call_sites: typing.Counter[str] = collections.Counter()
+        self.timestamps: typing.Deque[float] = collections.deque(maxlen=max_samples)
+
+
+def _hit_rate(timestamps: typing.Sequence[float], ttl: float) -> float:
+    """
+    Simulates cache that requests data on miss and keeps it for ttl seconds
+    :param timestamps: sorted read times
+    :param ttl: cache time to live
+    :return: fraction of reads served from cache
+    """
+    hits, expires_at = 0, None
+    for timestamp in timestamps:
+        if expires_at is not None and timestamp < expires_at:
+            hits += 1
+        else:
+            expires_at = timestamp + ttl
+    return hits / len(timestamps)
+
+
+def recommend_ttl(timestamps: typing.Sequence[float], target_hit_rate: float) -> typing.Optional[float]:
+    """
+    Finds the shortest cache time to live that gives target hit rate for given reads
+    :param timestamps: sorted read times
+    :param target_hit_rate: required fraction of reads served from cache
+    :return: time to live in seconds or None if target is not reachable, as the first read is always a miss
+    """
+    if len(timestamps) < 2 or (len(timestamps) - 1) / len(timestamps) < target_hit_rate:
+        return None
+
+    low, high = 0.0, timestamps[-1] - timestamps[0] + 1e-6
+    for _ in range(50):
+        middle = (low + high) / 2
+        if _hit_rate(timestamps, middle) >= target_hit_rate:
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+class AccessProfiler(object):
+    """
+    Records reads of section fields made through attribute access while it is started: how often every field
+    is read, from which call sites and with what inter-arrival times. Report built from recorded reads lists hot
+    fields worth keeping in snapshot, sections worth preloading and cache TTLs that give target hit rate.
+    Only one profiler may be started at a time. Fields check for started profiler with a single global lookup,
+    so nothing is recorded and almost nothing is spent while profiler is stopped.
+    """
+
+    def __init__(self,
+                 max_samples: int = 10000,
+                 call_sites: bool = True,
+                 timer: typing.Callable[[], float] = time.monotonic
+                 ) -> None:
+        """
+        :param max_samples: number of the latest read timestamps kept for every field
+        :param call_sites: whether call sites of reads are recorded
+        :param timer: clock for read timestamps
+        """
+        self.max_samples = max_samples
+        self.call_sites = call_sites
+        self.timer = timer
+        self.started_at: typing.Optional[float] = None
+        self.stopped_at: typing.Optional[float] = None
+
+        self._fields: typing.Dict[typing.Tuple[str, str], FieldProfile] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'AccessProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *args: typing.Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Starts recording field reads
+        :return: Nothing
+        """
+        if fields._profiler is not None and fields._profiler is not self:
+            raise RuntimeError('Another access profiler is already started')
+        self.started_at = self.timer()
+        self.stopped_at = None
+        fields._profiler = self
+
+    def stop(self) -> None:
+        """
+        Stops recording field reads, recorded data is kept for report
+        :return: Nothing
+        """
+        if fields._profiler is self:
+            fields._profiler = None
+            self.stopped_at = self.timer()
+
+    def record(self, field: typing.Any, depth: int = 2) -> None:
+        """
+        Records field read, called by field on attribute access
+        :param field: field that is read
+        :param depth: number of frames between this method and code that reads field
+        :return: Nothing
+        """
+        timestamp = self.timer()
+        call_site = None
+        if self.call_sites:
+            frame = sys._getframe(depth)
+            call_site = f'{frame.f_code.co_filename}:{frame.f_lineno}'
+
+        key = (field.section.__name__, field.name)
+        with self._lock:
+            profile = self._fields.get(key)
+            if profile is None:
+                profile = self._fields[key] = FieldProfile(key[0], key[1], max_samples=self.max_samples)
+            profile.reads += 1
+            profile.timestamps.append(timestamp)
+            if call_site is not None:
+                profile.call_sites[call_site] += 1
+
+    def reset(self) -> None:
+        """
+        Drops recorded reads
+        :return: Nothing
+        """
+        with self._lock:
+            self._fields.clear()
+            self.started_at = self.timer() if fields._profiler is self else None
+
+    @property
+    def duration(self) -> float:
+        """Profiling time in seconds"""
+        if self.started_at is None:
+            return 0.0
+        return (self.stopped_at if self.stopped_at is not None else self.timer()) - self.started_at
+
+    def report(self,
+               hot_rate: float = 1.0,
+               preload_fields: int = 2,
+               target_hit_rate: float = 0.9,
+               top_call_sites: int = 3
+               ) -> typing.Dict[str, typing.Any]:
+        """
+        Builds report of recorded reads
+        :param hot_rate: reads per second that make field hot
+        :param preload_fields: number of distinct fields read that makes section worth preloading
+        :param target_hit_rate: cache hit rate TTLs are recommended for
+        :param top_call_sites: number of the most frequent call sites listed for every field
+        :return: dictionary with keys:
+            duration - profiling time in seconds,
+            reads - total number of reads,
+            fields - stats of every field read, the most read first, read rate is None if profiling took no time,
+            hot_fields - fields read at least hot_rate times per second, they should be kept in snapshot,
+            preload_sections - sections with at least preload_fields distinct fields read,
+            ttls - shortest cache TTL by section that gives target hit rate, None if it is not reachable
+        """
+        with self._lock:
+            profiles = [
+                (profile.section_name, profile.field_name, profile.reads,
+                 profile.call_sites.most_common(top_call_sites), list(profile.timestamps))
+                for profile in self._fields.values()
+            ]
+        duration = self.duration
+
+        field_stats: typing.List[typing.Dict[str, typing.Any]] = []
+        sections: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        for section_name, field_name, reads, call_sites, timestamps in sorted(profiles, key=lambda item: -item[2]):
+            intervals = [current - previous for previous, current in zip(timestamps, timestamps[1:])]
+            field_stats.append({
+                'section': section_name,
+                'field': field_name,
+                'reads': reads,
+                'rate': reads / duration if duration > 0 else None,
+                'mean_interval': sum(intervals) / len(intervals) if intervals else None,
+                'min_interval': min(intervals) if intervals else None,
+                'call_sites': call_sites,
+            })
+            section = sections.setdefault(section_name, {'section': section_name, 'fields': [], 'reads': 0,
+                                                         'timestamps': []})
+            section['fields'].append(field_name)
+            section['reads'] += reads
+            section['timestamps'].extend(timestamps)
+
+        return {
+            'duration': duration,
+            'reads': sum(stats['reads'] for stats in field_stats),
+            'fields': field_stats,
+            'hot_fields': [
+                {'section': stats['section'], 'field': stats['field'], 'rate': stats['rate']}
+                for stats in field_stats if stats['rate'] is None or stats['rate'] >= hot_rate
+            ],
+            'preload_sections': [
+                {'section': section['section'], 'fields': sorted(section['fields']), 'reads': section['reads']}
+                for section in sorted(sections.values(), key=lambda item: -item['reads'])
+                if len(section['fields']) >= preload_fields
+            ],
+            'ttls': {
+                section['section']: recommend_ttl(sorted(section['timestamps']), target_hit_rate)
+                for section in sections.values()
+            },
+        }
+
+    def format_report(self, **kwargs: typing.Any) -> str:
+        """
+        Builds human readable report of recorded reads
+        :param kwargs: report parameters, see report method
+        :return: report text
+        """
+        report = self.report(**kwargs)
+        lines = [f'ConfigORM access profile: {report["reads"]} reads in {report["duration"]:.3f} s', '', 'Fields:']
+        for stats in report['fields']:
+            rate = 'n/a' if stats['rate'] is None else f'{stats["rate"]:.2f}/s'
+            lines.append(f'  {stats["section"]}.{stats["field"]}: {stats["reads"]} reads, {rate}')
+            for call_site, count in stats['call_sites']:
+                lines.append(f'    {count:>8}  {call_site}')
+
+        lines.extend(['', 'Hot fields, keep them in snapshot:'])
+        lines.extend(f'  {stats["section"]}.{stats["field"]}' for stats in report['hot_fields'])
+        lines.extend(['', 'Sections worth preloading:'])
+        lines.extend(
+            f'  {section["section"]}: {", ".join(section["fields"])}' for section in report['preload_sections']
+        )
+        lines.extend(['', 'Cache TTLs for target hit rate:'])
+        lines.extend(
+            f'  {section}: {"not reachable" if ttl is None else f"{ttl:.3f} s"}'
+            for section, ttl in report['ttls'].items()
+        )
+        return '\n'.join(lines)
+
+
+def _write_report(profiler: AccessProfiler, destination: str) -> None:
+    """Stops profiler and writes its report, called on interpreter exit"""
+    profiler.stop()
+    if destination == '1':
+        print(profiler.format_report(), file=sys.stderr)
+    else:
+        with open(destination, 'w') as file:
+            json.dump(profiler.report(), file, indent=2)
+
+
+def profile_from_environment() -> typing.Optional[AccessProfiler]:
+    """
+    Starts profiler if CONFIGORM_PROFILE environment variable is set, its report is written on interpreter exit
+    :return: started profiler or None
+    """
+    destination = os.environ.get(PROFILE_ENV)
+    if not destination or fields._profiler is not None:
+        return None
+    profiler = AccessProfiler()
+    profiler.start()
+    atexit.register(_write_report, profiler, destination)
+    return profiler
@@ -0,0 +1,218 @@
+import logging
+import signal
+import threading
+import time
+import types
+import typing
+
+from .watch import FileWatcher, watch_file
+
+logger = logging.getLogger(__name__)
+
+Changes = typing.Dict[str, typing.Tuple[typing.Any, typing.Any]]
+Subscribers = typing.Dict[typing.Tuple[typing.Any, typing.Optional[str]], typing.List[typing.Callable[..., None]]]
+
+
+class ReloadManager(object):
+    """
+    Keeps immutable snapshots of section and all its subclasses and rebuilds them when reload is triggered
+    manually, by timer, by signal or by change of watched files. New snapshots replace old ones at once, so readers
+    never block and never see partially reloaded configuration. Subscribers are notified about changed fields only.
+    """
+
+    def __init__(self,
+                 section: typing.Any,
+                 interval: typing.Optional[float] = None,
+                 files: typing.Iterable[str] = (),
+                 poll_interval: float = 1.0
+                 ) -> None:
+        """
+        :param section: root section, snapshots are kept for it and all its subclasses that have fields
+        :param interval: reload period in seconds, periodic reload is disabled if it is not set
+        :param files: files which changes trigger reload
+        :param poll_interval: how often watched files are checked if inotify is not available, in seconds
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError('Reload interval must be positive')
+        if poll_interval <= 0:
+            raise ValueError('Poll interval must be positive')
+
+        self.section = section
+        self.interval = interval
+        self.files = list(files)
+        self.poll_interval = poll_interval
+        self.reloads = 0
+
+        self._sections = list(section.iter_sections())
+        self._snapshots: typing.Mapping[typing.Any, typing.Any] = types.MappingProxyType({})
+        self._subscribers: Subscribers = {}
+        self._reload_lock = threading.Lock()
+        self._requested = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: typing.Optional[threading.Thread] = None
+        self._watchers: typing.List[FileWatcher] = []
+
+        self.reload()
+
+    @property
+    def snapshots(self) -> typing.Mapping[typing.Any, typing.Any]:
+        """Current snapshots by section classes"""
+        return self._snapshots
+
+    def get(self, section: typing.Any) -> typing.Any:
+        """
+        Returns current snapshot of section
+        :param section: section class
+        :return: named tuple with field values
+        """
+        return self._snapshots[section]
+
+    def __getitem__(self, section: typing.Any) -> typing.Any:
+        return self._snapshots[section]
+
+    def subscribe(self,
+                  section: typing.Any,
+                  callback: typing.Callable[..., None],
+                  field_name: typing.Optional[str] = None
+                  ) -> None:
+        """
+        Registers callback called after reload that changed section. Section callbacks are called with dictionary of
+        changed fields to (old value, new value) pairs, field callbacks are called with old and new value.
+        :param section: section class
+        :param callback: function to call
+        :param field_name: name of section field, callback is called on changes of any field if it is not set
+        :return: Nothing
+        """
+        if field_name is not None and field_name not in section.meta.fields:
+            raise KeyError(f'Section {section.__name__} has no field {field_name}')
+        self._subscribers.setdefault((section, field_name), []).append(callback)
+
+    def unsubscribe(self,
+                    section: typing.Any,
+                    callback: typing.Callable[..., None],
+                    field_name: typing.Optional[str] = None
+                    ) -> None:
+        """
+        Removes callback registered with subscribe
+        :param section: section class
+        :param callback: registered function
+        :param field_name: name of section field callback was registered for
+        :return: Nothing
+        """
+        self._subscribers.get((section, field_name), []).remove(callback)
+
+    def reload(self) -> typing.Dict[typing.Any, Changes]:
+        """
+        Refreshes connectors, reads all sections again and replaces current snapshots with new ones. If any
+        section fails to load, exception is raised and current snapshots are kept. Subscribers are called after
+        snapshots are replaced, so they may trigger reload themselves.
+        :return: changed fields with (old value, new value) pairs by section classes
+        """
+        with self._reload_lock:
+            connectors = {id(section.meta.connector): section.meta.connector for section in self._sections}
+            for connector in connectors.values():
+                refresh = getattr(connector, 'refresh', None)
+                if callable(refresh):
+                    refresh()
+
+            snapshots = {section: section.snapshot() for section in self._sections}
+            previous, self._snapshots = self._snapshots, types.MappingProxyType(snapshots)
+            self.reloads += 1
+
+            changes = {}
+            for section, snapshot in snapshots.items():
+                changed = self._diff(previous.get(section), snapshot)
+                if changed:
+                    changes[section] = changed
+
+        if previous:
+            self._notify(changes)
+        return changes
+
+    @staticmethod
+    def _diff(old: typing.Any, new: typing.Any) -> Changes:
+        """Compares two snapshots of the same section"""
+        if old is None:
+            return {name: (None, value) for name, value in new._asdict().items()}
+        return {
+            name: (old_value, new_value)
+            for name, old_value, new_value in zip(new._fields, old, new)
+            if old_value != new_value
+        }
+
+    def _notify(self, changes: typing.Dict[typing.Any, Changes]) -> None:
+        """Calls subscribers of changed sections and fields, errors of callbacks are logged"""
+        for section, changed in changes.items():
+            calls: typing.List[typing.Tuple[typing.Callable, tuple]] = [
+                (callback, (changed,)) for callback in list(self._subscribers.get((section, None), ()))
+            ]
+            for name, values in changed.items():
+                calls.extend((callback, values) for callback in list(self._subscribers.get((section, name), ())))
+
+            for callback, args in calls:
+                try:
+                    callback(*args)
+                except Exception as error:
+                    logger.warning('Reload subscriber %r of %s failed: %r', callback, section.__name__, error)
+
+    def request_reload(self) -> None:
+        """
+        Asks background thread to reload configuration. Safe to call from signal handlers.
+        :return: Nothing
+        """
+        self._requested.set()
+
+    def install_signal_handler(self, signum: typing.Optional[int] = None) -> None:
+        """
+        Makes signal trigger reload in background thread. Must be called from the main thread.
+        :param signum: signal number, SIGHUP by default
+        :return: Nothing
+        """
+        signal.signal(signal.SIGHUP if signum is None else signum, lambda *_: self.request_reload())
+        self.start()
+
+    def start(self) -> None:
+        """
+        Starts background thread that reloads configuration on requests, by timer and on changes of watched files
+        :return: Nothing
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name='configorm-reload', daemon=True)
+        self._thread.start()
+        self._watchers = [
+            watch_file(path, self.request_reload, poll_interval=self.poll_interval) for path in self.files
+        ]
+
+    def stop(self) -> None:
+        """
+        Stops background thread
+        :return: Nothing
+        """
+        for watcher in self._watchers:
+            watcher.stop()
+        self._watchers = []
+        self._stopped.set()
+        self._requested.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        interval = self.interval
+        deadline = None if interval is None else time.monotonic() + interval
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            requested = self._requested.wait(timeout)
+            self._requested.clear()
+            if self._stopped.is_set():
+                return
+
+            if requested or (deadline is not None and time.monotonic() >= deadline):
+                try:
+                    self.reload()
+                except Exception as error:
+                    logger.warning('Configuration reload failed: %r', error)
+                if interval is not None:
+                    deadline = time.monotonic() + interval
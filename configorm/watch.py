@@ -0,0 +1,269 @@
+import errno
+import functools
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import typing
+from abc import ABC, abstractmethod
+
+if typing.TYPE_CHECKING:
+    import ctypes
+
+logger = logging.getLogger(__name__)
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# File is written, replaced by rename or removed. IN_MODIFY is not watched, so a file written in several chunks
+# is reported once when it is closed.
+FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# Watched directory is gone or events were lost, file state is unknown
+DIRECTORY_EVENTS = IN_DELETE_SELF | IN_MOVE_SELF | IN_Q_OVERFLOW | IN_IGNORED
+
+_EVENT = struct.Struct('iIII')
+
+
+def _file_signature(path: str) -> typing.Optional[typing.Tuple[int, int, int]]:
+    """Returns (mtime_ns, size, inode) of file or None if it is missing"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+@functools.lru_cache(maxsize=None)
+def _load_libc() -> typing.Optional['ctypes.CDLL']:
+    """Loads C library if it provides inotify functions. Library lookup may run ldconfig, so it is done once."""
+    if not sys.platform.startswith('linux'):
+        return None
+    # ctypes.util pulls in subprocess, so it is imported only when file is watched
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, 'inotify_init1') or not hasattr(libc, 'inotify_add_watch'):
+        return None
+    return libc
+
+
+class FileWatcher(ABC):
+    """Daemon thread that calls callback when watched file is changed"""
+
+    def __init__(self, path: str, callback: typing.Callable[[], None]) -> None:
+        # Symlinks are not resolved: file is found through them on every check, so that replaced symlink is noticed
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self._thread: typing.Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Starts watching
+        :return: Nothing
+        """
+        self._thread = threading.Thread(target=self._run, name='configorm-watcher', daemon=True)
+        self._thread.start()
+
+    @abstractmethod
+    def stop(self) -> None:
+        """
+        Stops watching and waits for watcher thread to exit
+        :return: Nothing
+        """
+        pass
+
+    def _notify(self) -> None:
+        """Calls callback, its errors are logged"""
+        try:
+            self.callback()
+        except Exception as error:
+            logger.warning('Watcher callback for %s failed: %r', self.path, error)
+
+    @abstractmethod
+    def _run(self) -> None:
+        """Watches file until watcher is stopped"""
+        pass
+
+
+class PollingWatcher(FileWatcher):
+    """Watcher that checks file modification time, size and inode every interval seconds"""
+
+    def __init__(self, path: str, callback: typing.Callable[[], None], interval: float = 1.0) -> None:
+        super().__init__(path, callback)
+        if interval <= 0:
+            raise ValueError('Poll interval must be positive')
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._signature = _file_signature(self.path)
+
+    def stop(self) -> None:
+        """
+        Stops watching and waits for watcher thread to exit
+        :return: Nothing
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            signature = _file_signature(self.path)
+            if signature != self._signature:
+                self._signature = signature
+                self._notify()
+
+
+class InotifyWatcher(FileWatcher):
+    """
+    Watcher based on Linux inotify. Directory of the path as given is watched, so that atomic replacement of file
+    or of symlink to it is noticed, as well as directory of the file symlinks resolve to, where it is written.
+    Watches follow symlinks when they are switched to another target. Thread sleeps until kernel reports event,
+    no system calls are made otherwise. If watched directory is removed or renamed, its watch is armed again
+    once directory is back, meanwhile file is polled every poll_interval seconds.
+    """
+
+    def __init__(self, path: str, callback: typing.Callable[[], None], poll_interval: float = 1.0) -> None:
+        super().__init__(path, callback)
+        if poll_interval <= 0:
+            raise ValueError('Poll interval must be positive')
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, 'inotify is not available')
+
+        import ctypes
+
+        self.poll_interval = poll_interval
+        self._libc = libc
+        self._watches: typing.Dict[int, str] = {}
+        self._names: typing.Set[bytes] = set()
+        self._signature = _file_signature(self.path)
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        directory = os.path.dirname(self.path)
+        if self._add_watch(directory) is False:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, f'Can not watch {directory}')
+        self._arm()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+
+    def stop(self) -> None:
+        """
+        Stops watching and waits for watcher thread to exit
+        :return: Nothing
+        """
+        if self._fd < 0:
+            return
+        if self._thread is not None:
+            os.write(self._wakeup_write, b'\0')
+            self._thread.join()
+            self._thread = None
+        for fd in (self._fd, self._wakeup_read, self._wakeup_write):
+            os.close(fd)
+        self._fd = -1
+
+    def _add_watch(self, directory: str) -> bool:
+        """Adds watch of directory, returns False if it is not possible"""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), FILE_EVENTS | DIRECTORY_EVENTS)
+        if wd < 0:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def _remove_watch(self, wd: int) -> None:
+        """Removes watch, it may already be removed by kernel"""
+        self._watches.pop(wd, None)
+        self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _arm(self) -> bool:
+        """
+        Brings watches in line with the current symlink target of file: directories of the path and of the target
+        are watched, directories of previous targets are not
+        :return: True if all needed directories are watched
+        """
+        target = os.path.realpath(self.path)
+        directories = {os.path.dirname(self.path), os.path.dirname(target)}
+        self._names = {os.fsencode(os.path.basename(self.path)), os.fsencode(os.path.basename(target))}
+
+        for wd, directory in list(self._watches.items()):
+            if directory not in directories:
+                self._remove_watch(wd)
+        armed = set(self._watches.values())
+        return all([self._add_watch(directory) for directory in directories - armed])
+
+    def _is_relevant(self, data: bytes) -> bool:
+        """
+        Checks if buffer of inotify events has events of watched file or watched directories, forgets watches
+        that were removed by kernel or point to renamed directory
+        """
+        relevant = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+            elif mask & IN_MOVE_SELF:
+                self._remove_watch(wd)
+            if mask & DIRECTORY_EVENTS or (mask & FILE_EVENTS and name in self._names):
+                relevant = True
+        return relevant
+
+    def _run(self) -> None:
+        armed = True
+        while True:
+            timeout = None if armed else self.poll_interval
+            readable, _, _ = select.select([self._fd, self._wakeup_read], [], [], timeout)
+            if self._wakeup_read in readable:
+                return
+
+            relevant = False
+            if self._fd in readable:
+                try:
+                    relevant = self._is_relevant(os.read(self._fd, 64 * 1024))
+                except BlockingIOError:
+                    pass
+            # Symlink may be switched to another directory or watched directory may be gone, both change watches.
+            # Events of other files in watched directories are reported only if they changed the file, which
+            # happens when symlink in the path is replaced.
+            armed = self._arm()
+            signature = _file_signature(self.path)
+            if relevant or signature != self._signature:
+                self._signature = signature
+                self._notify()
+
+
+def watch_file(path: str, callback: typing.Callable[[], None], poll_interval: float = 1.0) -> FileWatcher:
+    """
+    Starts watching file with inotify, falling back to polling if inotify is not available
+    :param path: path to file
+    :param callback: function called after file is changed
+    :param poll_interval: how often file is checked by polling watcher, in seconds
+    :return: started watcher
+    """
+    watcher: FileWatcher
+    try:
+        watcher = InotifyWatcher(path, callback, poll_interval=poll_interval)
+    except OSError as error:
+        logger.debug('Falling back to polling of %s: %r', path, error)
+        watcher = PollingWatcher(path, callback, interval=poll_interval)
+    watcher.start()
+    return watcher
@@ -17,6 +17,9 @@ setuptools.setup(
     install_requires=[
         "hvac>=1.0.2"
     ],
+    extras_require={
+        "async": ["aiohttp>=3.7"]
+    },
     python_requires=">=3.7",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeVault(object):
+    """
+    Minimal HTTP server emulating reads from Vault KV version 2 secrets engine
+    """
+
+    def __init__(self, token='test_token', latency=0.0):
+        self.token = token
+        self.latency = latency
+        self.secrets = {}
+        self.requests = []
+
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.01,), daemon=True)
+
+    @property
+    def url(self):
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def put(self, mount_point, path, data):
+        with self._lock:
+            secret = self.secrets.setdefault((mount_point.strip('/'), path), {'data': None, 'version': 0})
+            secret['data'] = dict(data)
+            secret['version'] += 1
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _make_handler(self):
+        vault = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def reply(self, status, body):
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def do_GET(self):
+                with vault._lock:
+                    vault.requests.append(self.path)
+                if vault.latency:
+                    time.sleep(vault.latency)
+                if self.headers.get('X-Vault-Token') != vault.token:
+                    return self.reply(403, {'errors': ['permission denied']})
+
+                parts = self.path.split('?')[0].strip('/').split('/')
+                if len(parts) < 4 or parts[0] != 'v1' or parts[2] not in ('data', 'metadata'):
+                    return self.reply(404, {'errors': []})
+                with vault._lock:
+                    secret = vault.secrets.get((parts[1], '/'.join(parts[3:])))
+                if secret is None:
+                    return self.reply(404, {'errors': []})
+                if parts[2] == 'metadata':
+                    return self.reply(200, {'data': {'current_version': secret['version']}})
+                return self.reply(200, {'data': {'data': secret['data'], 'metadata': {'version': secret['version']}}})
+
+        return Handler
@@ -0,0 +1,249 @@
+import asyncio
+import functools
+import importlib.util
+import unittest
+
+from hvac.exceptions import Forbidden, InvalidPath
+
+from configorm import *
+from fake_vault import FakeVault
+
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+
+
+@unittest.skipUnless(HAS_AIOHTTP, 'aiohttp is not installed')
+class TestAsyncVaultConnector(unittest.TestCase):
+    """
+    Base class for "AsyncVaultConnector" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.mount_point = 'TEST/'
+        self.vault = FakeVault(latency=0.05).start()
+        self.vault.put(self.mount_point, 'DATABASE', {'SERVER': '10.10.10.10', 'PORT': '5432', 'DEBUG': 'True'})
+        self.connector = self.create_connector()
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        asyncio.run(self.connector.aclose())
+        self.vault.stop()
+
+    def create_connector(self, **kwargs):
+        return AsyncVaultConnector(mount_point=self.mount_point, url=self.vault.url, token=self.vault.token, **kwargs)
+
+    def run_async(self, coroutine_function):
+        async def runner():
+            try:
+                return await coroutine_function()
+            finally:
+                await self.connector.aclose()
+        return asyncio.run(runner())
+
+
+class TestAsyncReads(TestAsyncVaultConnector):
+
+    def test_aget_value(self):
+        ### Run ###
+
+        result = self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+
+    def test_exist_checks(self):
+        ### Run ###
+
+        async def checks():
+            return (
+                await self.connector.ais_section_exist(section_name='database'),
+                await self.connector.ais_section_exist(section_name='missing'),
+                await self.connector.ais_attr_exist(section_name='database', attr_name='port'),
+                await self.connector.ais_attr_exist(section_name='database', attr_name='missing'),
+                await self.connector.ais_attr_exist(section_name='missing', attr_name='port')
+            )
+
+        result = self.run_async(checks)
+
+        ### Assertions ###
+
+        self.assertEqual(result, (True, False, True, False, False))
+
+    def test_missing_section(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(InvalidPath):
+            self.run_async(lambda: self.connector.aget_value(section_name='missing', attr_name='server'))
+
+    def test_wrong_token(self):
+        ### Setup ###
+
+        self.connector = AsyncVaultConnector(mount_point=self.mount_point, url=self.vault.url, token='wrong')
+
+        ### Run and Assertions ###
+
+        with self.assertRaises(Forbidden):
+            self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+
+    def test_concurrent_reads_are_merged(self):
+        ### Run ###
+
+        async def reads():
+            return await asyncio.gather(*(
+                self.connector.aget_value(section_name='database', attr_name='server') for _ in range(20)
+            ))
+
+        result = self.run_async(reads)
+
+        ### Assertions ###
+
+        self.assertEqual(result, ['10.10.10.10'] * 20)
+        self.assertEqual(len(self.vault.requests), 1)
+
+    def test_finished_request_keeps_newer_one(self):
+        ### Setup ###
+
+        async def finish_replaced_request():
+            loop = asyncio.get_running_loop()
+            old, new = loop.create_future(), loop.create_future()
+            old.add_done_callback(functools.partial(self.connector._forget_pending, 'DATABASE'))
+            self.connector._pending['DATABASE'] = new
+            old.set_result({})
+            await asyncio.sleep(0)
+            return new
+
+        ### Run ###
+
+        new = self.run_async(finish_replaced_request)
+
+        ### Assertions ###
+
+        self.assertIs(self.connector._pending['DATABASE'], new)
+
+    def test_cache_is_shared_with_sync_reads(self):
+        ### Setup ###
+
+        self.connector = self.create_connector(cache_ttl=60)
+
+        ### Run ###
+
+        self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+        result = self.connector.get_value(section_name='database', attr_name='port')
+
+        ### Assertions ###
+
+        self.assertEqual(result, '5432')
+        self.assertEqual(len(self.vault.requests), 1)
+
+
+    def test_unchanged_version_is_not_downloaded(self):
+        ### Setup ###
+
+        self.connector = self.create_connector(cache_ttl=60, check_version=True)
+        self.connector._cache.timer = lambda: 100.0
+        self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+        self.connector._cache.timer = lambda: 170.0
+
+        ### Run ###
+
+        result = self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+        self.assertEqual(self.vault.requests, ['/v1/TEST/data/DATABASE', '/v1/TEST/metadata/DATABASE'])
+
+    def test_changed_version_is_downloaded(self):
+        ### Setup ###
+
+        self.connector = self.create_connector(cache_ttl=60, check_version=True)
+        self.connector._cache.timer = lambda: 100.0
+        self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+        self.vault.put(self.mount_point, 'DATABASE', {'SERVER': '20.20.20.20'})
+        self.connector._cache.timer = lambda: 170.0
+
+        ### Run ###
+
+        result = self.run_async(lambda: self.connector.aget_value(section_name='database', attr_name='server'))
+
+        ### Assertions ###
+
+        self.assertEqual(result, '20.20.20.20')
+        self.assertEqual(self.vault.requests[1:], ['/v1/TEST/metadata/DATABASE', '/v1/TEST/data/DATABASE'])
+
+
+class TestAwaitableSection(TestAsyncVaultConnector):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+
+        class BaseSection(Section):
+            class Meta:
+                connector = self.connector
+
+        class Database(BaseSection):
+            server = StringField()
+            port = IntegerField()
+            debug = BooleanField()
+            user = StringField(default='admin')
+
+        self.section = Database
+
+    def test_aget(self):
+        ### Run ###
+
+        result = self.run_async(lambda: self.section.aget('port'))
+
+        ### Assertions ###
+
+        self.assertEqual(result, 5432)
+
+    def test_aload(self):
+        ### Run ###
+
+        result = self.run_async(self.section.aload)
+
+        ### Assertions ###
+
+        self.assertEqual(result, {'server': '10.10.10.10', 'port': 5432, 'debug': True, 'user': 'admin'})
+        self.assertEqual(len(self.vault.requests), 1)
+
+    def test_aget_section(self):
+        ### Run ###
+
+        result = self.run_async(lambda: self.connector.aget_section(section_name='database', attr_names=['server']))
+
+        ### Assertions ###
+
+        self.assertEqual(result, {'server': '10.10.10.10'})
+
+
+class TestAwaitableSectionWithSyncConnector(unittest.TestCase):
+
+    def test_aload(self):
+        ### Setup ###
+
+        class Database(Section):
+            class Meta:
+                connector = DictLikeConnector({'server': '10.10.10.10', 'port': '5432'})
+
+            server = StringField()
+            port = IntegerField()
+
+        ### Run ###
+
+        result = asyncio.run(Database.aload())
+
+        ### Assertions ###
+
+        self.assertEqual(result, {'server': '10.10.10.10', 'port': 5432})
+
+
+class DictLikeConnector(object):
+    def __init__(self, values):
+        self.values = values
+
+    def get_section(self, section_name, attr_names=None):
+        return self.values
@@ -1,7 +1,9 @@
+import copy
 import shutil
 import unittest
 import os
 from configparser import *
+from unittest.mock import Mock
 
 from configorm import *
 
@@ -89,6 +91,91 @@ class TestConfigORMFieldsWithCorrectValues(unittest.TestCase):
         self.assertEqual(result, [True, False, True])
 
 
+class TestConfigORMSectionLoad(unittest.TestCase):
+    def test_load(self):
+        result = SectionA.load()
+        self.assertEqual(result, {
+            'string_field': 'Test String',
+            'integer_field': 42,
+            'float_field': 36.6,
+            'bool_field': True,
+            'null_value': None,
+            'list_of_int': [1, 2, 3],
+            'list_of_str': ['a', 'b', 'c'],
+            'list_of_float': [1.1, 2.2, 3.3],
+            'list_of_bool': [True, False, True],
+        })
+
+
+class TestConfigORMSectionSnapshot(unittest.TestCase):
+    def test_snapshot(self):
+        result = SectionA.snapshot()
+        self.assertEqual(result.string_field, 'Test String')
+        self.assertEqual(result.list_of_int, [1, 2, 3])
+        self.assertEqual(result._asdict(), SectionA.load())
+        self.assertEqual(type(result).__name__, 'SectionASnapshot')
+        self.assertIs(type(result), type(SectionA.snapshot()))
+
+    def test_snapshot_is_immutable(self):
+        result = SectionA.snapshot()
+        with self.assertRaises(AttributeError):
+            result.string_field = 'Changed'
+
+    def test_snapshot_underscore_field_names(self):
+        class SectionUnderscore(Section):
+            class Meta:
+                connector = Mock(get_section=Mock(return_value={'_token': 'secret', 'name': 'app'}))
+
+            _token = StringField()
+            name = StringField()
+
+        result = SectionUnderscore.snapshot()
+        self.assertEqual((result._token, result.name), ('secret', 'app'))
+        self.assertEqual(result._asdict(), {'_token': 'secret', 'name': 'app'})
+        self.assertEqual(copy.copy(result), result)
+
+    def test_snapshot_reads_section_once(self):
+        connector.get_section = Mock(wraps=connector.get_section)
+        try:
+            result = SectionA.snapshot()
+            connector.get_section.assert_called_once_with(section_name='sectiona', attr_names=list(result._fields))
+        finally:
+            del connector.get_section
+
+
+class TestConfigORMFieldBinding(unittest.TestCase):
+    def test_precomputed_keys(self):
+        field = SectionA.meta.fields['string_field']
+        self.assertIs(field.connector, connector)
+        self.assertEqual(field.section_key, 'sectiona')
+        self.assertEqual(field.attr_key, 'string_field')
+        self.assertEqual(field.env_key, 'SECTIONA_STRING_FIELD')
+
+    def test_slots(self):
+        with self.assertRaises(AttributeError):
+            SectionA.meta.fields['string_field'].unknown = None
+        with self.assertRaises(AttributeError):
+            SectionA.meta.unknown = None
+
+    def test_connector_inherited(self):
+        class SectionC(SectionA):
+            pass
+
+        self.assertIs(SectionC.meta.connector, connector)
+
+    def test_connector_replaced(self):
+        class IsolatedSection(Section):
+            class Meta:
+                connector = connector
+
+        class SectionC(IsolatedSection):
+            string_field = StringField()
+
+        replacement = IniConnector(connection_string=connection_string)
+        SectionC.meta.connector = replacement
+        self.assertIs(SectionC.meta.fields['string_field'].connector, replacement)
+
+
 class TestConfigORMSetFieldValues(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -0,0 +1,59 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(package_dir, 'benchmarks'))
+
+from suite import BENCHMARKS, compare, measure  # noqa: E402
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_cases_run(self):
+        ### Run and Assertions ###
+
+        for name, prepare in BENCHMARKS.items():
+            with self.subTest(benchmark=name):
+                temp_dir = tempfile.mkdtemp()
+                case = prepare(temp_dir)
+                try:
+                    case.run()
+                    case.run()
+                finally:
+                    if case.cleanup is not None:
+                        case.cleanup()
+                    shutil.rmtree(temp_dir)
+
+    def test_measure(self):
+        ### Setup ###
+
+        prepare = BENCHMARKS['list_cast_int_10k']
+
+        ### Run ###
+
+        result = measure(prepare(''), min_time=0.001, repeat=2)
+
+        ### Assertions ###
+
+        self.assertEqual(result['operations'], 10000)
+        self.assertGreater(result['ops_per_second'], 0)
+        self.assertLessEqual(result['min'], result['median'])
+
+    def test_compare(self):
+        ### Setup ###
+
+        baseline = {'commit': 'abc', 'results': {'fast': {'median': 1.0}, 'slow': {'median': 1.0}}}
+        report = {'results': {'fast': {'median': 1.05}, 'slow': {'median': 1.5}, 'new': {'median': 1.0}}}
+
+        ### Run and Assertions ###
+
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                self.assertTrue(compare({'results': {'fast': report['results']['fast']}}, baseline, threshold=0.1))
+                self.assertFalse(compare(report, baseline, threshold=0.1))
+            finally:
+                sys.stdout = stdout
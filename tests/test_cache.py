@@ -0,0 +1,324 @@
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from configorm.cache import BackgroundRefresher, SingleFlight, TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """
+    Base class for "TTLCache" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.timer = Mock(return_value=100.0)
+        self.cache = TTLCache(ttl=10, max_entries=2, timer=self.timer)
+
+
+class TestGet(TestTTLCache):
+
+    def test_fresh_entry(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value')
+        self.timer.return_value = 109.0
+
+        ### Run and Assertions ###
+
+        self.assertEqual(self.cache.get('key').value, 'value')
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_expired_entry(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value')
+        self.timer.return_value = 110.0
+
+        ### Run and Assertions ###
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_missing_entry(self):
+        ### Run and Assertions ###
+
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.misses, 1)
+
+
+class TestStaleGet(TestTTLCache):
+
+    def test_stale_entry_within_bound(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value')
+        self.timer.return_value = 114.0
+
+        ### Run ###
+
+        entry = self.cache.get('key', max_stale=5)
+
+        ### Assertions ###
+
+        self.assertEqual(entry.value, 'value')
+        self.assertTrue(entry.is_expired(self.timer()))
+
+    def test_stale_entry_out_of_bound(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value')
+        self.timer.return_value = 115.0
+
+        ### Run and Assertions ###
+
+        self.assertIsNone(self.cache.get('key', max_stale=5))
+
+
+class TestPeekAndRenew(TestTTLCache):
+
+    def test_peek_expired_entry(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value', version=3)
+        self.timer.return_value = 200.0
+
+        ### Run ###
+
+        entry = self.cache.peek('key')
+
+        ### Assertions ###
+
+        self.assertEqual(entry.value, 'value')
+        self.assertEqual(entry.version, 3)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 0))
+
+    def test_renew(self):
+        ### Setup ###
+
+        self.cache.set('key', 'value')
+        self.timer.return_value = 200.0
+
+        ### Run ###
+
+        self.cache.renew('key')
+
+        ### Assertions ###
+
+        self.assertEqual(self.cache.get('key').expires_at, 210.0)
+
+
+class TestJitter(unittest.TestCase):
+
+    @patch('configorm.cache.random')
+    def test_ttl_is_shortened(self, mock_random):
+        ### Setup ###
+
+        mock_random.uniform.return_value = 0.2
+        cache = TTLCache(ttl=10, jitter=0.5, timer=Mock(return_value=100.0))
+
+        ### Run ###
+
+        entry = cache.set('key', 'value')
+
+        ### Assertions ###
+
+        self.assertEqual(entry.expires_at, 108.0)
+        mock_random.uniform.assert_called_once_with(0, 0.5)
+
+    def test_invalid_jitter(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError):
+            TTLCache(ttl=10, jitter=1)
+
+
+class TestEviction(TestTTLCache):
+
+    def test_least_recently_used_is_evicted(self):
+        ### Setup ###
+
+        self.cache.set('first', 1)
+        self.cache.set('second', 2)
+        self.cache.get('first')
+
+        ### Run ###
+
+        self.cache.set('third', 3)
+
+        ### Assertions ###
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get('second'))
+        self.assertEqual(self.cache.get('first').value, 1)
+        self.assertEqual(self.cache.get('third').value, 3)
+
+    def test_invalidate_and_clear(self):
+        ### Setup ###
+
+        self.cache.set('first', 1)
+        self.cache.set('second', 2)
+
+        ### Run and Assertions ###
+
+        self.cache.invalidate('first')
+        self.assertIsNone(self.cache.get('first'))
+        self.assertEqual(len(self.cache), 1)
+
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestValidation(unittest.TestCase):
+
+    def test_non_positive_ttl(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError):
+            TTLCache(ttl=0)
+
+    def test_non_positive_size(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError):
+            TTLCache(ttl=1, max_entries=0)
+
+
+class TestSingleFlight(unittest.TestCase):
+    """
+    Base class for "SingleFlight" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.flight = SingleFlight()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.results = []
+        self.errors = []
+
+    def run_concurrently(self, function, count=5):
+        def worker():
+            try:
+                self.results.append(self.flight.do('key', function))
+            except Exception as error:
+                self.errors.append(error)
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        self.entered.wait(timeout=5)
+        followers = [threading.Thread(target=worker) for _ in range(count - 1)]
+        for thread in followers:
+            thread.start()
+        time.sleep(0.1)
+        self.release.set()
+        for thread in [leader] + followers:
+            thread.join(timeout=5)
+
+    def test_result_is_shared(self):
+        ### Setup ###
+
+        def function():
+            self.entered.set()
+            self.release.wait(timeout=5)
+            return 'value'
+
+        function = Mock(side_effect=function)
+
+        ### Run ###
+
+        self.run_concurrently(function)
+
+        ### Assertions ###
+
+        function.assert_called_once_with()
+        self.assertEqual(self.results, ['value'] * 5)
+
+    def test_error_is_shared(self):
+        ### Setup ###
+
+        error = KeyError('key')
+
+        def function():
+            self.entered.set()
+            self.release.wait(timeout=5)
+            raise error
+
+        function = Mock(side_effect=function)
+
+        ### Run ###
+
+        self.run_concurrently(function)
+
+        ### Assertions ###
+
+        function.assert_called_once_with()
+        self.assertEqual(self.errors, [error] * 5)
+
+    def test_sequential_calls_are_not_merged(self):
+        ### Setup ###
+
+        function = Mock(return_value='value')
+
+        ### Run ###
+
+        self.flight.do('key', function)
+        self.flight.do('key', function)
+
+        ### Assertions ###
+
+        self.assertEqual(function.call_count, 2)
+
+
+class TestBackgroundRefresher(unittest.TestCase):
+
+    def test_refresh(self):
+        ### Setup ###
+
+        refresh = Mock()
+        refresher = BackgroundRefresher(refresh=refresh)
+
+        ### Run ###
+
+        refresher.schedule('first')
+        refresher.schedule('second')
+        refresher.join()
+
+        ### Assertions ###
+
+        self.assertEqual([call[0][0] for call in refresh.call_args_list], ['first', 'second'])
+
+    def test_pending_key_is_scheduled_once(self):
+        ### Setup ###
+
+        release = threading.Event()
+        refresh = Mock(side_effect=lambda key: release.wait(timeout=5))
+        refresher = BackgroundRefresher(refresh=refresh)
+
+        ### Run ###
+
+        for _ in range(5):
+            refresher.schedule('key')
+        release.set()
+        refresher.join()
+
+        ### Assertions ###
+
+        refresh.assert_called_once_with('key')
+
+    def test_error_hook(self):
+        ### Setup ###
+
+        error = KeyError('key')
+        on_error = Mock()
+        refresher = BackgroundRefresher(refresh=Mock(side_effect=error), on_error=on_error)
+
+        ### Run ###
+
+        refresher.schedule('key')
+        refresher.join()
+
+        ### Assertions ###
+
+        on_error.assert_called_once_with('key', error)
@@ -1,5 +1,5 @@
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from configorm import *
 
@@ -212,3 +212,48 @@ class TestListOfBoolField(unittest.TestCase):
             field = ListField(var_type=bool)
 
         self.assertEqual(TestSection.field, self.dir_value)
+
+
+class TestCastCache(unittest.TestCase):
+
+    def create_section(self, list_field):
+        class BaseSection(Section):
+            class Meta:
+                connector = Mock()
+                connector.get_value = Mock(return_value='[1, 2, 3]')
+
+        class TestSection(BaseSection):
+            field = list_field
+
+        return TestSection
+
+    def test_unchanged_value_is_cast_once(self):
+        field = ListField(var_type=int)
+        section = self.create_section(field)
+
+        with patch.object(ListField, 'cast_value', autospec=True, side_effect=ListField.cast_value) as cast_value:
+            self.assertEqual(section.field, [1, 2, 3])
+            self.assertEqual(section.field, [1, 2, 3])
+        cast_value.assert_called_once_with(field, '[1, 2, 3]')
+
+    def test_changed_value_is_cast_again(self):
+        field = ListField(var_type=int)
+        section = self.create_section(field)
+
+        self.assertEqual(section.field, [1, 2, 3])
+        section.meta.connector.get_value.return_value = '[4, 5]'
+        self.assertEqual(section.field, [4, 5])
+
+    def test_list_is_copied(self):
+        section = self.create_section(ListField(var_type=int))
+
+        first = section.field
+        first.append(4)
+
+        self.assertEqual(section.field, [1, 2, 3])
+        self.assertIsNot(section.field, section.field)
+
+    def test_list_is_shared_without_copy(self):
+        section = self.create_section(ListField(var_type=int, copy=False))
+
+        self.assertIs(section.field, section.field)
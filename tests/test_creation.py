@@ -1,6 +1,8 @@
 import unittest
 import os
 from configparser import *
+from unittest.mock import Mock
+
 from configorm import *
 
 package_dir = os.path.abspath(os.path.dirname(__file__))
@@ -86,3 +88,31 @@ class TestConfigORMRecreated(unittest.TestCase):
         config = ConfigParser()
         config.read(SectionA.meta.connector.connection_string)
         self.assertEqual(config['SectionA']['list_of_bool'], str(SectionA.list_of_bool))
+
+
+class TestConfigORMConnectorWithoutTransaction(unittest.TestCase):
+    def check_integrity(self, mock_connector):
+        mock_connector.is_section_exist.return_value = False
+        mock_connector.is_attr_exist.return_value = False
+
+        class IsolatedSection(Section):
+            class Meta:
+                connector = mock_connector
+
+        class SectionD(IsolatedSection):
+            string_field = StringField(default='Default Placeholder')
+
+        IsolatedSection.check_config_integrity()
+        mock_connector.add_section.assert_called_once_with(section_name='SectionD')
+        mock_connector.add_attr.assert_called_once_with(
+            section_name='SectionD',
+            attr_name='string_field',
+            value='Default Placeholder'
+        )
+
+    def test_duck_typed_connector(self):
+        self.check_integrity(Mock(spec=['create_config', 'is_section_exist', 'is_attr_exist', 'add_section',
+                                        'add_attr']))
+
+    def test_mock_connector(self):
+        self.check_integrity(Mock())
@@ -0,0 +1,207 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from configorm import BooleanField, DictConnector, IniConnector, IntegerField, Section, StringField
+
+CONFIG = '[Database]\nserver = 10.10.10.10\nport = 5432\n\n[General]\ndebug = True\n'
+
+
+class TestDictConnector(unittest.TestCase):
+    """
+    Base class for "DictConnector" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.connector = DictConnector({
+            'Database': {'server': '10.10.10.10', 'port': 5432},
+            'General Settings': {'debug': 'True', 'empty': None},
+        })
+
+
+class TestDictReads(TestDictConnector):
+
+    def test_get_value_normalized_names(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='DATABASE', attr_name='Server'), '10.10.10.10')
+        self.assertEqual(self.connector.get_value(section_name='general_settings', attr_name='debug'), 'True')
+        self.assertIsNone(self.connector.get_value(section_name='general_settings', attr_name='empty'))
+        self.assertIsNone(self.connector.get_value(section_name='missing', attr_name='debug'))
+
+    def test_values_are_strings(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='database', attr_name='port'), '5432')
+
+    def test_env_override(self):
+        ### Run ###
+
+        with patch.dict(os.environ, {'DATABASE_SERVER': '10.10.10.11'}):
+            result = self.connector.get_value(section_name='database', attr_name='server', env_override=True)
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.11')
+
+    def test_get_section(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.connector.get_section(section_name='database'), {'server': '10.10.10.10', 'port': '5432'})
+        self.assertEqual(self.connector.get_section(section_name='Database', attr_names=['Port', 'missing']),
+                         {'port': '5432'})
+        self.assertEqual(self.connector.get_section(section_name='missing'), {})
+
+    def test_is_exist(self):
+        ### Run and Assertions ###
+
+        self.assertTrue(self.connector.is_section_exist(section_name='general_settings'))
+        self.assertFalse(self.connector.is_section_exist(section_name='missing'))
+        self.assertTrue(self.connector.is_attr_exist(section_name='General Settings', attr_name='DEBUG'))
+        self.assertFalse(self.connector.is_attr_exist(section_name='database', attr_name='missing'))
+        self.assertFalse(self.connector.is_attr_exist(section_name='missing', attr_name='server'))
+
+
+class TestDictWrites(TestDictConnector):
+
+    def test_set_value_keeps_raw_names(self):
+        ### Run ###
+
+        self.connector.set_value(section_name='general_settings', attr_name='DEBUG', value=False)
+        self.connector.set_value(section_name='database', attr_name='user', value='admin')
+        self.connector.set_value(section_name='missing', attr_name='user', value='admin')
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.to_dict(), {
+            'Database': {'server': '10.10.10.10', 'port': '5432', 'user': 'admin'},
+            'General Settings': {'debug': 'False', 'empty': None},
+        })
+
+    def test_add_section_and_attr(self):
+        ### Run ###
+
+        self.connector.add_section(section_name='Logging')
+        self.connector.add_attr(section_name='logging', attr_name='level', value='INFO')
+        self.connector.add_attr(section_name='logging', attr_name='LEVEL', value='DEBUG')
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.to_dict()['Logging'], {'level': 'INFO'})
+
+    def test_changes_are_discarded_on_error(self):
+        ### Run ###
+
+        with self.assertRaises(RuntimeError):
+            with self.connector.transaction():
+                with self.connector.transaction():
+                    self.connector.set_value(section_name='database', attr_name='port', value=6432)
+                raise RuntimeError
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='database', attr_name='port'), '5432')
+
+    def test_to_dict_is_copy(self):
+        ### Setup ###
+
+        data = self.connector.to_dict()
+
+        ### Run ###
+
+        data['Database']['server'] = '10.10.10.11'
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='database', attr_name='server'), '10.10.10.10')
+
+
+class TestDictConnectorTransfer(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'config.ini')
+        with open(self.path, 'w') as file:
+            file.write(CONFIG)
+        self.ini_connector = IniConnector(connection_string=self.path)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_from_connector(self):
+        ### Run ###
+
+        connector = DictConnector.from_connector(self.ini_connector, ['database', 'general', 'missing'])
+
+        ### Assertions ###
+
+        self.assertEqual(connector.to_dict(), {
+            'database': {'server': '10.10.10.10', 'port': '5432'},
+            'general': {'debug': 'True'},
+        })
+
+    def test_dump(self):
+        ### Setup ###
+
+        connector = DictConnector({'Database': {'port': 6432, 'user': 'admin'}, 'Logging': {'level': 'INFO'}})
+
+        ### Run ###
+
+        connector.dump(self.ini_connector)
+
+        ### Assertions ###
+
+        result = DictConnector.from_connector(IniConnector(connection_string=self.path), ['database', 'logging'])
+        self.assertEqual(result.to_dict(), {
+            'database': {'server': '10.10.10.10', 'port': '6432', 'user': 'admin'},
+            'logging': {'level': 'INFO'},
+        })
+
+    def test_dump_selected_sections(self):
+        ### Setup ###
+
+        connector = DictConnector({'Database': {'port': 6432}, 'Logging': {'level': 'INFO'}})
+
+        ### Run ###
+
+        connector.dump(self.ini_connector, section_names=['logging'])
+
+        ### Assertions ###
+
+        self.assertEqual(self.ini_connector.get_value(section_name='database', attr_name='port'), '5432')
+        self.assertEqual(self.ini_connector.get_value(section_name='logging', attr_name='level'), 'INFO')
+
+    def test_freeze(self):
+        ### Setup ###
+
+        ini_connector = self.ini_connector
+
+        class BaseSection(Section):
+            class Meta:
+                connector = ini_connector
+
+        class Database(BaseSection):
+            server = StringField()
+            port = IntegerField()
+            user = StringField(default='admin')
+
+        class General(BaseSection):
+            debug = BooleanField()
+
+        ### Run ###
+
+        connector = DictConnector.freeze(BaseSection)
+        os.remove(self.path)
+
+        ### Assertions ###
+
+        self.assertIs(Database.meta.connector, connector)
+        self.assertIs(BaseSection.meta.connector, connector)
+        self.assertEqual(Database.load(), {'server': '10.10.10.10', 'port': 5432, 'user': 'admin'})
+        self.assertIs(General.debug, True)
+        self.assertEqual(set(connector.to_dict()), {'Database', 'General'})
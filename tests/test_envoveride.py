@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 
 from configorm import *
 
@@ -25,21 +26,28 @@ class SectionA(BaseSection):
     list_of_bool = ListField(var_type=bool, env_override=True)
 
 
+@patch.dict(os.environ)
 class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
     @classmethod
     def setUp(cls) -> None:
         BaseSection.check_config_integrity()
 
+    def tearDown(self) -> None:
+        """Clean up test."""
+        BaseSection.refresh_env()
+
     def test_string_filed_no_env(self):
         key = 'SECTIONA_STRING_FIELD'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.string_field
         self.assertEqual(result, 'Test String')
 
     def test_string_filed_env(self):
         env_value = 'Test String Env'
         os.environ['SECTIONA_STRING_FIELD'] = env_value
+        SectionA.refresh_env()
         result = SectionA.string_field
         self.assertEqual(result, env_value)
 
@@ -47,12 +55,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_INTEGER_FIELD'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.integer_field
         self.assertEqual(result, 42)
 
     def test_integer_field_env(self):
         env_value = 43
         os.environ['SECTIONA_INTEGER_FIELD'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.integer_field
         self.assertEqual(result, env_value)
 
@@ -60,12 +70,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_FLOAT_FIELD'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.float_field
         self.assertEqual(result, 36.6)
 
     def test_float_field_env(self):
         env_value = 1.2
         os.environ['SECTIONA_FLOAT_FIELD'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.float_field
         self.assertEqual(result, env_value)
 
@@ -73,12 +85,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_BOOL_FIELD'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.bool_field
         self.assertTrue(result)
 
     def test_bool_field_env(self):
         env_value = 0
         os.environ['SECTIONA_BOOL_FIELD'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.bool_field
         self.assertFalse(result)
 
@@ -86,12 +100,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_LIST_OF_INT'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.list_of_int
         self.assertEqual(result, [1, 2, 3])
 
     def test_list_of_int_field_env(self):
         env_value = [4, 5, 6]
         os.environ['SECTIONA_LIST_OF_INT'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.list_of_int
         self.assertEqual(result, env_value)
 
@@ -99,12 +115,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_LIST_OF_STR'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.list_of_str
         self.assertEqual(result, ['a', 'b', 'c'])
 
     def test_list_of_str_field_env(self):
         env_value = ['d', 'e', 'f']
         os.environ['SECTIONA_LIST_OF_STR'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.list_of_str
         self.assertEqual(result, env_value)
 
@@ -112,12 +130,14 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_LIST_OF_FLOAT'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.list_of_float
         self.assertEqual(result, [1.1, 2.2, 3.3])
 
     def test_list_of_float_field_env(self):
         env_value = [4.4, 5.5, 6.6]
         os.environ['SECTIONA_LIST_OF_FLOAT'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.list_of_float
         self.assertEqual(result, env_value)
 
@@ -125,11 +145,67 @@ class TestConfigORMFieldsWithEnvVars(unittest.TestCase):
         key = 'SECTIONA_LIST_OF_BOOL'
         if key in os.environ:
             os.environ.pop(key)
+        SectionA.refresh_env()
         result = SectionA.list_of_bool
         self.assertEqual(result, [True, False, True])
 
     def test_list_of_bool_field_env(self):
         env_value = [False, True, False]
         os.environ['SECTIONA_LIST_OF_BOOL'] = str(env_value)
+        SectionA.refresh_env()
         result = SectionA.list_of_bool
         self.assertEqual(result, env_value)
+
+    def test_load_env(self):
+        env_value = 'Test String Env'
+        os.environ['SECTIONA_STRING_FIELD'] = env_value
+        SectionA.refresh_env()
+        result = SectionA.load()
+        self.assertEqual(result['string_field'], env_value)
+        self.assertEqual(result['null_value'], None)
+
+    def test_snapshot_until_refresh(self):
+        os.environ['SECTIONA_STRING_FIELD'] = 'First'
+        SectionA.refresh_env()
+        os.environ['SECTIONA_STRING_FIELD'] = 'Second'
+        self.assertEqual(SectionA.string_field, 'First')
+        BaseSection.refresh_env()
+        self.assertEqual(SectionA.string_field, 'Second')
+
+    def test_snapshot_on_creation(self):
+        os.environ['SECTIONC_STRING_FIELD'] = 'Created'
+
+        class IsolatedSection(Section):
+            class Meta:
+                connector = connector
+
+        class SectionC(IsolatedSection):
+            string_field = StringField(env_override=True)
+            integer_field = IntegerField(default=1)
+
+        self.assertEqual(SectionC.meta.env, {'string_field': 'Created'})
+
+
+@patch.dict(os.environ)
+class TestEnvPrefix(unittest.TestCase):
+    def setUp(self) -> None:
+        class PrefixedSection(Section):
+            class Meta:
+                connector = connector
+                env_prefix = 'MYAPP_'
+
+        class SectionA(PrefixedSection):
+            string_field = StringField(env_override=True)
+
+        self.section = SectionA
+
+    def test_prefixed_key(self):
+        self.assertEqual(self.section.meta.fields['string_field'].env_key, 'MYAPP_SECTIONA_STRING_FIELD')
+
+    def test_prefixed_override(self):
+        os.environ['MYAPP_SECTIONA_STRING_FIELD'] = 'Prefixed'
+        os.environ['SECTIONA_STRING_FIELD'] = 'Not Prefixed'
+        self.section.refresh_env()
+        self.assertEqual(self.section.string_field, 'Prefixed')
+        os.environ.pop('MYAPP_SECTIONA_STRING_FIELD')
+        os.environ.pop('SECTIONA_STRING_FIELD')
@@ -0,0 +1,64 @@
+import os
+import subprocess
+import sys
+import unittest
+
+package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VAULT_MODULES = ('hvac', 'requests')
+
+# Modules used only by opt-in features: file watching, preload, parse cache and asynchronous access
+OPTIONAL_MODULES = ('asyncio', 'concurrent.futures', 'ctypes', 'hashlib', 'subprocess', 'tempfile')
+
+
+def imported_modules(statement):
+    """Runs statement in a new interpreter with -X importtime and returns names of imported modules"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=package_dir,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return {
+        line.rsplit('|', 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith('import time:') and '|' in line
+    }
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_ini_only_import_skips_vault_client(self):
+        ### Run ###
+
+        modules = imported_modules('import configorm; configorm.IniConnector("config.ini")')
+
+        ### Assertions ###
+
+        self.assertIn('configorm', modules)
+        self.assertEqual(sorted(name for name in modules if name.split('.')[0] in VAULT_MODULES), [])
+
+    def test_ini_only_import_skips_optional_modules(self):
+        ### Setup ###
+
+        preloaded = imported_modules('pass')
+
+        ### Run ###
+
+        modules = imported_modules('import configorm; configorm.IniConnector("config.ini").get_value("a", "b")')
+        modules -= preloaded
+
+        ### Assertions ###
+
+        self.assertEqual(sorted(name for name in OPTIONAL_MODULES if name in modules), [])
+
+    def test_vault_connector_imports_vault_client(self):
+        ### Run ###
+
+        modules = imported_modules('import configorm; configorm.VaultConnector("kv", "http://localhost:8200", "token")')
+
+        ### Assertions ###
+
+        self.assertIn('hvac', modules)
@@ -0,0 +1,340 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from configorm import IniConnector
+from configorm.connectors import Connector, _canonical
+
+package_dir = os.path.abspath(os.path.dirname(__file__))
+fixture_config = os.path.join(package_dir, 'fixtures/config.ini')
+
+
+class TestIniConnector(unittest.TestCase):
+    """
+    Base class for "IniConnector" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.connection_string = os.path.join(self.temp_dir, 'config.ini')
+        shutil.copy(fixture_config, self.connection_string)
+        self.connector = IniConnector(connection_string=self.connection_string)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        shutil.rmtree(self.temp_dir)
+
+
+class TestParsedDocumentCache(TestIniConnector):
+
+    def test_repeated_reads_hit_cache(self):
+        ### Run ###
+
+        for _ in range(5):
+            self.connector.get_value(section_name='SectionA', attr_name='string_field')
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.cache_misses, 1)
+        self.assertEqual(self.connector.cache_hits, 4)
+
+    def test_external_change_invalidates_cache(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='SectionA', attr_name='string_field')
+        with open(self.connection_string, 'a') as file:
+            file.write('\n[SectionC]\nnew_field = new value\n')
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='SectionC', attr_name='new_field')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'new value')
+        self.assertEqual(self.connector.cache_misses, 2)
+
+    def test_replaced_file_invalidates_cache(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='SectionA', attr_name='string_field')
+        replacement = os.path.join(self.temp_dir, 'replacement.ini')
+        with open(replacement, 'w') as file:
+            file.write('[SectionA]\nstring_field = Replaced\n')
+        os.replace(replacement, self.connection_string)
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='SectionA', attr_name='string_field')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'Replaced')
+
+    def test_own_write_keeps_cache_valid(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='SectionA', attr_name='string_field')
+
+        ### Run ###
+
+        self.connector.set_value(section_name='SectionA', attr_name='string_field', value='Updated')
+        result = self.connector.get_value(section_name='SectionA', attr_name='string_field')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'Updated')
+        self.assertEqual(self.connector.cache_misses, 1)
+
+    def test_missing_file(self):
+        ### Setup ###
+
+        os.remove(self.connection_string)
+
+        ### Run and Assertions ###
+
+        self.assertIsNone(self.connector.get_value(section_name='SectionA', attr_name='string_field'))
+        self.assertFalse(self.connector.is_section_exist(section_name='SectionA'))
+
+
+class TestNameIndex(TestIniConnector):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        with open(self.connection_string, 'a') as file:
+            file.write('\n[Some Section]\nConnection Port = 5000\n')
+
+    def test_get_value_normalized_names(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='some_section', attr_name='connection_port'), '5000')
+        self.assertEqual(self.connector.get_value(section_name='SOME SECTION', attr_name='Connection_Port'), '5000')
+
+    def test_is_exist_normalized_names(self):
+        ### Run and Assertions ###
+
+        self.assertTrue(self.connector.is_section_exist(section_name='some_section'))
+        self.assertTrue(self.connector.is_attr_exist(section_name='some_section', attr_name='connection_port'))
+        self.assertFalse(self.connector.is_attr_exist(section_name='some_section', attr_name='missing'))
+        self.assertFalse(self.connector.is_attr_exist(section_name='missing', attr_name='connection_port'))
+
+    def test_set_value_keeps_raw_names(self):
+        ### Run ###
+
+        self.connector.set_value(section_name='some_section', attr_name='connection_port', value=6000)
+
+        ### Assertions ###
+
+        with open(self.connection_string) as file:
+            content = file.read()
+        self.assertIn('[Some Section]\nconnection port = 6000', content)
+
+    def test_add_attr_into_section_with_spaces(self):
+        ### Run ###
+
+        self.connector.add_section(section_name='New_Section')
+        self.connector.add_attr(section_name='New_Section', attr_name='new_attr', value=1)
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='new_section', attr_name='new_attr'), '1')
+        reread = IniConnector(connection_string=self.connection_string)
+        self.assertEqual(reread.get_value(section_name='new section', attr_name='new attr'), '1')
+
+
+    def test_canonical_names_are_not_converted(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='some_section', attr_name='connection_port')
+        before = _canonical.cache_info()
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='some_section', attr_name='connection_port')
+
+        ### Assertions ###
+
+        self.assertEqual(result, '5000')
+        after = _canonical.cache_info()
+        self.assertEqual((after.hits, after.misses), (before.hits, before.misses))
+
+    def test_indexing_keeps_name_cache(self):
+        ### Setup ###
+
+        with open(self.connection_string, 'a') as file:
+            file.write('\n[Large]\n' + ''.join(f'key {number} = {number}\n' for number in range(2000)))
+        _canonical.cache_clear()
+        _canonical('Some Section')
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='large', attr_name='key_1999')
+
+        ### Assertions ###
+
+        self.assertEqual(result, '1999')
+        self.assertEqual(_canonical.cache_info().currsize, 1)
+
+
+class TestTransaction(TestIniConnector):
+
+    def test_changes_are_written_once(self):
+        ### Setup ###
+
+        self.connector._flush = Mock(wraps=self.connector._flush)
+
+        ### Run ###
+
+        with self.connector.transaction():
+            for index in range(100):
+                self.connector.add_section(section_name=f'section_{index}')
+                self.connector.add_attr(section_name=f'section_{index}', attr_name='attr', value=index)
+                self.connector.set_value(section_name=f'section_{index}', attr_name='attr', value=index + 1)
+
+        ### Assertions ###
+
+        self.connector._flush.assert_called_once_with()
+        self.assertEqual(self.connector.cache_misses, 1)
+        reread = IniConnector(connection_string=self.connection_string)
+        self.assertEqual(reread.get_value(section_name='section_99', attr_name='attr'), '100')
+
+    def test_changes_are_staged_until_exit(self):
+        ### Run and Assertions ###
+
+        with self.connector.transaction():
+            self.connector.set_value(section_name='SectionA', attr_name='string_field', value='Staged')
+            with self.connector.transaction():
+                self.connector.set_value(section_name='SectionA', attr_name='integer_field', value=1)
+
+            reread = IniConnector(connection_string=self.connection_string)
+            self.assertEqual(reread.get_value(section_name='SectionA', attr_name='string_field'), 'Test String')
+            self.assertEqual(self.connector.get_value(section_name='SectionA', attr_name='string_field'), 'Staged')
+
+        reread = IniConnector(connection_string=self.connection_string)
+        self.assertEqual(reread.get_value(section_name='SectionA', attr_name='string_field'), 'Staged')
+        self.assertEqual(reread.get_value(section_name='SectionA', attr_name='integer_field'), '1')
+
+    def test_changes_are_discarded_on_error(self):
+        ### Run ###
+
+        with self.assertRaises(RuntimeError):
+            with self.connector.transaction():
+                self.connector.set_value(section_name='SectionA', attr_name='string_field', value='Discarded')
+                raise RuntimeError
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='SectionA', attr_name='string_field'), 'Test String')
+
+    def test_config_is_created_on_exit(self):
+        ### Setup ###
+
+        os.remove(self.connection_string)
+
+        ### Run ###
+
+        with self.connector.transaction():
+            self.connector.create_config()
+            self.connector.add_section(section_name='SectionC')
+            self.assertFalse(os.path.exists(self.connection_string))
+
+        ### Assertions ###
+
+        self.assertTrue(self.connector.is_section_exist(section_name='SectionC'))
+        self.assertEqual(os.listdir(self.temp_dir), ['config.ini'])
+
+    def test_write_keeps_file_mode(self):
+        ### Setup ###
+
+        os.chmod(self.connection_string, 0o640)
+
+        ### Run ###
+
+        self.connector.set_value(section_name='SectionA', attr_name='string_field', value='Updated')
+
+        ### Assertions ###
+
+        self.assertEqual(os.stat(self.connection_string).st_mode & 0o777, 0o640)
+
+    def test_new_file_mode_follows_umask(self):
+        ### Setup ###
+
+        os.remove(self.connection_string)
+        umask = os.umask(0o077)
+        self.addCleanup(os.umask, umask)
+
+        ### Run ###
+
+        self.connector.create_config()
+        self.connector.add_section(section_name='SectionC')
+
+        ### Assertions ###
+
+        self.assertEqual(os.stat(self.connection_string).st_mode & 0o777, 0o600)
+
+    @unittest.skipUnless(hasattr(os, 'geteuid') and os.geteuid() == 0, 'changing file owner requires root')
+    def test_write_keeps_file_owner(self):
+        ### Setup ###
+
+        os.chown(self.connection_string, 1234, 5678)
+
+        ### Run ###
+
+        self.connector.set_value(section_name='SectionA', attr_name='string_field', value='Updated')
+
+        ### Assertions ###
+
+        stat = os.stat(self.connection_string)
+        self.assertEqual((stat.st_uid, stat.st_gid), (1234, 5678))
+
+
+class TestGetSection(TestIniConnector):
+
+    def test_all_attrs(self):
+        ### Run ###
+
+        result = self.connector.get_section(section_name='sectiona')
+
+        ### Assertions ###
+
+        self.assertEqual(result['string_field'], 'Test String')
+        self.assertEqual(result['list_of_int'], '[1, 2, 3]')
+        self.assertIsNone(result['null_value'])
+        self.assertEqual(len(result), 9)
+
+    def test_selected_attrs(self):
+        ### Run ###
+
+        result = self.connector.get_section(section_name='SectionA', attr_names=['integer_field', 'missing'])
+
+        ### Assertions ###
+
+        self.assertEqual(result, {'integer_field': '42'})
+
+    def test_missing_section(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.connector.get_section(section_name='missing', attr_names=['field']), {})
+
+
+class TestDefaultGetSection(unittest.TestCase):
+
+    def test_values_are_read_with_get_value(self):
+        ### Setup ###
+
+        class PlainIniConnector(IniConnector):
+            get_section = Connector.get_section
+
+        connector = PlainIniConnector(connection_string=fixture_config)
+
+        ### Run ###
+
+        result = connector.get_section(section_name='SectionA', attr_names=['string_field', 'Missing'])
+
+        ### Assertions ###
+
+        self.assertEqual(result, {'string_field': 'Test String', 'missing': None})
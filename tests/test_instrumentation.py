@@ -0,0 +1,244 @@
+import asyncio
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from configorm import AsyncVaultConnector, IniConnector, Section, StringField, VaultConnector
+from configorm.instrumentation import LATENCY_BUCKETS, CallStats, InstrumentationHook
+from fake_vault import FakeVault
+
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+
+
+class TestCallStats(unittest.TestCase):
+
+    def test_histogram(self):
+        ### Setup ###
+
+        stats = CallStats()
+
+        ### Run ###
+
+        stats.add(5e-7, error=False)
+        stats.add(2e-3, error=True)
+        stats.add(5.0, error=False)
+
+        ### Assertions ###
+
+        result = stats.as_dict()
+        self.assertEqual(result['calls'], 3)
+        self.assertEqual(result['errors'], 1)
+        self.assertEqual(result['max_time'], 5.0)
+        self.assertEqual(result['histogram'][1e-6], 1)
+        self.assertEqual(result['histogram'][1e-2], 1)
+        self.assertEqual(result['histogram'][float('inf')], 1)
+        self.assertEqual(sum(result['histogram'].values()), 3)
+        self.assertEqual(list(result['histogram']), list(LATENCY_BUCKETS))
+
+
+class TestIniInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'config.ini')
+        with open(self.path, 'w') as file:
+            file.write('[Database]\nserver = 10.10.10.10\n\n[General Settings]\nname = app\n')
+        self.connector = IniConnector(connection_string=self.path)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_disabled(self):
+        ### Run ###
+
+        self.connector.get_value(section_name='Database', attr_name='server')
+
+        ### Assertions ###
+
+        result = self.connector.stats()
+        self.assertFalse(result['enabled'])
+        self.assertEqual(result['methods'], {})
+        self.assertNotIn('get_value', vars(self.connector))
+
+    def test_calls_by_method_and_section(self):
+        ### Setup ###
+
+        self.connector.enable_instrumentation()
+
+        ### Run ###
+
+        for _ in range(3):
+            self.connector.get_value(section_name='Database', attr_name='server')
+        self.connector.get_value(section_name='general_settings', attr_name='name')
+        self.connector.is_section_exist('General Settings')
+        self.connector.is_config_exist()
+
+        ### Assertions ###
+
+        result = self.connector.stats()
+        self.assertTrue(result['enabled'])
+        self.assertEqual(result['connector'], 'IniConnector')
+        self.assertEqual(result['methods']['get_value']['calls'], 4)
+        self.assertEqual(result['methods']['is_config_exist']['calls'], 1)
+        self.assertEqual(result['sections']['database']['get_value']['calls'], 3)
+        self.assertEqual(result['sections']['general_settings']['get_value']['calls'], 1)
+        self.assertEqual(result['sections']['general_settings']['is_section_exist']['calls'], 1)
+
+    def test_cache_and_bytes_read(self):
+        ### Setup ###
+
+        self.connector.enable_instrumentation()
+
+        ### Run ###
+
+        self.connector.get_value(section_name='Database', attr_name='server')
+        self.connector.get_value(section_name='Database', attr_name='server')
+
+        ### Assertions ###
+
+        result = self.connector.stats()
+        self.assertEqual((result['cache']['hits'], result['cache']['misses']), (1, 1))
+        self.assertEqual(result['bytes_read']['total'], os.path.getsize(self.path))
+
+    def test_errors(self):
+        ### Setup ###
+
+        self.connector.enable_instrumentation()
+
+        ### Run ###
+
+        with self.assertRaises(AttributeError):
+            self.connector.get_value(section_name=None, attr_name='server')
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.stats()['methods']['get_value']['errors'], 1)
+
+    def test_section_reads(self):
+        ### Setup ###
+
+        ini_connector = self.connector
+
+        class Database(Section):
+            class Meta:
+                connector = ini_connector
+
+            server = StringField()
+
+        self.connector.enable_instrumentation()
+
+        ### Run ###
+
+        result = Database.server
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+        self.assertEqual(self.connector.stats()['sections']['database']['get_value']['calls'], 1)
+
+    def test_hooks(self):
+        ### Setup ###
+
+        hook = Mock(spec=InstrumentationHook)
+        self.connector.enable_instrumentation(hooks=[hook])
+
+        ### Run ###
+
+        self.connector.get_value(section_name='Database', attr_name='server')
+
+        ### Assertions ###
+
+        hook.pre_call.assert_called_once_with(self.connector, 'get_value', 'database')
+        hook.post_call.assert_called_once()
+        self.assertEqual(hook.post_call.call_args[0][:3], (self.connector, 'get_value', 'database'))
+        self.assertIsNone(hook.post_call.call_args[0][4])
+        hook.on_cache.assert_called_once_with(self.connector, None, False)
+        hook.on_read.assert_called_once_with(self.connector, None, os.path.getsize(self.path))
+
+    def test_hook_error_is_logged(self):
+        ### Setup ###
+
+        hook = Mock(spec=InstrumentationHook)
+        hook.pre_call.side_effect = RuntimeError
+        self.connector.enable_instrumentation(hooks=[hook])
+
+        ### Run ###
+
+        with self.assertLogs('configorm.instrumentation', level='WARNING'):
+            result = self.connector.get_value(section_name='Database', attr_name='server')
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+
+    def test_disable(self):
+        ### Setup ###
+
+        self.connector.enable_instrumentation()
+        self.connector.get_value(section_name='Database', attr_name='server')
+
+        ### Run ###
+
+        self.connector.disable_instrumentation()
+
+        ### Assertions ###
+
+        self.assertNotIn('get_value', vars(self.connector))
+        self.assertEqual(self.connector.stats()['methods'], {})
+
+
+class TestVaultInstrumentation(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.vault = FakeVault().start()
+        self.vault.put('TEST/', 'DATABASE', {'SERVER': '10.10.10.10', 'PORT': '5432'})
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        self.vault.stop()
+
+    def test_cache_by_section(self):
+        ### Setup ###
+
+        connector = VaultConnector(mount_point='TEST/', url=self.vault.url, token=self.vault.token, cache_ttl=60)
+        connector.enable_instrumentation()
+
+        ### Run ###
+
+        connector.get_value(section_name='Database', attr_name='server')
+        connector.get_value(section_name='Database', attr_name='port')
+
+        ### Assertions ###
+
+        result = connector.stats()
+        self.assertEqual(result['cache']['sections'], {'database': {'hits': 1, 'misses': 1}})
+        self.assertGreater(result['bytes_read']['sections']['database'], 0)
+        self.assertEqual(result['sections']['database']['get_value']['calls'], 2)
+
+    @unittest.skipUnless(HAS_AIOHTTP, 'aiohttp is not installed')
+    def test_async_reads(self):
+        ### Setup ###
+
+        connector = AsyncVaultConnector(mount_point='TEST/', url=self.vault.url, token=self.vault.token)
+        connector.enable_instrumentation()
+
+        async def read():
+            async with connector:
+                return await connector.aget_value(section_name='Database', attr_name='server')
+
+        ### Run ###
+
+        result = asyncio.run(read())
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+        stats = connector.stats()
+        self.assertEqual(stats['sections']['database']['aget_value']['calls'], 1)
+        self.assertGreater(stats['bytes_read']['total'], 0)
@@ -0,0 +1,281 @@
+import unittest
+from array import array
+from unittest.mock import Mock
+
+from configorm import ListField, Section
+from configorm.lists import LazyList, parse_array, tokenize
+
+
+class TestTokenize(unittest.TestCase):
+
+    def test_bare_elements(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(tokenize('[1, 2,3 ]'), ['1', '2', '3'])
+        self.assertEqual(tokenize('a, b c ,d'), ['a', 'b c', 'd'])
+
+    def test_quoted_elements(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(tokenize("['a', 'b']"), ['a', 'b'])
+        self.assertEqual(tokenize('["a", "b"]'), ['a', 'b'])
+        self.assertEqual(tokenize("['a, b', ' c ']"), ['a, b', ' c '])
+        self.assertEqual(tokenize("[\"it's\", 'x']"), ["it's", 'x'])
+
+    def test_escapes(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(tokenize(r"['it\'s', 'back\\slash', 'new\nline']"), ["it's", 'back\\slash', 'new\nline'])
+
+    def test_empty_list(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(tokenize('[]'), [])
+        self.assertEqual(tokenize(' [ ] '), [])
+        self.assertEqual(tokenize(''), [])
+
+    def test_round_trip(self):
+        ### Setup ###
+
+        value = ['plain', 'with, comma', "it's", 'both \' and "', 'tab\tand\\', '[brackets]', '']
+
+        ### Run and Assertions ###
+
+        self.assertEqual(tokenize(str(value)), value)
+
+
+class TestListFieldCast(unittest.TestCase):
+
+    def test_int(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(ListField(var_type=int).cast_value('[1, -2, 3]'), [1, -2, 3])
+
+    def test_float(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(ListField(var_type=float).cast_value('[1.5, 2, -3e2]'), [1.5, 2.0, -300.0])
+
+    def test_bool(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(ListField(var_type=bool).cast_value("[True, 'false', 0, 1, yes]"),
+                         [True, False, False, True, True])
+
+    def test_str(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(ListField(var_type=str).cast_value("['a, b', c]"), ['a, b', 'c'])
+
+    def test_invalid_element(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError):
+            ListField(var_type=int).cast_value('[1, two]')
+
+    def test_unknown_type(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(Exception):
+            ListField(var_type=dict)
+
+
+class TestParseArray(unittest.TestCase):
+
+    def test_int(self):
+        ### Run ###
+
+        result = parse_array('[1, -2, 3]', int)
+
+        ### Assertions ###
+
+        self.assertEqual(result, array('q', [1, -2, 3]))
+
+    def test_float(self):
+        ### Run ###
+
+        result = parse_array('[1.5, 2, -3e2]', float)
+
+        ### Assertions ###
+
+        self.assertEqual(result, array('d', [1.5, 2.0, -300.0]))
+
+    def test_fallback_formats(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(parse_array("['1', '2']", int), array('q', [1, 2]))
+        self.assertEqual(parse_array('[inf, nan]', float)[0], float('inf'))
+        self.assertEqual(parse_array('[]', int), array('q'))
+
+    def test_invalid_element(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError):
+            parse_array('[1, 2.5]', int)
+
+    def test_booleans_are_rejected(self):
+        ### Run and Assertions ###
+
+        for var_type in (int, float):
+            with self.subTest(var_type=var_type), self.assertRaises(ValueError):
+                parse_array('[true, false]', var_type)
+
+
+class TestCompactContainers(unittest.TestCase):
+
+    def create_section(self, list_field, value='[1, 2, 3]'):
+        class BaseSection(Section):
+            class Meta:
+                connector = Mock()
+                connector.get_value = Mock(return_value=value)
+
+        class TestSection(BaseSection):
+            field = list_field
+
+        return TestSection
+
+    def test_array(self):
+        ### Setup ###
+
+        section = self.create_section(ListField(var_type=int, container='array'))
+
+        ### Run ###
+
+        result = section.field
+        result[0] = 10
+
+        ### Assertions ###
+
+        self.assertEqual(section.field, array('q', [1, 2, 3]))
+
+    def test_memoryview(self):
+        ### Setup ###
+
+        section = self.create_section(ListField(var_type=float, container='memoryview'))
+
+        ### Run ###
+
+        result = section.field
+
+        ### Assertions ###
+
+        self.assertTrue(result.readonly)
+        self.assertEqual(result.tolist(), [1.0, 2.0, 3.0])
+        self.assertIs(section.field, result)
+
+    def test_element_out_of_range(self):
+        ### Setup ###
+
+        section = self.create_section(ListField(var_type=int, container='array'), value='[1, 9223372036854775808]')
+
+        ### Run and Assertions ###
+
+        with self.assertRaisesRegex(ValueError, "TestSection.field .* 'q'"):
+            section.field
+
+    def test_unsupported_type(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(Exception):
+            ListField(var_type=str, container='array')
+
+    def test_unknown_container(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(Exception):
+            ListField(var_type=int, container='tuple')
+
+
+class TestLazyList(unittest.TestCase):
+
+    def test_elements_match_tokenizer(self):
+        ### Setup ###
+
+        values = ['[1, 2,3 ]', 'a, b c ,d', "['a, b', ' c ', bare]", r"['it\'s', \"x\", 'new\nline']", '[]', 'a,,b']
+
+        ### Run and Assertions ###
+
+        for value in values:
+            self.assertEqual(list(LazyList(value)), tokenize(value), value)
+
+    def test_indexing(self):
+        ### Setup ###
+
+        result = LazyList('[1, 2, 3, 4]', int)
+
+        ### Run and Assertions ###
+
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result[0], 1)
+        self.assertEqual(result[-1], 4)
+        self.assertEqual(result[1:3], [2, 3])
+        self.assertEqual(result.index(3), 2)
+        with self.assertRaises(IndexError):
+            result[4]
+
+    def test_elements_are_converted_on_access(self):
+        ### Setup ###
+
+        convert = Mock(side_effect=int)
+        result = LazyList('[1, 2, 3, 4]', convert)
+
+        ### Run ###
+
+        element = result[2]
+
+        ### Assertions ###
+
+        self.assertEqual(element, 3)
+        convert.assert_called_once_with('3')
+
+    def test_member_set(self):
+        ### Setup ###
+
+        convert = Mock(side_effect=str)
+        result = LazyList("['alice', 'bob']", convert, member_set=True)
+
+        ### Run and Assertions ###
+
+        self.assertIn('bob', result)
+        self.assertNotIn('carol', result)
+        self.assertNotIn(['bob'], result)
+        self.assertEqual(convert.call_count, 2)
+
+    def test_read_only(self):
+        ### Setup ###
+
+        result = LazyList('[1, 2]', int)
+
+        ### Run and Assertions ###
+
+        with self.assertRaises(TypeError):
+            result[0] = 3
+        self.assertEqual(result, [1, 2])
+
+    def test_lazy_field(self):
+        ### Setup ###
+
+        class BaseSection(Section):
+            class Meta:
+                connector = Mock()
+                connector.get_value = Mock(return_value='[true, 0, false]')
+
+        class TestSection(BaseSection):
+            field = ListField(var_type=bool, container='lazy', member_set=True)
+
+        ### Run ###
+
+        result = TestSection.field
+
+        ### Assertions ###
+
+        self.assertIsInstance(result, LazyList)
+        self.assertEqual(list(result), [True, False, False])
+        self.assertIn(True, result)
+        self.assertIs(TestSection.field, result)
+
+    def test_member_set_requires_lazy_container(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(Exception):
+            ListField(var_type=str, member_set=True)
@@ -0,0 +1,178 @@
+import os
+import shutil
+import tempfile
+import unittest
+from configparser import ConfigParser
+from unittest.mock import patch
+
+from configorm import IniConnector
+from configorm.parse_cache import CACHE_DIR, read_config, sidecar_path
+
+CONFIG = '[DEFAULT]\nshared = default value\n\n[Some Section]\nConnection Port = 5000\nflag\nmulti = first\n  second\n'
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'config.ini')
+        with open(self.path, 'w') as file:
+            file.write(CONFIG)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        shutil.rmtree(self.temp_dir)
+
+    def assert_same_config(self, first, second):
+        self.assertEqual(first.sections(), second.sections())
+        self.assertEqual(first.defaults(), second.defaults())
+        for section in first.sections():
+            self.assertEqual(dict(first[section]), dict(second[section]))
+
+    def test_sidecar_is_written(self):
+        ### Run ###
+
+        read_config(self.path)
+
+        ### Assertions ###
+
+        self.assertTrue(os.path.exists(sidecar_path(self.path)))
+        self.assertEqual(os.path.dirname(sidecar_path(self.path)), os.path.join(self.temp_dir, CACHE_DIR))
+
+    def test_sidecar_is_loaded(self):
+        ### Setup ###
+
+        read_config(self.path)
+        expected = ConfigParser(allow_no_value=True)
+        expected.read(self.path)
+
+        ### Run ###
+
+        with patch.object(ConfigParser, 'read_file') as read_file:
+            result = read_config(self.path)
+
+        ### Assertions ###
+
+        read_file.assert_not_called()
+        self.assert_same_config(result, expected)
+        self.assertIsNone(result['Some Section']['flag'])
+        self.assertEqual(result['Some Section']['shared'], 'default value')
+        result.set('Some Section', 'connection port', '6000')
+        self.assertEqual(result['Some Section']['connection port'], '6000')
+
+    def test_default_interpolation(self):
+        ### Setup ###
+
+        with open(self.path, 'w') as file:
+            file.write('[DEFAULT]\nbase = /opt\n\n[Paths]\nlogs = %(base)s/logs\n\n'
+                       '[Other]\nbase = /srv\ndata = %(base)s/data\n')
+        read_config(self.path)
+        expected = ConfigParser(allow_no_value=True)
+        expected.read(self.path)
+
+        ### Run ###
+
+        with patch.object(ConfigParser, 'read_file') as read_file:
+            result = read_config(self.path)
+
+        ### Assertions ###
+
+        read_file.assert_not_called()
+        self.assert_same_config(result, expected)
+        self.assertEqual(result['Paths']['logs'], '/opt/logs')
+        self.assertEqual(result['Other']['data'], '/srv/data')
+        self.assertEqual(result.get('Paths', 'logs', raw=True), '%(base)s/logs')
+
+    def test_restore_without_parser_storage(self):
+        ### Setup ###
+
+        expected = read_config(self.path)
+
+        ### Run ###
+
+        with patch('configorm.parse_cache._has_storage', return_value=False), \
+                patch.object(ConfigParser, 'read_file') as read_file:
+            result = read_config(self.path)
+
+        ### Assertions ###
+
+        read_file.assert_not_called()
+        self.assert_same_config(result, expected)
+        self.assertEqual(result['Some Section']['shared'], 'default value')
+
+    def test_changed_content_is_parsed(self):
+        ### Setup ###
+
+        read_config(self.path)
+        stat = os.stat(self.path)
+        with open(self.path, 'w') as file:
+            file.write(CONFIG.replace('5000', '6000'))
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        ### Run ###
+
+        result = read_config(self.path)
+
+        ### Assertions ###
+
+        self.assertEqual(result['Some Section']['connection port'], '6000')
+        with patch.object(ConfigParser, 'read_file') as read_file:
+            self.assertEqual(read_config(self.path)['Some Section']['connection port'], '6000')
+        read_file.assert_not_called()
+
+    def test_damaged_sidecar_is_rebuilt(self):
+        ### Setup ###
+
+        read_config(self.path)
+        with open(sidecar_path(self.path), 'wb') as file:
+            file.write(b'damaged')
+
+        ### Run ###
+
+        result = read_config(self.path)
+
+        ### Assertions ###
+
+        self.assertEqual(result['Some Section']['connection port'], '5000')
+        with patch.object(ConfigParser, 'read_file') as read_file:
+            read_config(self.path)
+        read_file.assert_not_called()
+
+    def test_unwritable_cache_dir(self):
+        ### Setup ###
+
+        cache_dir = os.path.join(self.temp_dir, 'file')
+        with open(cache_dir, 'w'):
+            pass
+
+        ### Run ###
+
+        result = read_config(self.path, cache_dir=cache_dir)
+
+        ### Assertions ###
+
+        self.assertEqual(result['Some Section']['connection port'], '5000')
+
+    def test_missing_file(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(read_config(os.path.join(self.temp_dir, 'missing.ini')).sections(), [])
+
+    def test_connector(self):
+        ### Setup ###
+
+        cache_dir = os.path.join(self.temp_dir, 'cache')
+        IniConnector(connection_string=self.path, parse_cache=True, cache_dir=cache_dir).get_section('some_section')
+
+        ### Run ###
+
+        with patch.object(ConfigParser, 'read_file') as read_file:
+            connector = IniConnector(connection_string=self.path, parse_cache=True, cache_dir=cache_dir)
+            result = connector.get_value(section_name='some_section', attr_name='connection_port')
+
+        ### Assertions ###
+
+        read_file.assert_not_called()
+        self.assertEqual(result, '5000')
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
@@ -0,0 +1,97 @@
+import time
+import unittest
+from unittest.mock import Mock
+
+from configorm import *
+
+
+def slow_get_section(section_name, attr_names=None):
+    time.sleep(0.05)
+    if section_name == 'broken':
+        raise ConnectionError('Source is unavailable')
+    return {name: '1' for name in attr_names}
+
+
+class TestPreload(unittest.TestCase):
+    """
+    Base class for "Section.preload" tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.connector = Mock()
+        self.connector.get_section = Mock(side_effect=slow_get_section)
+
+        class BaseSection(Section):
+            class Meta:
+                connector = self.connector
+
+        class First(BaseSection):
+            field = IntegerField()
+
+        class Second(BaseSection):
+            field = IntegerField()
+
+        class Nested(Second):
+            other = IntegerField()
+
+        class Broken(BaseSection):
+            field = IntegerField()
+
+        self.base = BaseSection
+        self.sections = [First, Second, Broken, Nested]
+
+
+class TestIterSections(TestPreload):
+
+    def test_all_sections_with_fields(self):
+        ### Run ###
+
+        result = list(self.base.iter_sections())
+
+        ### Assertions ###
+
+        self.assertEqual(result, self.sections)
+
+
+class TestPreloadReport(TestPreload):
+
+    def test_each_section_is_read_once(self):
+        ### Run ###
+
+        self.base.preload()
+
+        ### Assertions ###
+
+        calls = sorted(
+            (call[1]['section_name'], call[1]['attr_names']) for call in self.connector.get_section.call_args_list
+        )
+        self.assertEqual(calls, [
+            ('broken', ['field']),
+            ('first', ['field']),
+            ('nested', ['other']),
+            ('second', ['field'])
+        ])
+
+    def test_failures_are_reported(self):
+        ### Run ###
+
+        report = self.base.preload()
+
+        ### Assertions ###
+
+        self.assertFalse(report.ok)
+        self.assertEqual([result.section for result in report.results], self.sections)
+        self.assertEqual(len(report.failures), 1)
+        self.assertIs(report.failures[0].section, self.sections[2])
+        self.assertIsInstance(report.failures[0].error, ConnectionError)
+        self.assertTrue(all(result.elapsed >= 0.05 for result in report.results))
+
+    def test_sections_are_loaded_in_parallel(self):
+        ### Run ###
+
+        report = self.base.preload(max_workers=4)
+
+        ### Assertions ###
+
+        self.assertLess(report.elapsed, sum(result.elapsed for result in report.results))
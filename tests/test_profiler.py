@@ -0,0 +1,229 @@
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from configorm import AccessProfiler, IniConnector, IntegerField, Section, StringField
+from configorm.profiler import recommend_ttl
+
+CONFIG = '[Database]\nserver = 10.10.10.10\nport = 5432\n\n[General]\nname = app\n'
+
+
+class FakeTimer(object):
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRecommendTTL(unittest.TestCase):
+
+    def test_periodic_reads(self):
+        ### Setup ###
+
+        timestamps = [float(second) for second in range(100)]
+
+        ### Run ###
+
+        result = recommend_ttl(timestamps, target_hit_rate=0.9)
+
+        ### Assertions ###
+
+        self.assertGreater(result, 9.0)
+        self.assertLessEqual(result, 10.0 + 1e-6)
+
+    def test_not_reachable(self):
+        ### Run and Assertions ###
+
+        self.assertIsNone(recommend_ttl([0.0, 1.0], target_hit_rate=0.9))
+        self.assertIsNone(recommend_ttl([0.0], target_hit_rate=0.1))
+
+
+class TestAccessProfiler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, 'config.ini')
+        with open(path, 'w') as file:
+            file.write(CONFIG)
+        ini_connector = IniConnector(connection_string=path)
+
+        class BaseSection(Section):
+            class Meta:
+                connector = ini_connector
+
+        class Database(BaseSection):
+            server = StringField()
+            port = IntegerField()
+
+        class General(BaseSection):
+            name = StringField()
+
+        self.database, self.general = Database, General
+        self.timer = FakeTimer()
+        self.profiler = AccessProfiler(timer=self.timer)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        self.profiler.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def read(self, count, step, section, field_name):
+        for _ in range(count):
+            getattr(section, field_name)
+            self.timer.now += step
+
+    def test_not_started(self):
+        ### Run ###
+
+        self.database.server
+
+        ### Assertions ###
+
+        self.assertEqual(self.profiler.report()['reads'], 0)
+
+    def test_field_stats(self):
+        ### Run ###
+
+        with self.profiler:
+            self.read(10, 0.5, self.database, 'server')
+            self.read(1, 0.5, self.general, 'name')
+
+        ### Assertions ###
+
+        report = self.profiler.report()
+        self.assertEqual(report['reads'], 11)
+        self.assertEqual(report['duration'], 5.5)
+        server = report['fields'][0]
+        self.assertEqual((server['section'], server['field'], server['reads']), ('Database', 'server', 10))
+        self.assertEqual(server['mean_interval'], 0.5)
+        self.assertEqual(report['fields'][1]['mean_interval'], None)
+
+    def test_zero_duration(self):
+        ### Run ###
+
+        with self.profiler:
+            self.database.server
+
+        ### Assertions ###
+
+        report = self.profiler.report()
+        self.assertIsNone(report['fields'][0]['rate'])
+        self.assertEqual(len(report['hot_fields']), 1)
+        self.assertNotIn('Infinity', json.dumps(report))
+        self.assertIn('Database.server: 1 reads, n/a', self.profiler.format_report())
+
+    def test_call_sites(self):
+        ### Run ###
+
+        with self.profiler:
+            self.database.server
+
+        ### Assertions ###
+
+        (call_site, count), = self.profiler.report()['fields'][0]['call_sites']
+        self.assertTrue(call_site.startswith(f'{__file__}:'))
+        self.assertEqual(count, 1)
+
+    def test_async_call_sites(self):
+        ### Setup ###
+
+        async def read():
+            return await self.database.aget('server')
+
+        ### Run ###
+
+        with self.profiler:
+            result = asyncio.run(read())
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+        (call_site, _), = self.profiler.report()['fields'][0]['call_sites']
+        self.assertTrue(call_site.startswith(f'{__file__}:'))
+
+    def test_recommendations(self):
+        ### Run ###
+
+        with self.profiler:
+            for _ in range(20):
+                self.read(1, 0.1, self.database, 'server')
+                self.read(1, 0.1, self.database, 'port')
+            self.read(1, 0.1, self.general, 'name')
+
+        ### Assertions ###
+
+        report = self.profiler.report(hot_rate=1.0, target_hit_rate=0.5)
+        self.assertEqual(
+            [(field['section'], field['field']) for field in report['hot_fields']],
+            [('Database', 'server'), ('Database', 'port')]
+        )
+        self.assertEqual(report['preload_sections'], [
+            {'section': 'Database', 'fields': ['port', 'server'], 'reads': 40}
+        ])
+        self.assertGreater(report['ttls']['Database'], 0.1)
+        self.assertEqual(report['ttls']['General'], None)
+
+    def test_format_report(self):
+        ### Setup ###
+
+        with self.profiler:
+            self.read(3, 0.1, self.database, 'server')
+
+        ### Run ###
+
+        result = self.profiler.format_report()
+
+        ### Assertions ###
+
+        self.assertIn('Database.server: 3 reads', result)
+
+    def test_single_profiler(self):
+        ### Setup ###
+
+        self.profiler.start()
+
+        ### Run and Assertions ###
+
+        with self.assertRaises(RuntimeError):
+            AccessProfiler().start()
+
+
+class TestProfileFromEnvironment(unittest.TestCase):
+
+    def test_report_on_exit(self):
+        ### Setup ###
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        config_path, report_path = os.path.join(temp_dir, 'config.ini'), os.path.join(temp_dir, 'report.json')
+        with open(config_path, 'w') as file:
+            file.write(CONFIG)
+        script = (
+            'from configorm import IniConnector, Section, StringField\n'
+            'class Database(Section):\n'
+            '    class Meta:\n'
+            f'        connector = IniConnector(connection_string={config_path!r})\n'
+            '    server = StringField()\n'
+            'Database.server\n'
+        )
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, CONFIGORM_PROFILE=report_path, PYTHONPATH=package_dir)
+
+        ### Run ###
+
+        subprocess.run([sys.executable, '-c', script], env=env, check=True)
+
+        ### Assertions ###
+
+        with open(report_path) as file:
+            report = json.load(file)
+        self.assertEqual(report['reads'], 1)
+        self.assertEqual(report['fields'][0]['field'], 'server')
@@ -0,0 +1,337 @@
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+
+from configorm import IniConnector, IntegerField, ReloadManager, Section, StringField, VaultConnector
+from fake_vault import FakeVault
+
+CONFIG = '[Database]\nserver = 10.10.10.10\nport = 5432\n\n[General]\nname = app\n'
+
+
+class TestReloadManager(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.connection_string = os.path.join(self.temp_dir, 'config.ini')
+        self.write(CONFIG)
+        ini_connector = IniConnector(connection_string=self.connection_string)
+
+        class BaseSection(Section):
+            class Meta:
+                connector = ini_connector
+
+        class Database(BaseSection):
+            server = StringField()
+            port = IntegerField()
+
+        class General(BaseSection):
+            name = StringField()
+
+        self.base, self.database, self.general = BaseSection, Database, General
+        self.manager = ReloadManager(BaseSection)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        self.manager.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def write(self, content):
+        replacement = os.path.join(self.temp_dir, 'replacement.ini')
+        with open(replacement, 'w') as file:
+            file.write(content)
+        os.replace(replacement, self.connection_string)
+
+    def wait_for_reloads(self, count):
+        deadline = time.monotonic() + 5
+        while self.manager.reloads < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertGreaterEqual(self.manager.reloads, count)
+
+    def test_initial_snapshots(self):
+        ### Run and Assertions ###
+
+        self.assertEqual(self.manager[self.database].server, '10.10.10.10')
+        self.assertEqual(self.manager.get(self.general).name, 'app')
+        self.assertEqual(set(self.manager.snapshots), {self.database, self.general})
+
+    def test_reload_swaps_snapshots(self):
+        ### Setup ###
+
+        old = self.manager[self.database]
+        self.write(CONFIG.replace('5432', '6432'))
+
+        ### Run ###
+
+        changes = self.manager.reload()
+
+        ### Assertions ###
+
+        self.assertEqual(changes, {self.database: {'port': (5432, 6432)}})
+        self.assertEqual(self.manager[self.database].port, 6432)
+        self.assertEqual(old.port, 5432)
+
+    def test_underscore_field_names(self):
+        ### Setup ###
+
+        self.write(CONFIG + '\n[Secrets]\n_token = abc\n')
+
+        class Secrets(self.base):
+            _token = StringField()
+
+        manager = ReloadManager(Secrets)
+        self.addCleanup(manager.stop)
+        self.write(CONFIG + '\n[Secrets]\n_token = xyz\n')
+
+        ### Run ###
+
+        changes = manager.reload()
+
+        ### Assertions ###
+
+        self.assertEqual(changes, {Secrets: {'_token': ('abc', 'xyz')}})
+        self.assertEqual(manager[Secrets]._token, 'xyz')
+
+    def test_subscribers_get_changed_fields_only(self):
+        ### Setup ###
+
+        on_database, on_port, on_server, on_general = Mock(), Mock(), Mock(), Mock()
+        self.manager.subscribe(self.database, on_database)
+        self.manager.subscribe(self.database, on_port, field_name='port')
+        self.manager.subscribe(self.database, on_server, field_name='server')
+        self.manager.subscribe(self.general, on_general)
+        self.write(CONFIG.replace('5432', '6432'))
+
+        ### Run ###
+
+        self.manager.reload()
+
+        ### Assertions ###
+
+        on_database.assert_called_once_with({'port': (5432, 6432)})
+        on_port.assert_called_once_with(5432, 6432)
+        on_server.assert_not_called()
+        on_general.assert_not_called()
+
+    def test_subscriber_error_does_not_stop_reload(self):
+        ### Setup ###
+
+        failing, callback = Mock(side_effect=RuntimeError), Mock()
+        self.manager.subscribe(self.database, failing)
+        self.manager.subscribe(self.database, callback)
+        self.write(CONFIG.replace('5432', '6432'))
+
+        ### Run ###
+
+        with self.assertLogs('configorm.reload', level='WARNING'):
+            self.manager.reload()
+
+        ### Assertions ###
+
+        callback.assert_called_once_with({'port': (5432, 6432)})
+
+    def test_subscriber_may_reload(self):
+        ### Setup ###
+
+        calls = []
+
+        def callback(changed):
+            calls.append(changed)
+            if len(calls) == 1:
+                self.manager.reload()
+
+        self.manager.subscribe(self.database, callback)
+        self.write(CONFIG.replace('5432', '6432'))
+
+        ### Run ###
+
+        thread = threading.Thread(target=self.manager.reload, daemon=True)
+        thread.start()
+        thread.join(5)
+
+        ### Assertions ###
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(calls, [{'port': (5432, 6432)}])
+        self.assertEqual(self.manager.reloads, 3)
+
+    def test_unsubscribe(self):
+        ### Setup ###
+
+        callback = Mock()
+        self.manager.subscribe(self.database, callback, field_name='port')
+        self.manager.unsubscribe(self.database, callback, field_name='port')
+        self.write(CONFIG.replace('5432', '6432'))
+
+        ### Run ###
+
+        self.manager.reload()
+
+        ### Assertions ###
+
+        callback.assert_not_called()
+
+    def test_unknown_field(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(KeyError):
+            self.manager.subscribe(self.database, Mock(), field_name='missing')
+
+    def test_failed_reload_keeps_snapshots(self):
+        ### Setup ###
+
+        old = self.manager[self.database]
+        self.write(CONFIG.replace('5432', 'not a number'))
+
+        ### Run ###
+
+        with self.assertRaises(ValueError):
+            self.manager.reload()
+
+        ### Assertions ###
+
+        self.assertIs(self.manager[self.database], old)
+
+    def test_readers_do_not_block(self):
+        ### Setup ###
+
+        started, release = threading.Event(), threading.Event()
+        connector = self.database.meta.connector
+        get_section = connector.get_section
+
+        def slow_get_section(**kwargs):
+            started.set()
+            release.wait()
+            return get_section(**kwargs)
+
+        connector.get_section = slow_get_section
+        thread = threading.Thread(target=self.manager.reload)
+        thread.start()
+        self.assertTrue(started.wait(5))
+
+        ### Run ###
+
+        try:
+            result = self.manager[self.database].server
+        finally:
+            release.set()
+            thread.join()
+            del connector.get_section
+
+        ### Assertions ###
+
+        self.assertEqual(result, '10.10.10.10')
+
+    def test_request_reload(self):
+        ### Setup ###
+
+        self.manager.start()
+
+        ### Run ###
+
+        self.manager.request_reload()
+
+        ### Assertions ###
+
+        self.wait_for_reloads(2)
+
+    def test_file_change(self):
+        ### Setup ###
+
+        self.manager = ReloadManager(self.base, files=[self.connection_string], poll_interval=0.01)
+        self.manager.start()
+
+        ### Run ###
+
+        self.write(CONFIG + 'debug = True\n')
+
+        ### Assertions ###
+
+        self.wait_for_reloads(2)
+
+    def test_timer(self):
+        ### Setup ###
+
+        self.manager = ReloadManager(self.base, interval=0.01)
+
+        ### Run ###
+
+        self.manager.start()
+
+        ### Assertions ###
+
+        self.wait_for_reloads(3)
+
+    @unittest.skipUnless(hasattr(signal, 'SIGUSR1'), 'Signals are not supported')
+    def test_signal(self):
+        ### Setup ###
+
+        previous = signal.getsignal(signal.SIGUSR1)
+        self.manager.install_signal_handler(signal.SIGUSR1)
+
+        ### Run ###
+
+        try:
+            os.kill(os.getpid(), signal.SIGUSR1)
+            self.wait_for_reloads(2)
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+
+
+class TestReloadVault(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.vault = FakeVault().start()
+        self.vault.put('TEST/', 'DATABASE', {'SERVER': '10.10.10.10'})
+        vault_connector = VaultConnector(
+            mount_point='TEST/',
+            url=self.vault.url,
+            token=self.vault.token,
+            cache_ttl=60,
+            check_version=True
+        )
+
+        class Database(Section):
+            class Meta:
+                connector = vault_connector
+
+            server = StringField()
+
+        self.database = Database
+        self.manager = ReloadManager(Database)
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        self.manager.stop()
+        self.vault.stop()
+
+    def test_unchanged_secret_is_not_downloaded(self):
+        ### Run ###
+
+        changes = self.manager.reload()
+
+        ### Assertions ###
+
+        self.assertEqual(changes, {})
+        self.assertEqual([request.split('?')[0] for request in self.vault.requests],
+                         ['/v1/TEST/data/DATABASE', '/v1/TEST/metadata/DATABASE'])
+
+    def test_changed_secret_is_downloaded(self):
+        ### Setup ###
+
+        self.vault.put('TEST/', 'DATABASE', {'SERVER': '20.20.20.20'})
+
+        ### Run ###
+
+        changes = self.manager.reload()
+
+        ### Assertions ###
+
+        self.assertEqual(changes, {self.database: {'server': ('10.10.10.10', '20.20.20.20')}})
+        self.assertEqual(self.database.server, '20.20.20.20')
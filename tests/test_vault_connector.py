@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 from unittest.mock import patch, PropertyMock, Mock
 
@@ -119,6 +121,37 @@ class TestGetValue(TestVaultConnector):
         mock_os.getenv.assert_called_once_with('SECTION_ATTR_NAME')
 
 
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestGetSection(TestVaultConnector):
+
+    def test_get_section(self, mock__vault_api):
+        ### Setup ###
+
+        response = {
+            'data': {
+                'data': {
+                    'FIRST': 'first_value',
+                    'SECOND': 'second_value'
+                }
+            }
+        }
+        mock__vault_api.return_value.read_secret.return_value = response
+
+        ### Run ###
+
+        everything = self.connector.get_section(section_name='section')
+        selected = self.connector.get_section(section_name='section', attr_names=['first', 'missing'])
+
+        ### Assertions ###
+
+        self.assertEqual(everything, {'first': 'first_value', 'second': 'second_value'})
+        self.assertEqual(selected, {'first': 'first_value'})
+        mock__vault_api.return_value.read_secret.assert_called_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+
+
 @patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
 class TestIsSectionExist(TestVaultConnector):
 
@@ -206,6 +239,44 @@ class TestIsAttrExist(TestVaultConnector):
         self.assertFalse(result)
 
 
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestAttrNameMatching(TestVaultConnector):
+
+    def test_same_rule_on_all_read_paths(self, mock__vault_api):
+        ### Setup ###
+
+        response = {'data': {'data': {'Server Name': 'db', 'PORT': '5432'}}}
+        mock__vault_api.return_value.read_secret.return_value = response
+
+        ### Run ###
+
+        value = self.connector.get_value(section_name='database', attr_name='server_name')
+        exists = self.connector.is_attr_exist(section_name='database', attr_name='SERVER NAME')
+        section = self.connector.get_section(section_name='database', attr_names=['server_name', 'Port'])
+
+        ### Assertions ###
+
+        self.assertEqual(value, 'db')
+        self.assertTrue(exists)
+        self.assertEqual(section, {'server_name': 'db', 'port': '5432'})
+
+
+    def test_section_path_is_remembered(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = {'data': {'data': {'PORT': '5432'}}}
+
+        ### Run ###
+
+        self.connector.get_value(section_name='database', attr_name='port')
+        self.connector.get_value(section_name='database', attr_name='port')
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector._paths, {'database': 'DATABASE'})
+        mock__vault_api.return_value.read_secret.assert_called_with(path='DATABASE', mount_point=self.mount_point)
+
+
 class TestAddSection(TestVaultConnector):
     def test_method(self):
         ### Run and Assertions ###
@@ -263,3 +334,362 @@ class TestAddAttr(TestVaultConnector):
         )
 
         self.connector.is_section_exist.assert_called_once_with(section_name)
+
+
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestSecretCache(TestVaultConnector):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.mount_point = 'TEST/'
+        with patch('configorm.connectors.hvac'):
+            self.connector = VaultConnector(
+                mount_point=self.mount_point,
+                url='http://some/url',
+                token='some_token',
+                cache_ttl=60
+            )
+        self.response = {
+            'data': {
+                'data': {
+                    'FIRST': 'first_value',
+                    'SECOND': 'second_value'
+                }
+            }
+        }
+
+    def test_section_is_read_once(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response
+
+        ### Run ###
+
+        first = self.connector.get_value(section_name='section', attr_name='first')
+        second = self.connector.get_value(section_name='section', attr_name='second')
+        exists = self.connector.is_attr_exist(section_name='section', attr_name='first')
+
+        ### Assertions ###
+
+        self.assertEqual(first, 'first_value')
+        self.assertEqual(second, 'second_value')
+        self.assertTrue(exists)
+        mock__vault_api.return_value.read_secret.assert_called_once_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+
+    def test_invalidate(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response
+        self.connector.get_value(section_name='section', attr_name='first')
+
+        ### Run ###
+
+        self.connector.invalidate(section_name='section')
+        self.connector.get_value(section_name='section', attr_name='first')
+
+        ### Assertions ###
+
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 2)
+
+    def test_clear(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response
+        self.connector.get_value(section_name='section', attr_name='first')
+        self.connector.get_value(section_name='other', attr_name='first')
+
+        ### Run ###
+
+        self.connector.clear()
+        self.connector.get_value(section_name='section', attr_name='first')
+        self.connector.get_value(section_name='other', attr_name='first')
+
+        ### Assertions ###
+
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 4)
+
+    def test_refresh(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response
+        self.connector.get_value(section_name='section', attr_name='first')
+        self.connector.get_value(section_name='deleted', attr_name='first')
+
+        def read_secret(path, **kwargs):
+            if path != 'SECTION':
+                raise InvalidPath
+            return {'data': {'data': {'FIRST': 'new_value'}}}
+
+        mock__vault_api.return_value.read_secret.side_effect = read_secret
+
+        ### Run ###
+
+        self.connector.refresh()
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector._cache.keys(), ['SECTION'])
+        self.assertEqual(self.connector.get_value(section_name='section', attr_name='first'), 'new_value')
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 4)
+
+    def test_add_attr_invalidates_section(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response
+        self.connector.get_value(section_name='section', attr_name='first')
+
+        ### Run ###
+
+        self.connector.add_attr(section_name='section', attr_name='third', value='third_value')
+        self.connector.get_value(section_name='section', attr_name='first')
+
+        ### Assertions ###
+
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 2)
+
+    def test_missing_section_is_not_cached(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.side_effect = InvalidPath
+
+        ### Run ###
+
+        self.connector.is_section_exist(section_name='section')
+        self.connector.is_section_exist(section_name='section')
+
+        ### Assertions ###
+
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 2)
+
+
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestConcurrentReads(TestVaultConnector):
+
+    def read_concurrently(self, mock__vault_api, side_effect, count=10):
+        entered = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def read_secret(**kwargs):
+            entered.set()
+            release.wait(timeout=5)
+            return side_effect()
+
+        def worker():
+            try:
+                results.append(self.connector.get_value(section_name='section', attr_name='attr'))
+            except InvalidPath as error:
+                results.append(error)
+
+        mock__vault_api.return_value.read_secret.side_effect = read_secret
+        threads = [threading.Thread(target=worker) for _ in range(count)]
+        threads[0].start()
+        entered.wait(timeout=5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+        return results
+
+    def test_result_is_shared(self, mock__vault_api):
+        ### Run ###
+
+        results = self.read_concurrently(mock__vault_api, lambda: {'data': {'data': {'ATTR': 'value'}}})
+
+        ### Assertions ###
+
+        self.assertEqual(results, ['value'] * 10)
+        mock__vault_api.return_value.read_secret.assert_called_once_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+
+    def test_error_is_shared(self, mock__vault_api):
+        ### Setup ###
+
+        def side_effect():
+            raise InvalidPath
+
+        ### Run ###
+
+        results = self.read_concurrently(mock__vault_api, side_effect)
+
+        ### Assertions ###
+
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(isinstance(result, InvalidPath) for result in results))
+        mock__vault_api.return_value.read_secret.assert_called_once_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+
+
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestBackgroundRefresh(TestVaultConnector):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.mount_point = 'TEST/'
+        self.on_refresh_error = Mock()
+        with patch('configorm.connectors.hvac'):
+            self.connector = VaultConnector(
+                mount_point=self.mount_point,
+                url='http://some/url',
+                token='some_token',
+                cache_ttl=60,
+                refresh_in_background=True,
+                refresh_jitter=0,
+                max_staleness=30,
+                on_refresh_error=self.on_refresh_error
+            )
+        self.timer = Mock(return_value=100.0)
+        self.connector._cache.timer = self.timer
+
+    @staticmethod
+    def response(value):
+        return {'data': {'data': {'ATTR': value}}}
+
+    def test_stale_value_is_served_while_refreshing(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('old')
+        self.connector.get_value(section_name='section', attr_name='attr')
+        mock__vault_api.return_value.read_secret.return_value = self.response('new')
+        self.timer.return_value = 170.0
+
+        ### Run ###
+
+        stale = self.connector.get_value(section_name='section', attr_name='attr')
+        self.connector._refresher.join()
+        fresh = self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        self.assertEqual(stale, 'old')
+        self.assertEqual(fresh, 'new')
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 2)
+
+    def test_value_older_than_max_staleness_is_read_synchronously(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('old')
+        self.connector.get_value(section_name='section', attr_name='attr')
+        mock__vault_api.return_value.read_secret.return_value = self.response('new')
+        self.timer.return_value = 190.0
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'new')
+
+    def test_refresh_error_is_reported(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('old')
+        self.connector.get_value(section_name='section', attr_name='attr')
+        error = InvalidPath()
+        mock__vault_api.return_value.read_secret.side_effect = error
+        self.timer.return_value = 170.0
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='section', attr_name='attr')
+        self.connector._refresher.join()
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'old')
+        self.on_refresh_error.assert_called_once_with('SECTION', error)
+
+    def test_requires_cache(self, mock__vault_api):
+        ### Run and Assertions ###
+
+        with self.assertRaises(ValueError), patch('configorm.connectors.hvac'):
+            VaultConnector(mount_point=self.mount_point, url='url', token='token', refresh_in_background=True)
+
+
+@patch('configorm.connectors.VaultConnector._vault_api', new_callable=PropertyMock)
+class TestVersionCheck(TestVaultConnector):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.mount_point = 'TEST/'
+        with patch('configorm.connectors.hvac'):
+            self.connector = VaultConnector(
+                mount_point=self.mount_point,
+                url='http://some/url',
+                token='some_token',
+                cache_ttl=60,
+                check_version=True
+            )
+        self.timer = Mock(return_value=100.0)
+        self.connector._cache.timer = self.timer
+
+    @staticmethod
+    def response(value, version):
+        return {'data': {'data': {'ATTR': value}, 'metadata': {'version': version}}}
+
+    def test_unchanged_version_is_not_downloaded(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('value', 1)
+        mock__vault_api.return_value.read_secret_metadata.return_value = {'data': {'current_version': 1}}
+        self.connector.get_value(section_name='section', attr_name='attr')
+        self.timer.return_value = 170.0
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'value')
+        mock__vault_api.return_value.read_secret.assert_called_once_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+        mock__vault_api.return_value.read_secret_metadata.assert_called_once_with(
+            path='SECTION',
+            mount_point=self.mount_point
+        )
+        self.assertEqual(self.connector._cache.peek('SECTION').expires_at, 230.0)
+
+    def test_changed_version_is_downloaded(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('old', 1)
+        mock__vault_api.return_value.read_secret_metadata.return_value = {'data': {'current_version': 2}}
+        self.connector.get_value(section_name='section', attr_name='attr')
+        mock__vault_api.return_value.read_secret.return_value = self.response('new', 2)
+        self.timer.return_value = 170.0
+
+        ### Run ###
+
+        result = self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'new')
+        self.assertEqual(mock__vault_api.return_value.read_secret.call_count, 2)
+        self.assertEqual(self.connector._cache.peek('SECTION').version, 2)
+
+    def test_first_read_skips_metadata(self, mock__vault_api):
+        ### Setup ###
+
+        mock__vault_api.return_value.read_secret.return_value = self.response('value', 1)
+
+        ### Run ###
+
+        self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        mock__vault_api.return_value.read_secret_metadata.assert_not_called()
@@ -0,0 +1,265 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from configorm import IniConnector
+from configorm.watch import InotifyWatcher, PollingWatcher, _load_libc, watch_file
+
+inotify_available = _load_libc() is not None
+
+
+class TestWatcher(unittest.TestCase):
+    """
+    Base class for file watcher tests
+    """
+
+    def setUp(self) -> None:
+        """Set up test."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'config.ini')
+        with open(self.path, 'w') as file:
+            file.write('[Section]\nattr = first\n')
+        self.changed = threading.Event()
+        self.watcher = None
+
+    def tearDown(self) -> None:
+        """Clean up test."""
+        if self.watcher is not None:
+            self.watcher.stop()
+        shutil.rmtree(self.temp_dir)
+
+    def replace(self, content):
+        replacement = os.path.join(self.temp_dir, 'replacement.ini')
+        with open(replacement, 'w') as file:
+            file.write(content)
+        os.replace(replacement, self.path)
+
+
+@unittest.skipUnless(inotify_available, 'inotify is not available')
+class TestInotifyWatcher(TestWatcher):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.watcher = InotifyWatcher(self.path, self.changed.set)
+        self.watcher.start()
+
+    def test_write(self):
+        ### Run ###
+
+        with open(self.path, 'a') as file:
+            file.write('other = second\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_atomic_replace(self):
+        ### Run ###
+
+        self.replace('[Section]\nattr = second\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_other_files_are_ignored(self):
+        ### Run ###
+
+        with open(os.path.join(self.temp_dir, 'other.ini'), 'w') as file:
+            file.write('[Other]\n')
+
+        ### Assertions ###
+
+        self.assertFalse(self.changed.wait(0.2))
+
+    def test_removed_directory_is_watched_again(self):
+        ### Setup ###
+
+        shutil.rmtree(self.temp_dir)
+        self.assertTrue(self.changed.wait(5))
+        self.changed.clear()
+        os.mkdir(self.temp_dir)
+        self.replace('[Section]\nattr = second\n')
+        self.assertTrue(self.changed.wait(5))
+        self.changed.clear()
+
+        ### Run ###
+
+        with open(self.path, 'a') as file:
+            file.write('other = third\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_missing_directory(self):
+        ### Run and Assertions ###
+
+        with self.assertRaises(OSError):
+            InotifyWatcher(os.path.join(self.temp_dir, 'missing', 'config.ini'), Mock())
+
+
+@unittest.skipUnless(inotify_available, 'inotify is not available')
+class TestInotifyWatcherSymlink(TestWatcher):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.link = os.path.join(self.temp_dir, 'link.ini')
+        self.switch('v1', '[Section]\nattr = first\n')
+        self.watcher = InotifyWatcher(self.link, self.changed.set)
+        self.watcher.start()
+
+    def switch(self, version, content):
+        os.mkdir(os.path.join(self.temp_dir, version))
+        with open(os.path.join(self.temp_dir, version, 'config.ini'), 'w') as file:
+            file.write(content)
+        temp_link = os.path.join(self.temp_dir, 'link.tmp')
+        os.symlink(os.path.join(version, 'config.ini'), temp_link)
+        os.replace(temp_link, self.link)
+
+    def test_symlink_switch(self):
+        ### Run ###
+
+        self.switch('v2', '[Section]\nattr = second\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_write_into_new_target(self):
+        ### Setup ###
+
+        self.switch('v2', '[Section]\nattr = second\n')
+        self.assertTrue(self.changed.wait(5))
+        self.changed.clear()
+
+        ### Run ###
+
+        with open(os.path.join(self.temp_dir, 'v2', 'config.ini'), 'a') as file:
+            file.write('other = third\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_symlinked_connector(self):
+        ### Setup ###
+
+        connector = IniConnector(connection_string=self.link, watch=True, poll_interval=0.01)
+        self.addCleanup(connector.close)
+        self.assertEqual(connector.get_value(section_name='section', attr_name='attr'), 'first')
+
+        ### Run ###
+
+        self.switch('v2', '[Section]\nattr = second\n')
+        self.assertTrue(self.changed.wait(5))
+        deadline = time.monotonic() + 5
+        while connector.get_value(section_name='section', attr_name='attr') != 'second' and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        ### Assertions ###
+
+        self.assertEqual(connector.get_value(section_name='section', attr_name='attr'), 'second')
+
+
+class TestPollingWatcher(TestWatcher):
+
+    def test_atomic_replace(self):
+        ### Setup ###
+
+        self.watcher = PollingWatcher(self.path, self.changed.set, interval=0.01)
+        self.watcher.start()
+
+        ### Run ###
+
+        self.replace('[Section]\nattr = second\n')
+
+        ### Assertions ###
+
+        self.assertTrue(self.changed.wait(5))
+
+    def test_fallback(self):
+        ### Run ###
+
+        with patch('configorm.watch._load_libc', return_value=None):
+            self.watcher = watch_file(self.path, self.changed.set, poll_interval=0.01)
+
+        ### Assertions ###
+
+        self.assertIsInstance(self.watcher, PollingWatcher)
+
+
+class TestWatchedIniConnector(TestWatcher):
+
+    def setUp(self) -> None:
+        """Set up test."""
+        super().setUp()
+        self.connector = IniConnector(connection_string=self.path, watch=True, poll_interval=0.01)
+        self.watcher = self.connector._watcher
+        self.connector._watcher.callback = Mock(side_effect=self.on_change)
+
+    def on_change(self):
+        self.connector._on_file_change()
+        self.changed.set()
+
+    def test_steady_reads_do_not_stat(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Run ###
+
+        with patch('configorm.connectors.os.stat') as stat:
+            for _ in range(10):
+                result = self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Assertions ###
+
+        self.assertEqual(result, 'first')
+        stat.assert_not_called()
+
+    def test_external_change(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Run ###
+
+        self.replace('[Section]\nattr = second\n')
+        self.assertTrue(self.changed.wait(5))
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='section', attr_name='attr'), 'second')
+        self.assertEqual(self.connector.cache_misses, 2)
+
+    def test_own_write_is_not_parsed_again(self):
+        ### Setup ###
+
+        self.connector.get_value(section_name='section', attr_name='attr')
+
+        ### Run ###
+
+        self.connector.set_value(section_name='section', attr_name='attr', value='second')
+        self.assertTrue(self.changed.wait(5))
+
+        ### Assertions ###
+
+        self.assertEqual(self.connector.get_value(section_name='section', attr_name='attr'), 'second')
+        self.assertEqual(self.connector.cache_misses, 1)
+
+    def test_close(self):
+        ### Run ###
+
+        self.connector.close()
+        self.watcher = None
+
+        ### Assertions ###
+
+        self.assertIsNone(self.connector._watcher)